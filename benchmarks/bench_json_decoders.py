@@ -0,0 +1,68 @@
+"""
+    Compares the JSON decoders (see `invidious_api_client.json_decoders`) on video and comment payloads.
+
+    `response.json()` (what `InvidiousClient` used before the decoder hook) is measured as `requests`,
+    it decodes the bytes to `str` first and then uses the standard library.
+
+    ```bash
+    python benchmarks/bench_json_decoders.py
+    ```
+"""
+
+import typing as t
+
+import json
+import sys
+import timeit
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from requests import Response
+
+from invidious_api_client.json_decoders import DECODERS
+from benchmarks.payloads import video_payload, comments_payload
+
+
+
+def _requests_json(content: bytes) -> t.Any:
+    response = Response()
+    response._content = content
+    response.encoding = None
+
+    return response.json()
+
+
+
+def bench_decoders(number: int=200) -> t.Dict[str, t.Dict[str, float]]:
+    """
+        Returns the mean decode time (in microseconds) by payload and decoder.
+    """
+
+    payloads = {
+        'video': json.dumps(video_payload()).encode(),
+        'comments': json.dumps(comments_payload(continuation='x' * 200)).encode(),
+    }
+
+    decoders: t.Dict[str, t.Callable[[bytes], t.Any]] = {'requests': _requests_json, **DECODERS}
+    results: t.Dict[str, t.Dict[str, float]] = {}
+
+    for payload_name, content in payloads.items():
+        results[f"{payload_name} ({len(content) // 1024} KiB)"] = {name: min(timeit.repeat(lambda: decoder(content), number=number, repeat=5)) / number * 1e6 for name, decoder in decoders.items()}
+
+    return results
+
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Compare JSON decoders on API payloads.")
+    parser.add_argument('--number', type=int, default=200)
+
+    for payload, timings in bench_decoders(parser.parse_args().number).items():
+        baseline = timings['requests']
+        print(payload)
+
+        for name, microseconds in sorted(timings.items(), key=lambda item: item[1]):
+            print(f"    {name:<10} {microseconds:10.1f} µs  ({baseline / microseconds:.1f}x)")
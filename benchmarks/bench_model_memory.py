@@ -0,0 +1,72 @@
+"""
+    Measures how much memory the models take, with and without `compact`.
+
+    ```bash
+    python benchmarks/bench_model_memory.py --pages 500
+    ```
+"""
+
+import typing as t
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from invidious_api_client.models.comments import Comments
+from invidious_api_client.models.videos import YoutubeVideo
+from invidious_api_client.models.compact import compact
+from benchmarks.payloads import video_payload, comments_payload
+
+
+
+def _measure(build: t.Callable[[], t.Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    kept = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del kept
+
+    return size
+
+
+
+def bench_memory(pages: int=200, videos: int=200) -> t.Dict[str, t.Dict[str, int]]:
+    """
+        Returns the memory (in bytes) held by `pages` pages of comments (their `Comment` objects) and by `videos` videos,
+        as regular models and as compact models.
+    """
+
+    raw_pages = [json.dumps(comments_payload(page=page)) for page in range(pages)]
+    raw_videos = [json.dumps(video_payload(f"video{index:06}", recommended=5)) for index in range(videos)]
+
+    return {
+        'comments': {
+            'models': _measure(lambda: [comment for page in raw_pages for comment in Comments(json.loads(page)).comments]),
+            'compact': _measure(lambda: [comment for page in raw_pages for comment in compact(Comments(json.loads(page))).comments]),
+        },
+        'videos': {
+            'models': _measure(lambda: [YoutubeVideo(json.loads(video)) for video in raw_videos]),
+            'compact': _measure(lambda: [compact(YoutubeVideo(json.loads(video))) for video in raw_videos]),
+        },
+    }
+
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Compare memory usage of regular and compact models.")
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--videos', type=int, default=200)
+    arguments = parser.parse_args()
+
+    for name, sizes in bench_memory(arguments.pages, arguments.videos).items():
+        print(f"{name:<10} models: {sizes['models'] / 2 ** 20:8.2f} MiB  compact: {sizes['compact'] / 2 ** 20:8.2f} MiB  ({1 - sizes['compact'] / sizes['models']:.0%} less)")
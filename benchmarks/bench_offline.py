@@ -0,0 +1,237 @@
+"""
+    Measures the client against a local stand-in server (see `benchmarks.server`), without network access.
+
+    Scenarios:
+
+    - `get_video` - `get_video` of distinct IDs from `--threads` threads (throughput and latency percentiles).
+    - `comments` - full comment pagination (`yield_all_comments`) of several videos.
+    - `dislikes` - `get_dislike_count` (Return YouTube Dislike API).
+    - `search` - `search` of 5 pages (fetched concurrently).
+    - `instance_selection` - downloading `instances.json` and probing the instances (`probe_instances`).
+    - `parse` - constructing models from decoded payloads and reading their properties (no HTTP).
+
+    Every run is appended to a history file (JSON lines, `benchmarks/history.jsonl` by default),
+    and compared with the previous run of the same configuration:
+
+    ```bash
+    python benchmarks/bench_offline.py --latency 0.005 --threads 16
+    ```
+"""
+
+import typing as t
+
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from requests import HTTPError
+
+from invidious_api_client import InvidiousClient, get_instances, probe_instances
+from invidious_api_client.batch import iter_as_completed
+from invidious_api_client.models.videos import YoutubeVideo
+from invidious_api_client.models.comments import Comments
+from benchmarks.server import StandInServer
+from benchmarks.payloads import video_payload, comments_payload
+
+
+
+HISTORY_PATH = Path(__file__).parent / 'history.jsonl'
+"""Default path of the results history."""
+
+
+
+def _summary(latencies: t.List[float], elapsed: float, operations: int) -> t.Dict[str, float]:
+    latencies = sorted(latencies)
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000 if latencies else 0.0
+
+    return {'ops_per_second': operations / elapsed if elapsed else 0.0, 'p50_ms': percentile(0.5), 'p95_ms': percentile(0.95), 'p99_ms': percentile(0.99)}
+
+
+
+def _timed(fn: t.Callable[[], t.Any], latencies: t.List[float]) -> t.Any:
+    start = time.perf_counter()
+
+    try:
+        return fn()
+
+    finally:
+        latencies.append(time.perf_counter() - start)
+
+
+
+def bench_get_video(client: InvidiousClient, requests: int, threads: int) -> t.Dict[str, float]:
+    latencies: t.List[float] = []
+    start = time.perf_counter()
+    errors = sum(error is not None for _, _, error in iter_as_completed(lambda id: _timed(lambda: client.get_video(id), latencies), [f"video{index:06}" for index in range(requests)], threads))
+
+    return {**_summary(latencies, time.perf_counter() - start, requests), 'errors': errors}
+
+
+def bench_comments(client: InvidiousClient, videos: int) -> t.Dict[str, float]:
+    latencies: t.List[float] = []
+    pages = comments = errors = 0
+    start = time.perf_counter()
+
+    for index in range(videos):
+        iterator = iter(client.yield_all_comments(f"video{index:06}"))
+
+        while True:
+            try:
+                page = _timed(lambda: next(iterator, None), latencies)
+
+            # An injected error ends the pagination of the video:
+            except HTTPError:
+                errors += 1
+                break
+
+            if page is None:
+                latencies.pop()
+                break
+
+            pages += 1
+            comments += len(page.comments)
+
+    elapsed = time.perf_counter() - start
+    return {**_summary(latencies, elapsed, pages), 'comments_per_second': comments / elapsed, 'errors': errors}
+
+
+def bench_dislikes(client: InvidiousClient, requests: int, threads: int) -> t.Dict[str, float]:
+    latencies: t.List[float] = []
+    start = time.perf_counter()
+
+    for _ in iter_as_completed(lambda id: _timed(lambda: client.get_dislike_count(id), latencies), [f"video{index:06}" for index in range(requests)], threads):
+        pass
+
+    return _summary(latencies, time.perf_counter() - start, requests)
+
+
+def bench_search(client: InvidiousClient, runs: int, threads: int) -> t.Dict[str, float]:
+    latencies: t.List[float] = []
+    start = time.perf_counter()
+
+    for index in range(runs):
+        _timed(lambda: client.search(f"query {index}", pages=5, max_in_flight=threads), latencies)
+
+    return _summary(latencies, time.perf_counter() - start, runs)
+
+
+def bench_instance_selection(server: StandInServer, runs: int) -> t.Dict[str, float]:
+    latencies: t.List[float] = []
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        _timed(lambda: probe_instances(get_instances(cache=None, url=server.instances_url).instances, best_n=3), latencies)
+
+    return _summary(latencies, time.perf_counter() - start, runs)
+
+
+def bench_parse(runs: int) -> t.Dict[str, float]:
+    video, comments = video_payload(), comments_payload(continuation='x' * 200)
+    latencies: t.List[float] = []
+
+    def parse() -> None:
+        parsed = YoutubeVideo(video)
+        parsed.title, parsed.video_id, parsed.published, parsed.video_thumbnails, parsed.storyboards
+
+        for comment in Comments(comments).comments:
+            comment.author, comment.content, comment.like_count
+
+    start = time.perf_counter()
+
+    for _ in range(runs):
+        _timed(parse, latencies)
+
+    return _summary(latencies, time.perf_counter() - start, runs)
+
+
+
+def run_benchmarks(requests: int=200, threads: int=8, latency: float=0.0, error_rate: float=0.0, comment_videos: int=5, comment_pages: int=5, parse_runs: int=200) -> t.Dict[str, t.Dict[str, float]]:
+    """
+        Runs all scenarios against a fresh stand-in server, and returns their results by scenario name.
+    """
+
+    with StandInServer(latency=latency, error_rate=error_rate, comment_pages=comment_pages) as server:
+        with InvidiousClient(instance=server.url, ryd_url=server.url, rate_limiter=None, coalesce_requests=False, pool_maxsize=max(threads, 10)) as client:
+            return {
+                'get_video': bench_get_video(client, requests, threads),
+                'comments': bench_comments(client, comment_videos),
+                'dislikes': bench_dislikes(client, requests, threads),
+                'search': bench_search(client, 5, threads),
+                'instance_selection': bench_instance_selection(server, 3),
+                'parse': bench_parse(parse_runs),
+            }
+
+
+
+def _commit() -> t.Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, cwd=Path(__file__).parent, check=True).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def record(results: t.Dict[str, t.Dict[str, float]], config: t.Dict[str, t.Any], path: Path=HISTORY_PATH) -> t.Optional[t.Dict[str, t.Any]]:
+    """
+        Appends the results to the history file. Returns the previous record with the same `config` (or `None`).
+    """
+
+    previous = None
+
+    if path.exists():
+        for line in path.read_text(encoding='UTF-8').splitlines():
+            entry = json.loads(line)
+
+            if entry.get('config') == config:
+                previous = entry
+
+    entry = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': _commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': config,
+        'results': results,
+    }
+
+    with open(path, 'a', encoding='UTF-8') as file:
+        file.write(json.dumps(entry) + '\n')
+
+    return previous
+
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Benchmark the client against a local stand-in server.")
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.0, help="simulated server latency in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument('--comment-videos', type=int, default=5)
+    parser.add_argument('--comment-pages', type=int, default=5)
+    parser.add_argument('--history', type=Path, default=HISTORY_PATH)
+    parser.add_argument('--no-record', action='store_true', help="don't append the results to the history file")
+    arguments = parser.parse_args()
+
+    config = {'requests': arguments.requests, 'threads': arguments.threads, 'latency': arguments.latency, 'error_rate': arguments.error_rate, 'comment_videos': arguments.comment_videos, 'comment_pages': arguments.comment_pages}
+    results = run_benchmarks(**config)
+    previous = None if arguments.no_record else record(results, config, arguments.history)
+
+    for scenario, metrics in results.items():
+        change = ''
+
+        if previous is not None and scenario in previous['results']:
+            before = previous['results'][scenario]['ops_per_second']
+            change = f"  ({(metrics['ops_per_second'] - before) / before * 100:+.1f} % vs {previous['commit'] or previous['timestamp']})" if before else ''
+
+        print(f"{scenario:<20} {metrics['ops_per_second']:10.1f} ops/s  p50 {metrics['p50_ms']:8.2f} ms  p95 {metrics['p95_ms']:8.2f} ms{change}")
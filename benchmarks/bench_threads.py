@@ -0,0 +1,53 @@
+"""
+    Measures the throughput of one `InvidiousClient` shared by a growing number of threads.
+
+    A local stand-in server (see `benchmarks.server`) answers every `/api/v1/videos/{id}` after `--latency` seconds,
+    so the numbers show how well the client's connection pool scales, not the speed of a real instance.
+
+    ```bash
+    python benchmarks/bench_threads.py --threads 1 2 4 8 16 32 64
+    ```
+"""
+
+import typing as t
+
+import sys
+import time
+
+from argparse import ArgumentParser
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from invidious_api_client import InvidiousClient
+from benchmarks.server import StandInServer
+
+
+
+def bench_threads(thread_counts: t.Iterable[int], requests_per_thread: int=50, latency: float=0.01) -> t.Dict[int, float]:
+    """
+        Returns the throughput (requests per second) by the number of threads.
+    """
+
+    results: t.Dict[int, float] = {}
+
+    with StandInServer(latency=latency) as server:
+        for threads in thread_counts:
+            with InvidiousClient(instance=server.url, rate_limiter=None, coalesce_requests=False, pool_maxsize=max(threads, 10)) as client:
+                start = time.perf_counter()
+                client.get_videos((f"video{index:06}" for index in range(threads * requests_per_thread)), max_in_flight=threads)
+                results[threads] = threads * requests_per_thread / (time.perf_counter() - start)
+
+    return results
+
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Measure client throughput by the number of threads.")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument('--requests', type=int, default=50, help="requests per thread")
+    parser.add_argument('--latency', type=float, default=0.01, help="simulated server latency in seconds")
+    arguments = parser.parse_args()
+
+    for threads, throughput in bench_threads(arguments.threads, arguments.requests, arguments.latency).items():
+        print(f"{threads:>4} threads  {throughput:10.1f} req/s")
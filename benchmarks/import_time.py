@@ -0,0 +1,83 @@
+"""
+    Measures how long importing `invidious_api_client` takes, and counts the network calls it makes.
+
+    Every import is done in a fresh interpreter, with `socket` patched to record (and refuse) connections.
+
+    ```bash
+    python benchmarks/import_time.py --runs 10
+    ```
+"""
+
+import typing as t
+
+import json
+import subprocess
+import sys
+
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+
+
+
+ROOT = Path(__file__).parent.parent.absolute()
+
+_PROBE = r'''
+import json, socket, sys, time
+
+sys.path.insert(0, sys.argv[1])
+calls = []
+
+def _refuse(name):
+    def _inner(*args, **kwargs):
+        calls.append(name)
+        raise OSError(f"network access during import ({name})")
+    return _inner
+
+socket.getaddrinfo = _refuse('getaddrinfo')
+socket.create_connection = _refuse('create_connection')
+socket.socket.connect = _refuse('connect')
+
+start = time.perf_counter()
+import invidious_api_client
+elapsed = time.perf_counter() - start
+
+print(json.dumps({'seconds': elapsed, 'network_calls': calls}))
+'''
+
+
+
+def measure_import(runs: int=5) -> t.Dict[str, t.Any]:
+    """
+        Imports the package `runs` times (each in a new interpreter).
+
+        Returns the median/min/max import time in seconds and the total number of network calls.
+    """
+
+    samples: t.List[float] = []
+    network_calls: t.List[str] = []
+
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', _PROBE, str(ROOT)], capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+
+        samples.append(result['seconds'])
+        network_calls.extend(result['network_calls'])
+
+    return {
+        'runs': runs,
+        'median_seconds': median(samples),
+        'min_seconds': min(samples),
+        'max_seconds': max(samples),
+        'network_calls': len(network_calls),
+    }
+
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Benchmark the import time of invidious_api_client.")
+    parser.add_argument('--runs', type=int, default=5)
+    result = measure_import(parser.parse_args().runs)
+
+    print(json.dumps(result, indent=4))
+    sys.exit(1 if result['network_calls'] else 0)
@@ -0,0 +1,190 @@
+"""
+    Deterministic payloads shaped like real `/api/v1/videos/{id}`, `/api/v1/comments/{id}`, `instances.json` and RYD responses.
+
+    They mirror the field names and sizes of recorded responses (a video payload with its `adaptiveFormats`,
+    `formatStreams`, `storyboards` and `recommendedVideos` is ~50-100 KB), without shipping any real user data.
+"""
+
+import typing as t
+
+import random
+import string
+
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return ' '.join(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(words))
+
+
+def _id(rng: random.Random, length: int=11) -> str:
+    return ''.join(rng.choices(string.ascii_letters + string.digits + '-_', k=length))
+
+
+def _thumbnails(rng: random.Random, url: str) -> t.List[t.Dict[str, t.Any]]:
+    sizes = [('maxres', 1280, 720), ('maxresdefault', 1280, 720), ('sddefault', 640, 480), ('high', 480, 360), ('medium', 320, 180), ('default', 120, 90), ('start', 120, 90), ('middle', 120, 90), ('end', 120, 90)]
+    return [{'quality': quality, 'url': f"{url}/{quality}.jpg", 'width': width, 'height': height} for quality, width, height in sizes]
+
+
+
+def video_payload(video_id: str='dQw4w9WgXcQ', seed: int=0, recommended: int=20, formats: int=25) -> t.Dict[str, t.Any]:
+    """
+        A `/api/v1/videos/{id}` payload.
+    """
+
+    rng = random.Random(f"{seed}-{video_id}")
+
+    return {
+        'type': 'video',
+        'title': _text(rng, 8),
+        'videoId': video_id,
+        'videoThumbnails': _thumbnails(rng, f"https://i.ytimg.com/vi/{video_id}"),
+        'storyboards': [{'url': f"/api/v1/storyboards/{video_id}?width={width}&height={height}", 'templateUrl': f"https://i.ytimg.com/sb/{video_id}/storyboard3_L{index}/M$M.jpg?sqp={_id(rng, 60)}", 'width': width, 'height': height, 'count': 100, 'interval': 2000, 'storyboardWidth': 10, 'storyboardHeight': 10, 'storyboardCount': 3} for index, (width, height) in enumerate([(48, 27), (80, 45), (160, 90)])],
+        'description': _text(rng, 120),
+        'descriptionHtml': _text(rng, 140),
+        'published': 1256453430,
+        'publishedText': '13 years ago',
+        'keywords': [_text(rng, 2) for _ in range(15)],
+        'viewCount': rng.randint(0, 10 ** 9),
+        'likeCount': rng.randint(0, 10 ** 7),
+        'dislikeCount': 0,
+        'paid': False,
+        'premium': False,
+        'isFamilyFriendly': True,
+        'allowedRegions': [''.join(rng.choices(string.ascii_uppercase, k=2)) for _ in range(240)],
+        'genre': 'Music',
+        'author': _text(rng, 2),
+        'authorId': f"UC{_id(rng, 22)}",
+        'authorUrl': f"/channel/UC{_id(rng, 22)}",
+        'authorThumbnails': _thumbnails(rng, 'https://yt3.ggpht.com/a'),
+        'subCountText': '3.4M',
+        'lengthSeconds': 212,
+        'allowRatings': True,
+        'rating': 0,
+        'isListed': True,
+        'liveNow': False,
+        'isUpcoming': False,
+        'dashUrl': f"https://example.tld/api/manifest/dash/id/{video_id}",
+        'adaptiveFormats': [{'init': '0-722', 'index': '723-1284', 'bitrate': str(rng.randint(10 ** 5, 10 ** 7)), 'url': f"https://rr1---sn-{_id(rng, 8)}.googlevideo.com/videoplayback?expire=1&ei={_id(rng, 20)}&ip=0.0.0.0&id=o-{_id(rng, 44)}&itag={140 + index}&source=youtube&requiressl=yes&sig={_id(rng, 120)}", 'itag': str(140 + index), 'type': 'video/mp4; codecs="avc1.4d401f"', 'clen': str(rng.randint(10 ** 5, 10 ** 8)), 'lmt': '1706062813425183', 'projectionType': 'RECTANGULAR', 'fps': 25, 'container': 'mp4', 'encoding': 'h264', 'resolution': '720p', 'qualityLabel': '720p'} for index in range(formats)],
+        'formatStreams': [{'url': f"https://rr1---sn-{_id(rng, 8)}.googlevideo.com/videoplayback?sig={_id(rng, 120)}", 'itag': '18', 'type': 'video/mp4; codecs="avc1.42001E, mp4a.40.2"', 'quality': 'medium', 'fps': 25, 'container': 'mp4', 'encoding': 'h264', 'resolution': '360p', 'qualityLabel': '360p', 'size': '640x360'} for _ in range(2)],
+        'captions': [{'label': _text(rng, 1), 'language_code': 'en', 'url': f"/api/v1/captions/{video_id}?label=English"} for _ in range(10)],
+        'recommendedVideos': [{'videoId': _id(rng), 'title': _text(rng, 8), 'videoThumbnails': _thumbnails(rng, f"https://i.ytimg.com/vi/{_id(rng)}"), 'author': _text(rng, 2), 'authorUrl': f"/channel/UC{_id(rng, 22)}", 'authorId': f"UC{_id(rng, 22)}", 'lengthSeconds': rng.randint(60, 3600), 'viewCountText': '1.2M views', 'viewCount': rng.randint(0, 10 ** 8)} for _ in range(recommended)],
+    }
+
+
+
+def comment_payload(rng: random.Random, with_replies: bool=True) -> t.Dict[str, t.Any]:
+    """
+        A single comment (an item of the `comments` list).
+    """
+
+    reply_count = rng.randint(0, 40) if with_replies and rng.random() < 0.3 else 0
+    comment = {
+        'author': _text(rng, 2),
+        'authorThumbnails': [{'url': f"https://yt3.ggpht.com/{_id(rng, 40)}=s{size}-c-k-c0x00ffffff-no-rj", 'width': size, 'height': size} for size in (32, 48, 76, 100, 176, 512)],
+        'authorId': f"UC{_id(rng, 22)}",
+        'authorUrl': f"/channel/UC{_id(rng, 22)}",
+        'isEdited': rng.random() < 0.1,
+        'content': _text(rng, rng.randint(3, 60)),
+        'contentHtml': _text(rng, rng.randint(3, 60)),
+        'published': 1600000000 + rng.randint(0, 10 ** 8),
+        'publishedText': '2 years ago',
+        'likeCount': rng.randint(0, 10 ** 5),
+        'commentId': f"Ugz{_id(rng, 23)}",
+        'authorIsChannelOwner': False,
+    }
+
+    if reply_count:
+        comment['replies'] = {'replyCount': reply_count, 'replyContinuation': _id(rng, 120)}
+
+    return comment
+
+
+
+def comments_payload(video_id: str='dQw4w9WgXcQ', page: int=0, per_page: int=20, continuation: t.Optional[str]=None, seed: int=0) -> t.Dict[str, t.Any]:
+    """
+        A `/api/v1/comments/{id}` page.
+    """
+
+    rng = random.Random(f"{seed}-{video_id}-{page}")
+    payload = {
+        'commentCount': 1000,
+        'videoId': video_id,
+        'comments': [comment_payload(rng) for _ in range(per_page)],
+    }
+
+    if continuation is not None:
+        payload['continuation'] = continuation
+
+    return payload
+
+
+
+def ryd_payload(video_id: str='dQw4w9WgXcQ', seed: int=0) -> t.Dict[str, t.Any]:
+    """
+        A `https://returnyoutubedislikeapi.com/Votes` response.
+    """
+
+    rng = random.Random(f"{seed}-{video_id}")
+    likes, dislikes = rng.randint(0, 10 ** 7), rng.randint(0, 10 ** 6)
+
+    return {'id': video_id, 'dateCreated': '2022-09-25T21:04:01.137476Z', 'likes': likes, 'dislikes': dislikes, 'rating': 4.5, 'viewCount': likes * 50, 'deleted': False}
+
+
+
+def search_result_payload(rng: random.Random) -> t.Dict[str, t.Any]:
+    """
+        A single item of `/api/v1/search` results (mostly videos, some channels and playlists).
+    """
+
+    kind = rng.choices(['video', 'channel', 'playlist'], weights=[8, 1, 1])[0]
+    author, author_id = _text(rng, 2), f"UC{_id(rng, 22)}"
+
+    if kind == 'channel':
+        return {'type': 'channel', 'author': author, 'authorId': author_id, 'authorUrl': f"/channel/{author_id}", 'authorThumbnails': _thumbnails(rng, f"https://yt3.ggpht.com/{_id(rng, 40)}")[:3], 'autoGenerated': False, 'subCount': rng.randint(0, 10 ** 7), 'videoCount': rng.randint(0, 5000), 'description': _text(rng, 20), 'descriptionHtml': _text(rng, 20)}
+
+    if kind == 'playlist':
+        return {'type': 'playlist', 'title': _text(rng, 5), 'playlistId': f"PL{_id(rng, 32)}", 'playlistThumbnail': f"https://i.ytimg.com/vi/{_id(rng)}/hqdefault.jpg", 'author': author, 'authorId': author_id, 'authorUrl': f"/channel/{author_id}", 'authorVerified': False, 'videoCount': rng.randint(1, 200), 'videos': [{'title': _text(rng, 6), 'videoId': _id(rng), 'lengthSeconds': rng.randint(60, 3600), 'videoThumbnails': _thumbnails(rng, f"https://i.ytimg.com/vi/{_id(rng)}")[:3]} for _ in range(2)]}
+
+    video_id = _id(rng)
+    return {'type': 'video', 'title': _text(rng, 8), 'videoId': video_id, 'author': author, 'authorId': author_id, 'authorUrl': f"/channel/{author_id}", 'videoThumbnails': _thumbnails(rng, f"https://i.ytimg.com/vi/{video_id}"), 'description': _text(rng, 25), 'descriptionHtml': _text(rng, 25), 'viewCount': rng.randint(0, 10 ** 8), 'published': 1600000000 + rng.randint(0, 10 ** 8), 'publishedText': '1 year ago', 'lengthSeconds': rng.randint(60, 3600), 'liveNow': False, 'premium': False, 'isUpcoming': False}
+
+
+
+def search_payload(query: str, page: int=1, per_page: int=20, pages: int=5, overlap: int=2, seed: int=0) -> t.List[t.Dict[str, t.Any]]:
+    """
+        A `/api/v1/search` page. There are `pages` pages with results (the next ones are empty),
+        and the last `overlap` results of a page are repeated on the next one (as it happens with real search results).
+    """
+
+    if not 1 <= page <= pages:
+        return []
+
+    first = (page - 1) * (per_page - overlap)
+    return [search_result_payload(random.Random(f"{seed}-{query}-{index}")) for index in range(first, first + per_page)]
+
+
+
+def instances_payload(count: int=30, base_url: str='https://invidious{index}.example.tld', seed: int=0) -> t.List[t.Any]:
+    """
+        An `instances.json` payload. `base_url` is formatted with the instance `index`.
+    """
+
+    rng = random.Random(seed)
+    instances = []
+
+    for index in range(count):
+        uri = base_url.format(index=index)
+        host = uri.split('//', 1)[1]
+
+        instances.append([host, {
+            'flag': '🇩🇪',
+            'region': rng.choice(['DE', 'NL', 'US', 'FR', 'FI']),
+            'stats': {'version': '2.0', 'software': {'name': 'invidious', 'version': '2022.09.27', 'branch': 'master'}, 'openRegistrations': True, 'usage': {'users': {'total': 1000, 'activeHalfyear': 500, 'activeMonth': 200}}, 'metadata': {'updatedAt': 1664314556, 'lastChannelRefreshedAt': 1664314554}},
+            'cors': True,
+            'api': True,
+            'type': 'https',
+            'uri': uri,
+            'monitor': {'monitorId': str(rng.randint(10 ** 8, 10 ** 9)), 'createdAt': 1604333544, 'statusClass': 'success', 'name': host, 'url': None, 'type': 'HTTP(s)', 'dailyRatios': [{'ratio': '100.00', 'label': 'success'}] * 30, '90dRatio': {'ratio': '99.50', 'label': 'success'}, '30dRatio': {'ratio': '99.90', 'label': 'success'}},
+        }])
+
+    return instances
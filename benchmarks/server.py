@@ -0,0 +1,198 @@
+"""
+    A local HTTP stand-in for an Invidious instance, the instances registry and the Return YouTube Dislike API.
+
+    It serves deterministic payloads (see `benchmarks.payloads`) with configurable latency and error injection,
+    so benchmarks (and tests) can run without network access:
+
+    - `/api/v1/videos/{id}` (`GET` and `HEAD`)
+    - `/api/v1/comments/{id}` (`comment_pages` pages, linked by `continuation`)
+    - `/api/v1/search?q={query}&page={page}` (`search_pages` pages with results)
+    - `/instances.json`
+    - `/Votes?videoId={id}`
+
+    ```python
+    with StandInServer(latency=0.02) as server:
+        client = InvidiousClient(instance=server.url, ryd_url=server.url)
+        get_instances(cache=None, url=server.instances_url)
+    ```
+"""
+
+import typing as t
+
+import gzip
+import json
+import random
+import threading
+import time
+
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+from benchmarks.payloads import video_payload, comments_payload, search_payload, ryd_payload, instances_payload
+
+
+
+class StandInServer:
+    """
+        Serves API payloads from a daemon thread (see the module docstring).
+
+        ### Parameters:
+        - `latency` - how long (in seconds) is every response delayed.
+        - `jitter` - a random delay (in seconds, uniform from `0` to `jitter`) added to `latency`.
+        - `error_rate` - the fraction of requests that are answered with `error_status`.
+        - `error_status` - the status code of injected errors.
+        - `comment_pages` - how many comment pages does every video have.
+        - `per_page` - how many comments (or search results) are on a page.
+        - `search_pages` - how many search pages have results.
+        - `instances` - how many instances are listed in `instances.json` (they all point to this server).
+        - `seed` - the seed of payloads, jitter and injected errors.
+        - `compress` - if `True`, responses are gzip-compressed for clients that accept it.
+    """
+
+    def __init__(self, latency: float=0.0, jitter: float=0.0, error_rate: float=0.0, error_status: int=503, comment_pages: int=5, per_page: int=20, search_pages: int=5, instances: int=30, seed: int=0, compress: bool=False) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.comment_pages = comment_pages
+        self.per_page = per_page
+        self.search_pages = search_pages
+        self.instances = instances
+        self.seed = seed
+        self.compress = compress
+
+        self.requests = 0
+        """The number of requests served."""
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: t.Optional[ThreadingHTTPServer] = None
+        self._body = lru_cache(maxsize=4096)(self._render)
+        self._video = video_payload(seed=seed)
+
+
+    @property
+    def url(self) -> str:
+        """
+            The base URL of the server (use it as the instance and as `ryd_url`).
+        """
+
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+
+    @property
+    def instances_url(self) -> str:
+        """
+            The URL of the instances registry.
+        """
+
+        return f"{self.url}/instances.json"
+
+
+    def _render(self, path: str, query: t.Tuple[t.Tuple[str, str], ...]) -> t.Optional[bytes]:
+        parameters = dict(query)
+        continuation, video_id = parameters.get('continuation'), parameters.get('videoId')
+        segments = [segment for segment in path.split('/') if segment]
+
+        if segments[:3] == ['api', 'v1', 'videos'] and len(segments) == 4:
+            # Generating a payload takes longer than serving it, so every video is a copy of one payload (with its own ID):
+            return json.dumps({**self._video, 'videoId': segments[3]}).encode()
+
+        if segments[:3] == ['api', 'v1', 'comments'] and len(segments) == 4:
+            page = int(continuation[4:]) if continuation and continuation.startswith('page') else 0
+            next_page = f"page{page + 1}" if page + 1 < self.comment_pages else None
+
+            return json.dumps(comments_payload(segments[3], page=page, per_page=self.per_page, continuation=next_page, seed=self.seed)).encode()
+
+        if segments == ['api', 'v1', 'search']:
+            return json.dumps(search_payload(parameters.get('q', ''), int(parameters.get('page', 1)), self.per_page, self.search_pages, seed=self.seed)).encode()
+
+        if segments == ['instances.json']:
+            return json.dumps(instances_payload(self.instances, base_url=self.url, seed=self.seed)).encode()
+
+        if segments == ['Votes'] and video_id:
+            return json.dumps(ryd_payload(video_id, seed=self.seed)).encode()
+
+        return None
+
+
+    def _handle(self, handler: BaseHTTPRequestHandler, send_body: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._rng.uniform(0, self.jitter) if self.jitter else self.latency
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        parts = urlsplit(handler.path)
+
+        if failed:
+            status, body = self.error_status, b'{"error": "injected error"}'
+
+        else:
+            body = self._body(parts.path, tuple(sorted(parse_qsl(parts.query))))
+            status, body = (200, body) if body is not None else (404, b'{"error": "not found"}')
+
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+
+        if self.compress and 'gzip' in handler.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=5)
+            handler.send_header('Content-Encoding', 'gzip')
+
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+
+        if send_body:
+            handler.wfile.write(body)
+
+
+    def start(self) -> "StandInServer":
+        """
+            Starts serving on a free port of `127.0.0.1`.
+        """
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately, don't let Nagle's algorithm delay the body:
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                server._handle(self, send_body=True)
+
+            def do_HEAD(self) -> None:
+                server._handle(self, send_body=False)
+
+            def log_message(self, *args: t.Any) -> None:
+                pass
+
+        class Server(ThreadingHTTPServer):
+            request_queue_size = 128
+            daemon_threads = True
+
+        self._server = Server(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self._server.serve_forever, name='invidious-stand-in', daemon=True).start()
+
+        return self
+
+
+    def stop(self) -> None:
+        """
+            Stops the server.
+        """
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.stop()
@@ -6,17 +6,13 @@
     impossible right now. If you know a workaround, please open an issue/PR.
 """
 
-try:
-    from requests_cache import CachedSession as Session # type: ignore
-except ImportError:
-    from requests import Session
-
 from requests import HTTPError
-from invidious_api_client import InvidiousClient
+from invidious_api_client import InvidiousClient, ResponseCache
 
 
 def get_all_comments():
-    CLIENT = InvidiousClient(additional_parameters={'hl': 'de'}, session_object=Session())
+    # Comment pages are cached for 5 minutes (in memory and in `cache.sqlite`), see `ResponseCache`:
+    CLIENT = InvidiousClient(additional_parameters={'hl': 'de'}, cache=ResponseCache(path='cache.sqlite'))
 
     try:
         for comments in CLIENT.yield_all_comments('9bZkp7q19f0'):
@@ -1,13 +1,49 @@
 from typing import TYPE_CHECKING
 
 from .client import InvidiousClient
-from .models.instances import get_instances, choose_instance
+from .models.instances import get_instances, choose_instance, choose_instances, probe_instances, LazyInstance, DEFAULT_INSTANCE
+from .exceptions import InvidiousClientError, NoInstanceAvailableError, FieldNotProjectedError, RateLimitExceededError, CassetteMissError
+from .ratelimit import RateLimiter, Quota, DEFAULT_RATE_LIMITER
+from .registry import RegistryCache, DEFAULT_REGISTRY_CACHE
+from .pool import InstancePool
+from .batch import BatchResult
+from .cache import ResponseCache
+from .models.compact import compact
+from .crawl import CommentCrawl
+from .dislikes import RYDCache, DislikeBatch
+from .hedging import HedgingPolicy
+from .session import make_session, accept_encoding, DEFAULT_TIMEOUT
+from .metrics import MetricsHook, MetricsRegistry
+from .cassette import RecordingAdapter, ReplayAdapter, recording_session, replay_session
+from .streaming import CommentStream
+from .models.search import SearchVideo, SearchChannel, SearchPlaylist, search_result
+
+
+
+def __getattr__(name: str):
+    # `AsyncInvidiousClient` imports aiohttp, which takes longer than importing the rest of the package,
+    # so it's imported only when it's used:
+    if name == 'AsyncInvidiousClient':
+        from .async_client import AsyncInvidiousClient
+        return AsyncInvidiousClient
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
 # To not report "unused import" warnings." by linter:
 if TYPE_CHECKING:
+    from .async_client import AsyncInvidiousClient
+
     _ = [
-        InvidiousClient,
-        get_instances, choose_instance
+        InvidiousClient, AsyncInvidiousClient,
+        get_instances, choose_instance, choose_instances, probe_instances, LazyInstance, DEFAULT_INSTANCE,
+        InvidiousClientError, NoInstanceAvailableError, FieldNotProjectedError, RateLimitExceededError, CassetteMissError,
+        RateLimiter, Quota, DEFAULT_RATE_LIMITER,
+        RegistryCache, DEFAULT_REGISTRY_CACHE,
+        InstancePool, BatchResult, ResponseCache, compact, CommentCrawl,
+        RYDCache, DislikeBatch, HedgingPolicy,
+        make_session, accept_encoding, DEFAULT_TIMEOUT, MetricsHook, MetricsRegistry,
+        RecordingAdapter, ReplayAdapter, recording_session, replay_session, CommentStream,
+        SearchVideo, SearchChannel, SearchPlaylist, search_result
     ]
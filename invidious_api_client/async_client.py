@@ -0,0 +1,305 @@
+import typing as t
+
+import asyncio
+import time
+
+try:
+    import aiohttp
+
+except ImportError: # pragma: no cover
+    aiohttp = None
+
+
+from .models import BaseInvidiousData, RYDData
+from .models.instances import Instance, LazyInstance, DEFAULT_INSTANCE
+from .pool import InstancePool
+from .batch import BatchResult, unique
+from .json_decoders import JSONDecoder, get_decoder
+from .dislikes import RYD_URL
+
+from .models.videos import YoutubeVideo
+from .models.comments import Comments
+
+
+
+_RCLS = t.TypeVar('_RCLS', bound=t.Type[BaseInvidiousData])
+
+
+
+class AsyncInvidiousClient:
+    def __init__(self, instance: t.Optional[t.Union[Instance, LazyInstance, InstancePool, str, bytes]]=None, session_object: t.Optional['aiohttp.ClientSession']=None, additional_parameters: t.Optional[t.Dict[str, t.Any]]=None, max_in_flight: int=100, connection_limit: int=100, timeout: float=30.0, json_decoder: t.Union[str, JSONDecoder]='auto', ryd_url: str=RYD_URL) -> None:
+        """
+            Initializes a new asynchronous Invidious API Client (requires [aiohttp](https://docs.aiohttp.org/): `pip install invidious-api-client[async]`).
+
+            It has the same methods as `InvidiousClient` (but they are coroutines), and returns the same models.
+
+            ```python
+            async with AsyncInvidiousClient() as client:
+                videos = await asyncio.gather(*(client.get_video(id) for id in ids))
+            ```
+
+            ### Parameters:
+            - `instance` - the instance URL or object to use (see `InvidiousClient`).
+            - `session_object` - the `aiohttp.ClientSession` to use. If `None`, a session is created on the first request
+              (and closed by `AsyncInvidiousClient.close()`).
+            - `additional_parameters` - additional parameters to pass to every API request.
+            - `max_in_flight` - the maximum number of requests running at once (the rest wait for their turn).
+            - `connection_limit` - the size of the connection pool of the created session.
+            - `timeout` - total timeout of a single request (in seconds), for the created session.
+            - `json_decoder` - the JSON decoder to use, see `get_decoder`.
+            - `ryd_url` - base URL of the Return YouTube Dislike API (see `get_dislike_count`).
+        """
+
+        if aiohttp is None:
+            raise ImportError("AsyncInvidiousClient requires aiohttp: pip install invidious-api-client[async]")
+
+        self.session = session_object
+        self._owns_session = session_object is None
+
+        self.additional_parameters = additional_parameters
+        self.max_in_flight = max_in_flight
+        self.connection_limit = connection_limit
+        self.timeout = timeout
+        self.json_decoder = get_decoder(json_decoder)
+        self.ryd_url = ryd_url.rstrip('/')
+
+        self.instance = DEFAULT_INSTANCE if instance is None else instance
+        """The instance (or `LazyInstance`/`InstancePool`) this client uses."""
+
+        self._instance_url: t.Optional[str] = None
+        self._semaphore: t.Optional[asyncio.Semaphore] = None
+
+        if not isinstance(self.instance, (LazyInstance, InstancePool)):
+            self._instance_url = self._url_of(self.instance)
+
+
+    @staticmethod
+    def _url_of(instance: t.Union[Instance, str, bytes]) -> str:
+        _to_strip = instance.uri if hasattr(instance, 'uri') else instance
+
+        if isinstance(_to_strip, bytes):
+            _to_strip = _to_strip.decode()
+
+        return _to_strip.strip('/')
+
+
+    async def get_instance_url(self) -> str:
+        """
+            The URL of the instance (without a trailing slash).
+
+            If the client uses a `LazyInstance`, this chooses the instance (in a thread, so the event loop is not blocked).
+        """
+
+        if isinstance(self.instance, InstancePool):
+            return self.instance.pick()
+
+        if self._instance_url is None:
+            instance = await asyncio.get_running_loop().run_in_executor(None, self.instance.resolve)
+            self._instance_url = self._url_of(instance)
+
+        return self._instance_url
+
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        return self.session
+
+
+    async def close(self) -> None:
+        """
+            Closes the session (only if it was created by this client).
+        """
+
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+    async def __aenter__(self) -> 'AsyncInvidiousClient':
+        return self
+
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+
+    async def _get_json(self, uri: str, append_to_api: bool=True, return_class: t.Optional[_RCLS] = BaseInvidiousData, **requests_kwargs) -> t.Union[t.List, t.Dict[str, t.Any], _RCLS]:
+        """
+            Gets the JSON response from the given URI.
+
+            See `InvidiousClient._get_json` for the description of parameters. `**requests_kwargs` are passed to `aiohttp.ClientSession.get`.
+        """
+
+        _kwargs = requests_kwargs.copy()
+
+        if self.additional_parameters:
+            _kwargs['params'] = {**_kwargs.get('params', {}), **self.additional_parameters}
+
+        json = await self._send(uri, append_to_api, **_kwargs)
+
+        if return_class is not None:
+            return return_class(json)
+
+
+        return json
+
+
+    async def _send(self, uri: str, append_to_api: bool=True, **requests_kwargs) -> t.Any:
+        """
+            Sends a GET request and returns the decoded JSON. Raises `aiohttp.ClientResponseError` for unsuccessful responses.
+
+            With an `InstancePool`, requests that fail because of the instance are retried on other instances (see `InvidiousClient._send`).
+        """
+
+        session = self._get_session()
+
+        if not append_to_api or not isinstance(self.instance, InstancePool):
+            url = f"{await self.get_instance_url()}/api/v1/{uri}" if append_to_api else uri
+
+            async with self._semaphore:
+                async with session.get(url, **requests_kwargs) as response:
+                    response.raise_for_status()
+                    return self.json_decoder(await response.read())
+
+
+        pool: InstancePool = self.instance
+        tried: t.List[str] = []
+        last_error: t.Optional[Exception] = None
+
+        for attempt in range(pool.max_attempts):
+            if attempt:
+                await asyncio.sleep(pool.backoff(attempt - 1))
+
+            url = pool.pick(exclude=tried)
+            tried.append(url)
+
+            start = time.perf_counter()
+
+            async with self._semaphore:
+                try:
+                    async with session.get(f"{url}/api/v1/{uri}", **requests_kwargs) as response:
+                        if pool.is_failure(response.status):
+                            pool.report_failure(url)
+                            last_error = aiohttp.ClientResponseError(response.request_info, response.history, status=response.status, message=response.reason or '')
+
+                            continue
+
+                        response.raise_for_status()
+                        json = self.json_decoder(await response.read())
+
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                    pool.report_failure(url)
+                    last_error = error
+
+                    continue
+
+            pool.report_success(url, time.perf_counter() - start)
+            return json
+
+        raise last_error
+
+
+    async def get_video(self, id: str, **requests_kwargs) -> YoutubeVideo:
+        """
+            Obtain video data.
+
+            See `InvidiousClient.get_video`.
+        """
+
+        return await self._get_json(f"videos/{id}", return_class=YoutubeVideo, **requests_kwargs)
+
+
+    async def iter_videos(self, ids: t.Iterable[str], **requests_kwargs) -> t.AsyncIterator[t.Tuple[str, t.Union[YoutubeVideo, Exception]]]:
+        """
+            Fetches many videos concurrently (at most `max_in_flight` at once) and yields `(id, video)` pairs as they complete.
+
+            See `InvidiousClient.iter_videos`.
+        """
+
+        async def _get(id: str) -> t.Tuple[str, t.Union[YoutubeVideo, Exception]]:
+            try:
+                return id, await self.get_video(id, **requests_kwargs)
+
+            except Exception as error:
+                return id, error
+
+        tasks = [asyncio.ensure_future(_get(id)) for id in unique(ids)]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+    async def get_videos(self, ids: t.Iterable[str], **requests_kwargs) -> BatchResult[str, YoutubeVideo]:
+        """
+            Fetches many videos concurrently. See `InvidiousClient.get_videos`.
+        """
+
+        ids = unique(ids)
+        batch: BatchResult[str, YoutubeVideo] = BatchResult(ids)
+
+        async for id, video_or_error in self.iter_videos(ids, **requests_kwargs):
+            if isinstance(video_or_error, Exception):
+                batch.errors[id] = video_or_error
+
+            else:
+                batch.results[id] = video_or_error
+
+        return batch
+
+
+    async def get_comments(self, video: t.Union[str, YoutubeVideo], **requests_kwargs) -> Comments:
+        """
+            Obtains first page of comments for a video.
+
+            See `InvidiousClient.get_comments`.
+        """
+
+        return await self._get_json(f"comments/{video.video_id if hasattr(video, 'video_id') else video}", return_class=Comments, **requests_kwargs)
+
+
+    async def yield_all_comments(self, video: t.Union[str, YoutubeVideo], low_memory: bool=False) -> t.AsyncGenerator[Comments, None]:
+        """
+            Yields all pages of comments of a video (including the last one), until there are none left.
+
+            With `low_memory=True`, each page is released once you are done with it (see `InvidiousClient.yield_all_comments`).
+
+            ```
+            async for comments in client.yield_all_comments(video):
+                for comment in comments:
+                    ...
+            ```
+        """
+
+        comments = await self.get_comments(video)
+        yield comments
+
+        while comments.continuation is not None:
+            continuation = comments.continuation
+
+            if low_memory:
+                comments.release()
+                comments = None
+
+            comments = await self.get_comments(video, params={'continuation': continuation})
+            yield comments
+
+
+    async def get_dislike_count(self, video: t.Union[str, YoutubeVideo]) -> RYDData:
+        """
+            Will make a request to https://returnyoutubedislikeapi.com (or `ryd_url`) to fetch dislike count data.
+
+            See `InvidiousClient.get_dislike_count`.
+        """
+
+        return await self._get_json(f"{self.ryd_url}/Votes?videoId={video.video_id if hasattr(video, 'video_id') else video}", return_class=RYDData, append_to_api=False)
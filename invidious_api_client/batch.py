@@ -0,0 +1,118 @@
+import typing as t
+
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+
+
+
+_K = t.TypeVar('_K')
+_V = t.TypeVar('_V')
+
+
+
+class BatchResult(t.Generic[_K, _V]):
+    """
+        Results of a batch request.
+
+        Iterating over it yields the successful results in input order (duplicates removed).
+        Failures don't abort the batch - they are kept in `BatchResult.errors`.
+    """
+
+    def __init__(self, keys: t.Iterable[_K]) -> None:
+        self.keys: t.List[_K] = list(keys)
+        """The requested keys (e. g. video IDs), in input order, without duplicates."""
+
+        self.results: t.Dict[_K, _V] = {}
+        """Successful results, by key."""
+
+        self.errors: t.Dict[_K, Exception] = {}
+        """Exceptions of failed requests, by key."""
+
+
+    @property
+    def ok(self) -> bool:
+        """
+            Whether all requests succeeded.
+        """
+
+        return not self.errors
+
+
+    def items(self) -> t.Iterator[t.Tuple[_K, _V]]:
+        """
+            Iterates over `(key, result)` pairs of successful requests, in input order.
+        """
+
+        for key in self.keys:
+            if key in self.results:
+                yield key, self.results[key]
+
+
+    def __iter__(self) -> t.Iterator[_V]:
+        for _, result in self.items():
+            yield result
+
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+    def __getitem__(self, key: _K) -> _V:
+        """
+            Returns the result for `key`, or raises the exception of its request, if it failed.
+        """
+
+        if key in self.errors:
+            raise self.errors[key]
+
+        return self.results[key]
+
+
+    def __repr__(self) -> str:
+        return f"<BatchResult {len(self.results)} ok, {len(self.errors)} failed>"
+
+
+
+def unique(keys: t.Iterable[_K]) -> t.List[_K]:
+    """
+        Removes duplicates from `keys`, keeping the order.
+    """
+
+    return list(dict.fromkeys(keys))
+
+
+
+def iter_as_completed(function: t.Callable[[_K], _V], keys: t.Iterable[_K], max_in_flight: int=8) -> t.Iterator[t.Tuple[_K, t.Optional[_V], t.Optional[Exception]]]:
+    """
+        Calls `function` for every key in a thread pool, with at most `max_in_flight` calls running at once.
+
+        Yields `(key, result, None)` or `(key, None, exception)` as the calls complete.
+        `keys` are consumed lazily, and no new calls are started once the iterator is closed.
+    """
+
+    keys = iter(keys)
+    running: t.Dict[Future, _K] = {}
+
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='invidious-batch') as executor:
+        try:
+            for key in keys:
+                running[executor.submit(function, key)] = key
+
+                if len(running) >= max_in_flight:
+                    break
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    key = running.pop(future)
+                    error = future.exception()
+
+                    yield (key, None, error) if error is not None else (key, future.result(), None)
+
+                    for next_key in keys:
+                        running[executor.submit(function, next_key)] = next_key
+                        break
+
+        finally:
+            for future in running:
+                future.cancel()
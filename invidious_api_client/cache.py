@@ -0,0 +1,247 @@
+import typing as t
+
+import json
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from pathlib import Path
+
+from requests import Response, HTTPError
+
+
+
+DEFAULT_TTLS: t.Dict[str, float] = {
+    'videos/{id}': 6 * 60 * 60,
+    'comments/{id}': 5 * 60,
+    # RYD allows 10 000 requests per day, so its data is kept for a day:
+    'returnyoutubedislikeapi.com/Votes': 24 * 60 * 60,
+}
+"""Default TTLs (in seconds) of cached responses, by endpoint template (see `endpoint_template`)."""
+
+
+
+class CacheEntry(t.NamedTuple):
+    """
+        A cached response.
+    """
+
+    status: int
+    """The HTTP status code (`200`, or `404` for cached "not found" responses)."""
+
+    json: t.Any
+    """The decoded JSON (`None` for `404` responses)."""
+
+    expires_at: float
+    """When does the entry expire (`time.time()`)."""
+
+
+
+class MemoryCache:
+    """
+        Size-bounded in-memory LRU cache tier.
+
+        ### Parameters:
+        - `maxsize` - the maximum number of entries. The least recently used entries are evicted first.
+    """
+
+    def __init__(self, maxsize: int=1024) -> None:
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry.expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+
+class SQLiteCache:
+    """
+        Persistent SQLite cache tier.
+
+        ### Parameters:
+        - `path` - path to the database file (created if it does not exist).
+    """
+
+    def __init__(self, path: t.Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, status INTEGER, json TEXT, expires_at REAL)')
+
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute('SELECT status, json, expires_at FROM responses WHERE key = ?', (key,)).fetchone()
+
+        if row is None or row[2] <= time.time():
+            return None
+
+        return CacheEntry(row[0], json.loads(row[1]) if row[1] is not None else None, row[2])
+
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        raw = json.dumps(entry.json) if entry.json is not None else None
+
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)', (key, entry.status, raw, entry.expires_at))
+
+
+    def purge_expired(self) -> None:
+        """
+            Deletes expired entries.
+        """
+
+        with self._lock:
+            self._connection.execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(),))
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute('DELETE FROM responses')
+
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+
+class ResponseCache:
+    """
+        Cache of decoded API responses for `InvidiousClient` (pass it as `cache`).
+
+        Responses are kept in a size-bounded in-memory LRU, and optionally in an SQLite database on disk
+        (shared between processes and runs). How long a response is cached depends on its endpoint,
+        see `DEFAULT_TTLS`. Responses of endpoints without a TTL are not cached.
+
+        `404` responses (e. g. unavailable videos) are cached for `not_found_ttl` seconds, so bulk jobs
+        don't request the same missing IDs again - a cached `404` raises `HTTPError` just like a real one.
+
+        ### Parameters:
+        - `maxsize` - the maximum number of responses kept in memory.
+        - `path` - path to the SQLite database. If `None`, responses are only cached in memory.
+        - `ttls` - TTLs (in seconds) by endpoint template, these update `DEFAULT_TTLS`. Use `0` to disable caching of an endpoint.
+        - `default_ttl` - TTL of endpoints not in `ttls`. If `None`, they are not cached.
+        - `not_found_ttl` - TTL of `404` responses. If `None`, they are not cached.
+    """
+
+    def __init__(self, maxsize: int=1024, path: t.Optional[t.Union[str, Path]]=None, ttls: t.Optional[t.Dict[str, float]]=None, default_ttl: t.Optional[float]=None, not_found_ttl: t.Optional[float]=60 * 60) -> None:
+        self.memory = MemoryCache(maxsize)
+        """The in-memory tier."""
+
+        self.disk: t.Optional[SQLiteCache] = SQLiteCache(path) if path is not None else None
+        """The on-disk tier (if any)."""
+
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.not_found_ttl = not_found_ttl
+
+
+    @staticmethod
+    def key(uri: str, append_to_api: bool=True, params: t.Optional[t.Dict[str, t.Any]]=None) -> str:
+        """
+            Cache key of a request. API responses don't depend on the instance, so it is not a part of the key.
+        """
+
+        return json.dumps([uri, append_to_api, sorted((str(name), str(value)) for name, value in (params or {}).items())])
+
+
+    def ttl(self, template: str) -> t.Optional[float]:
+        """
+            TTL (in seconds) of the endpoint template, or `None` if it should not be cached.
+        """
+
+        ttl = self.ttls.get(template, self.default_ttl)
+        return ttl if ttl else None
+
+
+    def get(self, key: str) -> t.Optional[CacheEntry]:
+        """
+            Returns the cached entry (from memory, or from disk), or `None`.
+        """
+
+        entry = self.memory.get(key)
+
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(key)
+
+            if entry is not None:
+                self.memory.set(key, entry)
+
+        return entry
+
+
+    def set(self, key: str, template: str, json: t.Any, status: int=200) -> None:
+        """
+            Caches a response, if its endpoint (or status) should be cached.
+        """
+
+        ttl = self.not_found_ttl if status == 404 else self.ttl(template)
+
+        if not ttl:
+            return
+
+        entry = CacheEntry(status, json, time.time() + ttl)
+        self.memory.set(key, entry)
+
+        if self.disk is not None:
+            self.disk.set(key, entry)
+
+
+    @staticmethod
+    def not_found_error(url: str) -> HTTPError:
+        """
+            Creates the `HTTPError` raised for a cached `404` response.
+        """
+
+        response = Response()
+        response.status_code = 404
+        response.url = url
+        response.reason = 'Not Found (cached)'
+
+        return HTTPError(f"404 Client Error: Not Found (cached) for url: {url}", response=response)
+
+
+    def clear(self) -> None:
+        """
+            Removes all cached responses.
+        """
+
+        self.memory.clear()
+
+        if self.disk is not None:
+            self.disk.clear()
@@ -0,0 +1,233 @@
+import typing as t
+
+import base64
+import gzip
+import io
+import json
+import threading
+import time
+
+from collections import deque
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from requests import Session, Response, PreparedRequest
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import CassetteMissError
+from .session import make_session
+
+
+
+CASSETTE_VERSION = 1
+"""Version of the cassette format."""
+
+# Bodies are stored decoded, so these headers would no longer be true on replay:
+_DROPPED_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection', 'keep-alive'}
+
+
+
+def _match_key(method: str, url: str, ignore_host: bool) -> t.Tuple[str, str]:
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+
+    return method.upper(), urlunsplit(('', '', parts.path, query, '')) if ignore_host else urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+        A transport adapter that sends requests with another adapter, and records the responses
+        (status, headers, body and how long they took) into a cassette file for `ReplayAdapter`.
+
+        The cassette is a gzip-compressed file of JSON lines, one response per line. Records are appended
+        as responses arrive, so an interrupted recording is still usable. Use `recording_session` to get a session with it mounted.
+
+        ### Parameters:
+        - `path` - the cassette file. An existing cassette is appended to.
+        - `adapter` - the adapter that actually sends the requests. Defaults to a new `HTTPAdapter`.
+    """
+
+    def __init__(self, path: t.Union[str, Path], adapter: t.Optional[BaseAdapter]=None) -> None:
+        super().__init__()
+
+        self.path = Path(path)
+        self.adapter = HTTPAdapter() if adapter is None else adapter
+        self.recorded = 0
+        """The number of recorded responses."""
+
+        self._file: t.Optional[t.IO[str]] = None
+        self._lock = threading.Lock()
+
+
+    def send(self, request: PreparedRequest, **kwargs: t.Any) -> Response:
+        start = time.perf_counter()
+        response = self.adapter.send(request, **kwargs)
+
+        # Reads the whole body (streamed responses are read here as well):
+        content = response.content
+        elapsed = time.perf_counter() - start
+
+        record: t.Dict[str, t.Any] = {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': [[name, value] for name, value in response.headers.items() if name.lower() not in _DROPPED_HEADERS],
+            'elapsed': round(elapsed, 6),
+        }
+
+        try:
+            record['body'] = content.decode('UTF-8')
+
+        except UnicodeDecodeError:
+            record['body_b64'] = base64.b64encode(content).decode('ascii')
+
+        with self._lock:
+            if self._file is None:
+                new = not self.path.exists()
+                self._file = gzip.open(self.path, 'at', encoding='UTF-8')
+
+                if new:
+                    self._file.write(json.dumps({'version': CASSETTE_VERSION}) + '\n')
+
+            self._file.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n')
+            self.recorded += 1
+
+        return response
+
+
+    def close(self) -> None:
+        """
+            Finishes the cassette file and closes the wrapped adapter.
+        """
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+        self.adapter.close()
+
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+        A transport adapter that answers requests from a cassette recorded by `RecordingAdapter`, without any network access.
+
+        Requests are matched by method and URL (query parameters in any order). If the same request was recorded more than once,
+        the responses are replayed in the recorded order (and the last one is repeated).
+        Use `replay_session` to get a session with it mounted.
+
+        ### Parameters:
+        - `path` - the cassette file.
+        - `time_scale` - how long does a response take, relative to the recorded time: `1.0` replays the original timing,
+          `0.1` compresses it ten times, `0.0` answers immediately.
+        - `ignore_host` - if `True`, requests are matched by path and query only (e. g. to replay traffic recorded from
+          one instance on another).
+    """
+
+    def __init__(self, path: t.Union[str, Path], time_scale: float=1.0, ignore_host: bool=False) -> None:
+        super().__init__()
+
+        self.path = Path(path)
+        self.time_scale = time_scale
+        self.ignore_host = ignore_host
+        self.replayed = 0
+        """The number of replayed responses."""
+
+        self._records: t.Dict[t.Tuple[str, str], t.Deque[t.Dict[str, t.Any]]] = {}
+        self._lock = threading.Lock()
+
+        with gzip.open(self.path, 'rt', encoding='UTF-8') as file:
+            for line in file:
+                record = json.loads(line)
+
+                if 'version' in record:
+                    if record['version'] > CASSETTE_VERSION:
+                        raise ValueError(f"Unsupported cassette version: {record['version']}")
+
+                    continue
+
+                self._records.setdefault(_match_key(record['method'], record['url'], ignore_host), deque()).append(record)
+
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._records.values())
+
+
+    def send(self, request: PreparedRequest, **kwargs: t.Any) -> Response:
+        with self._lock:
+            records = self._records.get(_match_key(request.method, request.url, self.ignore_host))
+
+            if not records:
+                raise CassetteMissError(request.method, request.url)
+
+            record = records.popleft() if len(records) > 1 else records[0]
+            self.replayed += 1
+
+        if self.time_scale > 0:
+            time.sleep(record['elapsed'] * self.time_scale)
+
+        response = Response()
+        response.status_code = record['status']
+        response.reason = record['reason']
+        response.headers = CaseInsensitiveDict(record['headers'])
+        response._content = base64.b64decode(record['body_b64']) if 'body_b64' in record else record['body'].encode('UTF-8')
+        response.headers['Content-Length'] = str(len(response._content))
+        # Streamed requests (`stream=True`) read the body from here:
+        response.raw = io.BytesIO(response._content)
+        response.url = request.url
+        response.request = request
+        response.encoding = None
+        response.elapsed = timedelta(seconds=record['elapsed'] * self.time_scale)
+
+        return response
+
+
+    def close(self) -> None:
+        pass
+
+
+
+def recording_session(path: t.Union[str, Path], **session_kwargs: t.Any) -> Session:
+    """
+        Returns a session (see `make_session`) that records all responses into the cassette at `path`.
+        Pass it to `InvidiousClient` as `session_object`, and close it to finish the cassette:
+
+        ```python
+        with recording_session('traffic.cassette') as session:
+            InvidiousClient(session_object=session).get_video('dQw4w9WgXcQ')
+        ```
+
+        `**session_kwargs` are passed to `make_session`.
+    """
+
+    session = make_session(**session_kwargs)
+    adapter = RecordingAdapter(path, session.get_adapter('https://'))
+
+    for prefix in ('https://', 'http://'):
+        session.mount(prefix, adapter)
+
+    return session
+
+
+def replay_session(path: t.Union[str, Path], time_scale: float=1.0, ignore_host: bool=False) -> Session:
+    """
+        Returns a session that answers requests from the cassette at `path` (see `ReplayAdapter`).
+        Pass it to `InvidiousClient` as `session_object`:
+
+        ```python
+        client = InvidiousClient(instance='https://invidious.example.tld', session_object=replay_session('traffic.cassette', time_scale=0.0))
+        ```
+    """
+
+    session = Session()
+    adapter = ReplayAdapter(path, time_scale, ignore_host)
+
+    for prefix in ('https://', 'http://'):
+        session.mount(prefix, adapter)
+
+    return session
@@ -1,13 +1,34 @@
 import typing as t
 
-from requests import Session
+import time
+
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit
+from requests import Session, Response, PreparedRequest, HTTPError, ConnectionError, Timeout
 
 
 from .models import BaseInvidiousData, RYDData
-from .models.instances import Instance, choose_instance
+from .models.compact import compact
+from .models.projection import project, parse_fields, format_fields
+from .models.instances import Instance, LazyInstance, DEFAULT_INSTANCE
+from .pool import InstancePool
+from .batch import BatchResult, unique, iter_as_completed
+from .cache import ResponseCache
+from .endpoints import endpoint_template
+from .singleflight import SingleFlight
+from .pagination import prefetch as prefetch_pages
+from .ratelimit import RateLimiter, DEFAULT_RATE_LIMITER, parse_retry_after
+from .exceptions import RateLimitExceededError
+from .dislikes import RYD_URL, RYDCache, DislikeBatch, staleness
+from .hedging import HedgingPolicy, start_thread
+from .session import DEFAULT_TIMEOUT, make_session
+from .metrics import MetricsHook
+from .json_decoders import JSONDecoder, get_decoder
+from .streaming import CommentStream
 
 from .models.videos import YoutubeVideo
 from .models.comments import Comments
+from .models.search import SearchResult, search_result
 
 
 
@@ -16,21 +37,47 @@ _RCLS = t.TypeVar('_RCLS', bound=t.Type[BaseInvidiousData])
 
 
 class InvidiousClient:
-    def __init__(self, instance: t.Union[Instance, str, bytes]=choose_instance(), session_object: t.Type[Session] = Session(), additional_parameters: t.Optional[t.Dict[str, t.Any]]=None) -> None:
+    def __init__(self, instance: t.Optional[t.Union[Instance, LazyInstance, InstancePool, str, bytes]]=None, session_object: t.Optional[Session]=None, additional_parameters: t.Optional[t.Dict[str, t.Any]]=None, cache: t.Optional[ResponseCache]=None, coalesce_requests: bool=True, json_decoder: t.Union[str, JSONDecoder]='auto', compact_models: bool=False, rate_limiter: t.Optional[RateLimiter]=DEFAULT_RATE_LIMITER, rate_limit_retries: int=3, hedging: t.Optional[HedgingPolicy]=None, pool_connections: int=10, pool_maxsize: int=64, timeout: t.Optional[t.Union[float, t.Tuple[float, float]]]=DEFAULT_TIMEOUT, max_retries: int=2, keep_alive: bool=True, metrics: t.Optional[t.Union[MetricsHook, t.Iterable[MetricsHook]]]=None, ryd_url: str=RYD_URL) -> None:
         """
             Initializes a new Invidious API Client.
 
             ### Parameters:
-            - `instance` - the instance URL or object to use.
-            - `session` - the session object to use.
+            - `instance` - the instance URL or object to use. If `None`, the shared `DEFAULT_INSTANCE` (a `LazyInstance`) is used.
+              Pass an `InstancePool` to spread requests across several instances (with failover to healthy ones).
+            - `session_object` - the `requests.Session` to use. If `None`, the client creates its own (see `make_session`) and closes it in `close()`.
+              Clients never share a session (and its connection pool) unless you pass the same one to them.
             - `**additional_parameters` - additional parameters to pass to every API request.
+            - `cache` - a `ResponseCache` to cache responses in (e. g. `ResponseCache(path='cache.sqlite')`). If `None`, nothing is cached.
+            - `coalesce_requests` - if `True`, identical requests made at the same time (e. g. from many threads) share a single network
+              round-trip and its decoded result.
+            - `json_decoder` - the JSON decoder to use, see `get_decoder`. By default, the fastest installed one (orjson or msgspec, if available).
+            - `compact_models` - if `True`, returned models are compact (see `compact`): they hold only their fields (in `__slots__`) and no raw `data`.
+            - `rate_limiter` - the `RateLimiter` consulted before each request. By default, the one shared by all clients
+              (it enforces the limits of returnyoutubedislikeapi.com). If `None`, requests are not limited.
+            - `rate_limit_retries` - how many times is a request retried after `429 Too Many Requests` (after waiting for as long as `Retry-After` says).
+            - `hedging` - a `HedgingPolicy` to send hedged requests with (only with an `InstancePool`): when a request takes too long,
+              a duplicate goes to another instance, and the first successful response is used. See `HedgingPolicy.stats` for how often hedges fired and won.
+            - `pool_connections`, `pool_maxsize`, `max_retries`, `keep_alive` - settings of the client's own session, see `make_session`
+              (ignored if you pass a `session_object`). Keep `pool_maxsize` at least as large as the number of threads that use the client.
+            - `timeout` - the default `(connect, read)` timeout in seconds (or a single number for both). `None` waits forever.
+              It can be overridden per call with the `timeout` keyword argument.
+            - `metrics` - a `MetricsHook` (e. g. a `MetricsRegistry`), or a list of them, that receives request latencies, response sizes,
+              status codes, retries, and JSON decode and model construction times, labelled by instance host and endpoint template.
+            - `ryd_url` - base URL of the Return YouTube Dislike API (see `get_dislike_count`).
+
+            ### Thread safety:
+
+            A client can be shared by many threads: the session's connection pool, the cache, the rate limiter and
+            the instance pool are all safe to use concurrently. Create the client before starting the threads.
 
             ### Warning:
 
             You can't access the API of some instances!
 
             By default, the client will use the first instance that is available (`choose_instance(only_accessible=True)`).
-            This slows down initialization, as it has to check all instances until it finds one that is accessible.
+            The instance is chosen lazily, on the first request, so creating the client (or importing this package) makes no network calls.
+            The first request is slower, as it has to check the instances until it finds one that is accessible.
+            The choice is cached in `DEFAULT_INSTANCE` and shared by all clients that use it.
 
             ### Tip:
             You can pass additional `hl` parameter to the API request to change the language of the response:
@@ -61,20 +108,93 @@ class InvidiousClient:
             You can see a list of all parameters [here](https://github.com/iv-org/documentation/blob/7ddae352a392b7bde9477d60e38c841003e5204e/List-of-URL-parameters.md).
         """
 
+        self._owns_session = session_object is None
+
+        self.session = make_session(pool_connections, pool_maxsize, max_retries, keep_alive) if session_object is None else session_object
+        self.timeout = timeout
+        self.ryd_url = ryd_url.rstrip('/')
+        self.metrics: t.List[MetricsHook] = [] if metrics is None else [metrics] if isinstance(metrics, MetricsHook) else list(metrics)
+        self.additional_parameters = additional_parameters
+        self.cache = cache
+        self._single_flight: t.Optional[SingleFlight] = SingleFlight() if coalesce_requests else None
+        self.json_decoder = get_decoder(json_decoder)
+        self.compact_models = compact_models
+        self.rate_limiter = rate_limiter
+        self.rate_limit_retries = rate_limit_retries
+
+        self.hedging = hedging
+
+        self.instance = DEFAULT_INSTANCE if instance is None else instance
+        """The instance (or `LazyInstance`) this client uses."""
+
+        self._instance_url: t.Optional[str] = None
+
+        if not isinstance(self.instance, (LazyInstance, InstancePool)):
+            self._use_instance(self.instance)
+
+        if self.hedging is not None and not isinstance(self.instance, InstancePool):
+            raise ValueError("Hedged requests need more instances - use an `InstancePool` as `instance`.")
+
+
+    def close(self) -> None:
+        """
+            Closes the client's session (only if the client created it).
+        """
+
+        if self._owns_session:
+            self.session.close()
+
+
+    def __enter__(self) -> "InvidiousClient":
+        return self
+
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.close()
+
+
+    def _use_instance(self, instance: t.Union[Instance, str, bytes]) -> None:
+        """
+            Sets up the client to use the given instance.
+        """
+
         _to_strip = instance.uri if hasattr(instance, 'uri') else instance
-        self.instance_url = _to_strip.strip('/') # remove trailing slash from the URL
 
-        self.session = session_object
+        if isinstance(_to_strip, bytes):
+            _to_strip = _to_strip.decode()
+
+        self._instance_url = _to_strip.strip('/') # remove trailing slash from the URL
 
         # Requires to have Tor installed & proxies must be running (note: untested).
         # (https://www.torproject.org/download/)
-        if instance.type == 'onion':
+        if getattr(instance, 'type', None) == 'onion':
             self.session.proxies = {'http': 'socks5h://localhost:9050', 'https': 'socks5h://localhost:9050'}
 
-        self.additional_parameters = additional_parameters
+
+    @property
+    def instance_url(self) -> str:
+        """
+            The URL of the instance (without a trailing slash).
+
+            If the client uses a `LazyInstance`, accessing this chooses the instance.
+            If the client uses an `InstancePool`, this is the instance picked for the next request.
+        """
+
+        if isinstance(self.instance, InstancePool):
+            return self.instance.pick()
+
+        if self._instance_url is None:
+            self._use_instance(self.instance.resolve())
+
+        return self._instance_url
 
 
-    def _get_json(self, uri: str, append_to_api: bool=True, return_class: t.Optional[_RCLS] = BaseInvidiousData, **requests_kwargs) -> t.Union[t.List, t.Dict[str, t.Any], _RCLS]:
+    @instance_url.setter
+    def instance_url(self, value: str) -> None:
+        self._use_instance(value)
+
+
+    def _get_json(self, uri: str, append_to_api: bool=True, return_class: t.Optional[_RCLS] = BaseInvidiousData, fields: t.Optional[t.Union[str, t.Iterable[str]]]=None, **requests_kwargs) -> t.Union[t.List, t.Dict[str, t.Any], _RCLS]:
         """
             Gets the JSON response from the given URI.
 
@@ -82,6 +202,7 @@ class InvidiousClient:
             - `uri` - the API URI to get the JSON response from.
             - `append_to_api` - whether to append `uri` to the instance API URL (e. g.: `https://invidious.instance.tld/api/v1/{uri}`).
             - `return_class` - the class to use to parse the JSON response. If `None`, the JSON response will be returned as a `dict`/`list`.
+            - `fields` - if set, only these fields are requested from the server (see `InvidiousClient.get_video`).
             - `**parameters` - search parameters to pass to the request.
         """
 
@@ -90,24 +211,375 @@ class InvidiousClient:
         if self.additional_parameters:
             _kwargs['params'] = {**_kwargs.get('params', {}), **self.additional_parameters}
 
-        response = self.session.get(f"{self.instance_url}/api/v1/{uri}" if append_to_api else uri, **_kwargs)
-        response.raise_for_status()
+        if fields is not None:
+            fields = format_fields(fields)
+            _kwargs['params'] = {**_kwargs.get('params', {}), 'fields': fields}
+
+        json: t.Dict[str, t.Any] = self._fetch_json(uri, append_to_api, **_kwargs)
 
-        json: t.Dict[str, t.Any] = response.json()
+        if fields is not None:
+            json = project(json, fields)
 
         if return_class is not None:
-            return return_class(json)
+            start = time.perf_counter()
+            model = return_class(json)
+            model = compact(model) if self.compact_models else model
+
+            if self.metrics:
+                duration = time.perf_counter() - start
+
+                for hook in self.metrics:
+                    hook.on_model(endpoint_template(uri, append_to_api), return_class.__name__, duration)
+
+            return model
+
+
+        return json
+
 
+    def _fetch_json(self, uri: str, append_to_api: bool=True, **requests_kwargs) -> t.Any:
+        """
+            Returns the decoded JSON response, from the `cache` if possible.
+        """
+
+        if self.cache is not None:
+            key = self.cache.key(uri, append_to_api, requests_kwargs.get('params'))
+            template = endpoint_template(uri, append_to_api)
+            entry = self.cache.get(key)
+
+            if entry is not None:
+                if entry.status == 404:
+                    raise self.cache.not_found_error(self._request_url(uri, append_to_api, requests_kwargs.get('params')))
+
+                return entry.json
+
+        try:
+            json = self._request_json(uri, append_to_api, **requests_kwargs)
+
+        except HTTPError as error:
+            if self.cache is not None and error.response is not None and error.response.status_code == 404:
+                self.cache.set(key, template, None, status=404)
+
+            raise
+
+        if self.cache is not None:
+            self.cache.set(key, template, json)
 
         return json
 
 
-    def get_video(self, id: str, **requests_kwargs) -> YoutubeVideo:
+    def _request_url(self, uri: str, append_to_api: bool=True, params: t.Optional[t.Dict[str, t.Any]]=None) -> str:
+        """
+            The full URL of a request (with its query string), as it would be sent.
+        """
+
+        request = PreparedRequest()
+        request.prepare_url(f"{self.instance_url}/api/v1/{uri}" if append_to_api else uri, params)
+
+        return request.url
+
+
+    def _request_json(self, uri: str, append_to_api: bool=True, **requests_kwargs) -> t.Any:
+        """
+            Sends the request and decodes the JSON response (directly from the response bytes, with `json_decoder`).
+
+            Identical concurrent requests (same instance, URI, parameters and other `requests` arguments, e. g. `headers` or `timeout`)
+            are coalesced into one, if `coalesce_requests` is enabled.
+        """
+
+        if self._single_flight is None:
+            return self._decode(self._send(uri, append_to_api, **requests_kwargs))
+
+
+        instance = id(self.instance) if isinstance(self.instance, InstancePool) else self.instance_url
+        arguments = tuple(sorted((name, _flight_key_part(value)) for name, value in requests_kwargs.items()))
+
+        return self._single_flight.do((instance, uri, append_to_api, arguments), lambda: self._decode(self._send(uri, append_to_api, **requests_kwargs)))
+
+
+    def _decode(self, response: Response) -> t.Any:
+        """
+            Decodes the JSON response with `json_decoder`.
+        """
+
+        if not self.metrics:
+            return self.json_decoder(response.content)
+
+        content = response.content
+        start = time.perf_counter()
+        json = self.json_decoder(content)
+        duration = time.perf_counter() - start
+
+        host, endpoint = _labels(response.url)
+
+        for hook in self.metrics:
+            hook.on_decode(host, endpoint, duration)
+
+        return json
+
+
+    def _get(self, url: str, retry_rate_limited: bool=True, max_wait: t.Optional[float]=None, **requests_kwargs) -> Response:
+        """
+            Sends a GET request, respecting the `rate_limiter`.
+
+            On `429 Too Many Requests`, the host is paused (for `Retry-After` seconds, or an exponential backoff)
+            and, if `retry_rate_limited` is `True`, the request is retried up to `rate_limit_retries` times.
+
+            If the request would have to wait for the rate limiter longer than `max_wait` (by default, `RateLimiter.max_wait`),
+            `RateLimitExceededError` is raised.
+        """
+
+        host = urlsplit(url).hostname or ''
+
+        for attempt in range(self.rate_limit_retries + 1):
+            if self.rate_limiter is not None and not self.rate_limiter.acquire(host, max_wait):
+                raise RateLimitExceededError(host, self.rate_limiter.wait_time(host))
+
+            if attempt and self.metrics:
+                self._emit_retry(url, 'rate_limited')
+
+            response = self._timed_session_get(url, **requests_kwargs)
+
+            if response.status_code != 429:
+                return response
+
+            delay = parse_retry_after(response.headers.get('Retry-After'))
+            delay = 2 ** attempt if delay is None else delay
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.pause(host, delay)
+
+            if not retry_rate_limited or attempt == self.rate_limit_retries:
+                return response
+
+            # Releases the connection (of a streamed response) before the next attempt:
+            response.close()
+
+            if self.rate_limiter is None:
+                time.sleep(delay)
+
+        return response
+
+
+    def _timed_session_get(self, url: str, **requests_kwargs) -> Response:
+        """
+            Sends a GET request with the session (and the default `timeout`), and reports it to the `metrics` hooks.
+        """
+
+        if not self.metrics:
+            return self.session.get(url, **{'timeout': self.timeout, **requests_kwargs})
+
+        host, endpoint = _labels(url)
+        start = time.perf_counter()
+
+        try:
+            response = self.session.get(url, **{'timeout': self.timeout, **requests_kwargs})
+
+        except Exception:
+            for hook in self.metrics:
+                hook.on_request(host, endpoint, None, time.perf_counter() - start, 0)
+
+            raise
+
+        latency = time.perf_counter() - start
+        size = len(response.content) if not requests_kwargs.get('stream') else int(response.headers.get('Content-Length') or 0)
+
+        for hook in self.metrics:
+            hook.on_request(host, endpoint, response.status_code, latency, size)
+
+        return response
+
+
+    def _emit_retry(self, url: str, reason: str) -> None:
+        host, endpoint = _labels(url)
+
+        for hook in self.metrics:
+            hook.on_retry(host, endpoint, reason)
+
+
+    def _send(self, uri: str, append_to_api: bool=True, **requests_kwargs) -> Response:
+        """
+            Sends a GET request and raises `HTTPError` for unsuccessful responses.
+
+            With an `InstancePool`, requests that fail because of the instance (see `InstancePool.is_failure`)
+            are retried on other instances, after a jittered backoff.
+        """
+
+        if not append_to_api or not isinstance(self.instance, InstancePool):
+            response = self._get(f"{self.instance_url}/api/v1/{uri}" if append_to_api else uri, **requests_kwargs)
+            response.raise_for_status()
+
+            return response
+
+
+        pool: InstancePool = self.instance
+        tried: t.List[str] = []
+        last_error: t.Optional[Exception] = None
+
+        for attempt in range(pool.max_attempts):
+            # A paused (rate limited) instance is skipped right away, other failures are retried after a backoff:
+            if attempt and not isinstance(last_error, RateLimitExceededError):
+                time.sleep(pool.backoff(attempt - 1))
+
+            # Only the last attempt waits for a paused instance, the others go to another instance instead:
+            max_wait = 0 if attempt < pool.max_attempts - 1 else None
+
+            url = pool.pick(exclude=tried)
+            tried.append(url)
+
+            if attempt and self.metrics:
+                self._emit_retry(f"{url}/api/v1/{uri}", 'failover')
+
+            if self.hedging is not None:
+                outcome = self._hedged_pool_get(pool, url, tried, uri, max_wait, **requests_kwargs)
+
+            else:
+                outcome = self._pool_get(url, uri, max_wait, **requests_kwargs)
+
+            last_error = self._report_outcome(pool, outcome)
+
+            if last_error is None:
+                response = outcome[1]
+                response.raise_for_status()
+
+                return response
+
+        raise last_error
+
+
+    def _pool_get(self, url: str, uri: str, max_wait: t.Optional[float]=0, **requests_kwargs) -> t.Tuple[str, t.Optional[Response], t.Optional[Exception], float]:
+        """
+            Sends a request to an instance of the pool. Returns `(instance URL, response, connection error, latency)`.
+
+            If the instance is paused by the rate limiter for longer than `max_wait`, the error is `RateLimitExceededError`
+            (and it counts as a failure of the instance).
+        """
+
+        start = time.perf_counter()
+
+        try:
+            # A rate limited instance is paused, and the request goes to another one:
+            response = self._get(f"{url}/api/v1/{uri}", retry_rate_limited=False, max_wait=max_wait, **requests_kwargs)
+
+        except (ConnectionError, Timeout, RateLimitExceededError) as error:
+            return url, None, error, time.perf_counter() - start
+
+        return url, response, None, time.perf_counter() - start
+
+
+    @staticmethod
+    def _outcome_error(pool: InstancePool, outcome: t.Tuple[str, t.Optional[Response], t.Optional[Exception], float]) -> t.Optional[Exception]:
+        _, response, error, _ = outcome
+
+        if error is None and pool.is_failure(response.status_code):
+            return HTTPError(f"{response.status_code} Error for url: {response.url}", response=response)
+
+        return error
+
+
+    def _report_outcome(self, pool: InstancePool, outcome: t.Tuple[str, t.Optional[Response], t.Optional[Exception], float]) -> t.Optional[Exception]:
+        """
+            Reports the outcome of a request to the pool. Returns the error, if the instance failed.
+        """
+
+        error = self._outcome_error(pool, outcome)
+
+        if error is not None:
+            pool.report_failure(outcome[0])
+
+        else:
+            pool.report_success(outcome[0], outcome[3])
+
+        return error
+
+
+    def _hedged_pool_get(self, pool: InstancePool, url: str, tried: t.List[str], uri: str, max_wait: t.Optional[float]=0, **requests_kwargs) -> t.Tuple[str, t.Optional[Response], t.Optional[Exception], float]:
+        """
+            Sends a request to `url` and, if it takes too long (see `HedgingPolicy`), a duplicate to another instance.
+
+            Returns the outcome of the first successful one. The other response is closed when it completes
+            (its outcome is still reported to the pool, so slow instances get fewer requests).
+        """
+
+        delay = self.hedging.delay()
+
+        if delay is None:
+            outcome = self._pool_get(url, uri, max_wait, **requests_kwargs)
+            self.hedging.record(outcome[3])
+
+            return outcome
+
+        # Both requests run on their own threads, so the caller can return as soon as either one answers:
+        start = time.perf_counter()
+        primary = start_thread(self._pool_get, url, uri, max_wait, **requests_kwargs)
+
+        if not wait([primary], timeout=delay).done:
+            hedge_url = pool.pick(exclude=tried)
+
+            if hedge_url not in tried and self.hedging.try_fire():
+                tried.append(hedge_url)
+
+                if self.metrics:
+                    self._emit_retry(f"{hedge_url}/api/v1/{uri}", 'hedge')
+
+                return self._race(pool, primary, start_thread(self._pool_get, hedge_url, uri, 0, **requests_kwargs), start)
+
+        outcome = primary.result()
+        self.hedging.record(outcome[3])
+
+        return outcome
+
+
+    def _race(self, pool: InstancePool, primary: Future, hedge: Future, start: float) -> t.Tuple[str, t.Optional[Response], t.Optional[Exception], float]:
+        """
+            Returns the outcome of whichever request (`primary` or `hedge`) succeeded first, and discards the other one.
+        """
+
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner, loser = (primary, hedge) if primary in done else (hedge, primary)
+
+        # If the first one failed, the other one still has a chance:
+        if self._outcome_error(pool, winner.result()) is not None:
+            self._report_outcome(pool, winner.result())
+            winner, loser = loser, None
+
+        outcome = winner.result()
+
+        if winner is hedge and self._outcome_error(pool, outcome) is None:
+            self.hedging.record_win()
+
+        if loser is not None:
+            loser.add_done_callback(self._discard_future)
+
+        self.hedging.record(time.perf_counter() - start)
+
+        return outcome
+
+
+    def _discard_future(self, future: Future) -> None:
+        """
+            Reports the outcome of a request that lost the race to the pool, and closes its response.
+        """
+
+        if future.exception() is not None:
+            return
+
+        outcome = future.result()
+        self._report_outcome(self.instance, outcome)
+
+        if outcome[1] is not None:
+            outcome[1].close()
+
+
+    def get_video(self, id: str, fields: t.Optional[t.Union[str, t.Iterable[str]]]=None, **requests_kwargs) -> YoutubeVideo:
         """
             Obtain video data.
 
             ### Parameters:
             - `id_or_url` - the video ID (part after `?watch=` in YouTube URL).
+            - `fields` - if set, the server sends only these (JSON) fields, e. g. `['title', 'videoId', 'videoThumbnails(url)']`.
+              This saves a lot of bandwidth and parsing time, if you don't need the formats, recommended videos, etc.
+              Reading a property whose field was not requested raises `FieldNotProjectedError` (see `YoutubeVideo.projected_fields`).
 
             ### Tip:
             Use the following RegEx to extract the video ID from a YouTube URL:
@@ -119,10 +591,55 @@ class InvidiousClient:
             (from [https://regex101.com/r/OY96XI/1](https://regex101.com/r/OY96XI/1))
         """
 
-        return self._get_json(f"videos/{id}", return_class=YoutubeVideo, **requests_kwargs)
+        return self._get_json(f"videos/{id}", return_class=YoutubeVideo, fields=fields, **requests_kwargs)
 
 
-    def get_comments(self, video: t.Union[str, YoutubeVideo], **requests_kwargs) -> Comments:
+    def iter_videos(self, ids: t.Iterable[str], max_in_flight: int=8, **requests_kwargs) -> t.Iterator[t.Tuple[str, t.Union[YoutubeVideo, Exception]]]:
+        """
+            Fetches many videos in parallel and yields `(id, video)` pairs as the requests complete.
+
+            If a request fails, `(id, exception)` is yielded instead - the rest of the batch continues.
+
+            ### Parameters:
+            - `ids` - the video IDs. Duplicates are fetched only once.
+            - `max_in_flight` - the maximum number of requests running at once.
+        """
+
+        for id, video, error in iter_as_completed(lambda id: self.get_video(id, **requests_kwargs), unique(ids), max_in_flight):
+            yield id, video if error is None else error
+
+
+    def get_videos(self, ids: t.Iterable[str], max_in_flight: int=8, **requests_kwargs) -> BatchResult[str, YoutubeVideo]:
+        """
+            Fetches many videos in parallel (see `InvidiousClient.iter_videos`).
+
+            Returns a `BatchResult` - iterate over it to get the videos in input order, and check `BatchResult.errors` for the failed IDs:
+
+            ```python
+            batch = CLIENT.get_videos(['dQw4w9WgXcQ', '9bZkp7q19f0'])
+
+            for video in batch:
+                print(video.title)
+
+            for id, error in batch.errors.items():
+                print(f"{id} failed: {error}")
+            ```
+        """
+
+        ids = unique(ids)
+        batch: BatchResult[str, YoutubeVideo] = BatchResult(ids)
+
+        for id, video_or_error in self.iter_videos(ids, max_in_flight, **requests_kwargs):
+            if isinstance(video_or_error, Exception):
+                batch.errors[id] = video_or_error
+
+            else:
+                batch.results[id] = video_or_error
+
+        return batch
+
+
+    def get_comments(self, video: t.Union[str, YoutubeVideo], fields: t.Optional[t.Union[str, t.Iterable[str]]]=None, **requests_kwargs) -> Comments:
         """
             Obtains first page of comments for a video.
 
@@ -132,20 +649,97 @@ class InvidiousClient:
 
             ### Parameters:
             - `video` - Either a `str` of video ID or `YoutubeVideo` instance.
+            - `fields` - if set, the server sends only these (JSON) fields, e. g. `['continuation', 'comments(author,content)']` (see `InvidiousClient.get_video`).
+        """
+
+        return self._get_json(f"comments/{video.video_id if hasattr(video, 'video_id') else video}", return_class=Comments, fields=fields, **requests_kwargs)
+
+
+    def stream_comments(self, video: t.Union[str, YoutubeVideo], continuation: t.Optional[str]=None, fields: t.Optional[t.Union[str, t.Iterable[str]]]=None, chunk_size: int=16384, **requests_kwargs) -> CommentStream:
+        """
+            Obtains a page of comments for a video, parsed while it is downloaded: comments are yielded as soon as they arrive,
+            instead of after the whole page (useful for big pages from slow instances).
+
+            ```python
+            with client.stream_comments('dQw4w9WgXcQ') as page:
+                for comment in page:
+                    print(comment.content)
+
+            next_page = client.stream_comments('dQw4w9WgXcQ', continuation=page.continuation)
+            ```
+
+            Streamed pages are not cached (see `cache`) nor coalesced.
+
+            ### Parameters:
+            - `video` - Either a `str` of video ID or `YoutubeVideo` instance.
+            - `continuation` - the continuation token of the page (`None` for the first page).
+            - `fields` - if set, the server sends only these (JSON) fields (see `InvidiousClient.get_comments`).
+            - `chunk_size` - how many bytes are read from the response at once.
         """
 
-        return self._get_json(f"comments/{video.video_id if hasattr(video, 'video_id') else video}", return_class=Comments, **requests_kwargs)
+        params = {**requests_kwargs.pop('params', {}), **(self.additional_parameters or {})}
+
+        if continuation is not None:
+            params['continuation'] = continuation
 
+        if fields is not None:
+            params['fields'] = format_fields(fields)
 
-    def yield_all_comments(self, video: t.Union[str, YoutubeVideo]) -> t.Generator[Comments, None, None]:
+        response = self._send(f"comments/{video.video_id if hasattr(video, 'video_id') else video}", params=params, stream=True, **requests_kwargs)
+        return CommentStream(response, chunk_size)
+
+
+    def stream_all_comments(self, video: t.Union[str, YoutubeVideo], fields: t.Optional[t.Union[str, t.Iterable[str]]]=None, chunk_size: int=16384, **requests_kwargs) -> t.Iterator[Comments.Comment]:
+        """
+            Yields all comments of a video, page by page, as they are downloaded (see `InvidiousClient.stream_comments`).
         """
-            Yields all comments of a video, until there are none left.
+
+        continuation: t.Optional[str] = None
+
+        while True:
+            page = self.stream_comments(video, continuation, fields, chunk_size, **requests_kwargs)
+
+            with page:
+                yield from page
+
+            continuation = page.continuation
+
+            if not continuation:
+                return
+
+
+    def _iter_comment_pages(self, video: t.Union[str, YoutubeVideo], fields: t.Optional[str]=None, continuation: t.Optional[str]=None) -> t.Iterator[Comments]:
+        """
+            Fetches the pages of comments one after another, starting at `continuation` (or at the first page).
+        """
+
+        while True:
+            page = self.get_comments(video, fields=fields, params={'continuation': continuation} if continuation is not None else {})
+            continuation = page.continuation
+
+            yield page
+
+            page = None # don't hold the page while the next one is being fetched
+
+            if continuation is None:
+                return
+
+
+    def yield_all_comments(self, video: t.Union[str, YoutubeVideo], low_memory: bool=False, fields: t.Optional[t.Union[str, t.Iterable[str]]]=None, prefetch: int=0) -> t.Generator[Comments, None, None]:
+        """
+            Yields all comments of a video, until there are none left (the last page is yielded too).
 
             ### Parameters:
             - `video` - Either a `str` of video ID or `YoutubeVideo` instance.
+            - `low_memory` - if `True`, each page is released (see `Comments.release`) once you are done with it (when the next page is requested),
+              so a long crawl holds only the comments you keep. Don't keep the yielded `Comments` pages in this mode, keep the `Comment`s instead.
+            - `fields` - if set, the server sends only these fields (see `InvidiousClient.get_comments`). `continuation` is always requested.
+            - `prefetch` - how many pages are fetched ahead, in a background thread, while you process the current one.
+              If `0`, the next page is fetched only after you are done with the current one.
 
             ### Note:
-            This yields `Comments`, not `Comment`. So, to get just the comments, you need to do a double-loop:
+            This yields `Comments`, not `Comment`. So, to get just the comments, you need to do a double-loop
+            (or use `InvidiousClient.iter_all_comments`):
 
             ```
             for comments in InvidiousClient.yield_all_comments(video):
@@ -154,18 +748,176 @@ class InvidiousClient:
             ```
         """
 
-        comments = self.get_comments(video)
+        if fields is not None and 'continuation' not in parse_fields(fields):
+            fields = f"{format_fields(fields)},continuation"
 
-        while comments.continuation is not None:
+        for comments in prefetch_pages(self._iter_comment_pages(video, fields), prefetch):
             yield comments
 
-            comments = self.get_comments(video, params={'continuation': comments.continuation})
+            if low_memory:
+                comments.release()
+
 
+    def iter_all_comments(self, video: t.Union[str, YoutubeVideo], prefetch: int=1, low_memory: bool=False, fields: t.Optional[t.Union[str, t.Iterable[str]]]=None) -> t.Iterator[Comments.Comment]:
+        """
+            Yields every `Comment` of a video, from all pages.
+
+            The next page is fetched in the background while you process the current one (see `InvidiousClient.yield_all_comments` for the parameters).
+        """
+
+        for comments in self.yield_all_comments(video, low_memory=low_memory, fields=fields, prefetch=prefetch):
+            yield from comments
+
+
+    def get_replies(self, comment: Comments.Comment, video: t.Union[str, YoutubeVideo], **requests_kwargs) -> t.List[Comments.Comment]:
+        """
+            Fetches all replies to a comment (following the reply continuations, until there are none left).
+
+            ### Parameters:
+            - `comment` - the top-level comment.
+            - `video` - the video of the comment (either a `str` of video ID or `YoutubeVideo` instance).
+        """
+
+        replies: t.List[Comments.Comment] = []
+        continuation = comment.reply_continuation
+
+        while continuation is not None:
+            page = self.get_comments(video, params={'continuation': continuation}, **requests_kwargs)
+
+            replies.extend(page.comments)
+            continuation = page.continuation
+
+        return replies
+
+
+    def expand_replies(self, comments: t.Union[Comments, t.Iterable[Comments.Comment]], video: t.Optional[t.Union[str, YoutubeVideo]]=None, max_in_flight: int=8, **requests_kwargs) -> BatchResult[str, t.List[Comments.Comment]]:
+        """
+            Fetches the replies of many comments in parallel (the replies of each comment are fetched one page after another).
+
+            Returns a `BatchResult` that maps each parent `comment_id` to the list of its replies.
+            Comments without replies are skipped. Failed threads are in `BatchResult.errors` (by parent `comment_id`).
+
+            ```python
+            page = CLIENT.get_comments('9bZkp7q19f0')
+
+            for parent_id, replies in CLIENT.expand_replies(page).items():
+                ...
+            ```
+
+            ### Parameters:
+            - `comments` - a page of comments, or any top-level comments (then `video` is required).
+            - `video` - the video of the comments. Defaults to the video of the `Comments` page.
+            - `max_in_flight` - the maximum number of requests running at once.
+        """
+
+        if video is None:
+            video = getattr(comments, 'video_id', None)
+
+            if video is None:
+                raise ValueError("`video` is required, unless `comments` is a `Comments` page.")
+
+        parents = {comment.comment_id: comment for comment in comments if comment.reply_continuation is not None}
+        batch: BatchResult[str, t.List[Comments.Comment]] = BatchResult(parents)
+
+        for parent_id, replies, error in iter_as_completed(lambda parent_id: self.get_replies(parents[parent_id], video, **requests_kwargs), parents, max_in_flight):
+            if error is not None:
+                batch.errors[parent_id] = error
+
+            else:
+                batch.results[parent_id] = replies
+
+        return batch
+
+
+    def search(self, query: str, pages: t.Union[int, t.Iterable[int]]=1, sort_by: t.Optional[str]=None, date: t.Optional[str]=None, duration: t.Optional[str]=None, type: t.Optional[str]=None, features: t.Optional[t.Union[str, t.Iterable[str]]]=None, region: t.Optional[str]=None, max_in_flight: int=4, **requests_kwargs) -> t.List[SearchResult]:
+        """
+            Searches for videos, channels and playlists.
+
+            Search pages are numbered, so the requested pages are fetched concurrently (at most `max_in_flight` at once).
+            Results are returned in the order of the pages, without duplicates (results often repeat on the next page).
+            An empty page means there are no more results: no pages after it are requested, and their results are dropped.
+
+            ```python
+            for result in client.search('never gonna give you up', pages=3, type='video'):
+                print(result.title, result.video_id)
+            ```
+
+            ### Parameters:
+            - `query` - the search query.
+            - `pages` - how many pages (from the first one), or which page numbers (e. g. `range(3, 6)`) to fetch.
+            - `sort_by` - `relevance`, `rating`, `upload_date` or `view_count`.
+            - `date` - `hour`, `today`, `week`, `month` or `year`.
+            - `duration` - `short` or `long`.
+            - `type` - `video`, `playlist`, `channel` or `all` (the default of the server).
+            - `features` - e. g. `['hd', 'subtitles', 'creative_commons', '3d', 'live', 'purchased', '4k', '360', 'location', 'hdr']`.
+            - `region` - ISO 3166 country code.
+            - `max_in_flight` - the maximum number of pages requested at once.
+
+            ### Returns:
+            A list of `SearchVideo`, `SearchChannel` and `SearchPlaylist` objects (see `search_result`).
+        """
+
+        if features is not None and not isinstance(features, str):
+            features = ','.join(features)
+
+        params = {name: value for name, value in {'q': query, 'sort_by': sort_by, 'date': date, 'duration': duration, 'type': type, 'features': features, 'region': region}.items() if value is not None}
+        params = {**requests_kwargs.pop('params', {}), **params}
+
+        page_numbers = sorted(set(range(1, pages + 1) if isinstance(pages, int) else pages))
+        first_empty: t.Optional[int] = None
+
+        def pages_to_fetch() -> t.Iterator[int]:
+            for page in page_numbers:
+                # Consumed lazily, so pages after an empty one are not requested:
+                if first_empty is not None and page > first_empty:
+                    return
+
+                yield page
+
+        results: t.Dict[int, t.List[t.Dict[str, t.Any]]] = {}
+        errors: t.Dict[int, Exception] = {}
+
+        for page, items, error in iter_as_completed(lambda page: self._get_json('search', return_class=None, params={**params, 'page': page}, **requests_kwargs), pages_to_fetch(), max_in_flight):
+            if error is not None:
+                errors[page] = error
+
+            elif not items:
+                first_empty = page if first_empty is None else min(first_empty, page)
+
+            else:
+                results[page] = items
+
+        last_page = first_empty if first_empty is not None else float('inf')
+
+        for page in sorted(errors):
+            if page < last_page:
+                raise errors[page]
+
+        found: t.List[SearchResult] = []
+        seen: t.Set[t.Tuple[str, str]] = set()
+
+        for page in sorted(results):
+            if page > last_page:
+                break
+
+            for item in results[page]:
+                result = search_result(item)
+                result_id = getattr(result, 'result_id', None)
+
+                if result_id is not None:
+                    if (item.get('type'), result_id) in seen:
+                        continue
+
+                    seen.add((item.get('type'), result_id))
+
+                found.append(compact(result) if self.compact_models else result)
+
+        return found
 
 
     def get_dislike_count(self, video: t.Union[str, YoutubeVideo]) -> RYDData:
         """
-            Will make a request to https://returnyoutubedislikeapi.com to fetch dislike count data.
+            Will make a request to https://returnyoutubedislikeapi.com (or `ryd_url`) to fetch dislike count data.
 
             See https://returnyoutubedislike.com/ for more information about how to return
             dislikes to YouTube.
@@ -179,6 +931,85 @@ class InvidiousClient:
             There are per client rate limits in place of 100 per minute and 10 000 per day.
             This will return a 429 status code indicating that your application should back off.
             (see also https://github.com/Anarios/return-youtube-dislike#api-documentation)
+
+            These limits are enforced by the client's `rate_limiter` (if the daily limit is used up, `RateLimitExceededError` is raised).
+        """
+
+        return self._get_json(f"{self.ryd_url}/Votes?videoId={video.video_id if hasattr(video, 'video_id') else video}", return_class=RYDData, append_to_api=False)
+
+
+    def get_dislike_counts(self, videos: t.Iterable[t.Union[str, YoutubeVideo]], cache: t.Optional[RYDCache]=None, max_age: float=7 * 24 * 60 * 60, max_in_flight: int=4) -> DislikeBatch:
+        """
+            Fetches dislike count data of many videos (see `InvidiousClient.get_dislike_count`), within the rate limits of the API.
+
+            Data in the `cache` that is younger than `max_age` (by `RYDData.date_created`) is not fetched again.
+            The rest is fetched stalest first (not cached videos, then the oldest data), until the daily budget
+            (see `rate_limiter`) runs out - the IDs that were left out are in `DislikeBatch.skipped`.
+
+            ```python
+            batch = CLIENT.get_dislike_counts(video_ids, cache=RYDCache())
+
+            for video_id, data in batch.items():
+                print(video_id, data.dislikes)
+
+            print(f"Try again tomorrow: {batch.skipped}")
+            ```
+
+            ### Parameters:
+            - `videos` - video IDs or `YoutubeVideo` instances. Duplicates are fetched only once.
+            - `cache` - the `RYDCache` to use. If `None`, everything is fetched.
+            - `max_age` - the maximum age (in seconds) of cached data.
+            - `max_in_flight` - the maximum number of requests running at once.
         """
 
-        return self._get_json(f"https://returnyoutubedislikeapi.com/Votes?videoId={video.video_id if hasattr(video, 'video_id') else video}", return_class=RYDData, append_to_api=False)
+        ids = unique(video.video_id if hasattr(video, 'video_id') else video for video in videos)
+        batch = DislikeBatch(ids)
+
+        cached = cache.get_many(ids) if cache is not None else {}
+        now = time.time()
+
+        batch.results.update({video_id: data for video_id, data in cached.items() if staleness(data, now) <= max_age})
+        to_fetch = sorted((video_id for video_id in ids if video_id not in batch.results), key=lambda video_id: -staleness(cached.get(video_id), now))
+
+        for video_id, data, error in iter_as_completed(self.get_dislike_count, to_fetch, max_in_flight):
+            if isinstance(error, RateLimitExceededError):
+                batch.skipped.append(video_id)
+
+                if video_id in cached:
+                    batch.results[video_id] = cached[video_id]
+
+            elif error is not None:
+                batch.errors[video_id] = error
+
+            else:
+                batch.fetched.append(video_id)
+                batch.results[video_id] = data
+
+                if cache is not None:
+                    cache.set(video_id, data)
+
+        return batch
+
+
+
+def _flight_key_part(value: t.Any) -> t.Hashable:
+    """
+        Returns a hashable form of a `requests` argument (dictionaries, like `params` and `headers`, regardless of their order).
+    """
+
+    if isinstance(value, dict):
+        return tuple(sorted((str(name), str(item)) for name, item in value.items()))
+
+    return repr(value)
+
+
+
+def _labels(url: str) -> t.Tuple[str, str]:
+    """
+        Returns the `(host, endpoint template)` metric labels of a request URL.
+    """
+
+    host = urlsplit(url).hostname or ''
+    api_path = url.split('/api/v1/', 1)
+
+    return host, endpoint_template(api_path[1]) if len(api_path) == 2 else endpoint_template(url, append_to_api=False)
@@ -0,0 +1,229 @@
+import typing as t
+
+import hashlib
+import json
+import os
+import tempfile
+
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from .models.comments import Comments
+from .models.videos import YoutubeVideo
+from .pagination import prefetch
+
+if t.TYPE_CHECKING:
+    from .client import InvidiousClient
+
+
+
+class SeenSet:
+    """
+        Memory-compact set of seen comment IDs.
+
+        IDs are stored as 64-bit hashes in a sorted `array` (8 bytes per ID, instead of ~100 bytes for a `set` of strings).
+        New hashes go to a small buffer, which is merged into the array once it grows too large.
+        With 64-bit hashes, a false "already seen" is practically impossible (~1 in 10^8 for a million comments).
+    """
+
+    def __init__(self, hashes: t.Iterable[int]=()) -> None:
+        self._sorted = array('Q', sorted(set(hashes)))
+        self._pending: t.Set[int] = set()
+
+
+    @staticmethod
+    def hash(comment_id: str) -> int:
+        """
+            The 64-bit hash of a comment ID.
+        """
+
+        return int.from_bytes(hashlib.blake2b(comment_id.encode(), digest_size=8).digest(), 'little')
+
+
+    def _contains_hash(self, value: int) -> bool:
+        if value in self._pending:
+            return True
+
+        index = bisect_left(self._sorted, value)
+        return index < len(self._sorted) and self._sorted[index] == value
+
+
+    def add_hash(self, value: int) -> bool:
+        """
+            Adds a hash. Returns `False` if it was already in the set.
+        """
+
+        if self._contains_hash(value):
+            return False
+
+        self._pending.add(value)
+
+        if len(self._pending) > max(1024, len(self._sorted) // 8):
+            self._sorted = array('Q', sorted([*self._sorted, *self._pending]))
+            self._pending.clear()
+
+        return True
+
+
+    def add(self, comment_id: str) -> bool:
+        """
+            Adds a comment ID. Returns `False` if it was already seen.
+        """
+
+        return self.add_hash(self.hash(comment_id))
+
+
+    def __contains__(self, comment_id: str) -> bool:
+        return self._contains_hash(self.hash(comment_id))
+
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._pending)
+
+
+
+class CommentCrawl:
+    """
+        A resumable crawl of all comments of a video.
+
+        After each page, the continuation token and progress counters are saved to the `checkpoint` file
+        (and the hashes of the seen comment IDs to `<checkpoint>.seen`). If the process dies or a request fails,
+        create the crawl again with the same `checkpoint` - it continues from the last saved page.
+
+        Comments are deduplicated by `comment_id` (see `SeenSet`), because pages can overlap after a resume.
+        If the process dies in the middle of a page, that page is fetched again, and its comments that you have
+        already received are yielded again only if they were not saved yet (the crawl is at-least-once).
+
+        ```python
+        crawl = CommentCrawl(CLIENT, '9bZkp7q19f0', 'crawl.json')
+
+        for comment in crawl:
+            ...
+        ```
+
+        ### Parameters:
+        - `client` - the client to use.
+        - `video` - either a `str` of video ID or `YoutubeVideo` instance.
+        - `checkpoint` - path to the checkpoint file.
+        - `prefetch` - how many pages are fetched ahead (see `InvidiousClient.yield_all_comments`).
+        - `fields` - if set, the server sends only these fields (`comments(commentId)` and `continuation` are always requested).
+    """
+
+    def __init__(self, client: 'InvidiousClient', video: t.Union[str, YoutubeVideo], checkpoint: t.Union[str, Path], prefetch: int=1, fields: t.Optional[t.Union[str, t.Iterable[str]]]=None) -> None:
+        self.client = client
+        self.video_id: str = video.video_id if hasattr(video, 'video_id') else video
+        self.checkpoint = Path(checkpoint)
+        self.prefetch = prefetch
+
+        if fields is not None:
+            fields = fields if isinstance(fields, str) else ','.join(fields)
+            fields = f"{fields},comments(commentId),continuation"
+
+        self.fields: t.Optional[str] = fields
+
+        self.state: t.Dict[str, t.Any] = {'video_id': self.video_id, 'continuation': None, 'done': False, 'pages': 0, 'comments': 0, 'duplicates': 0, 'seen': 0}
+        """The progress: `continuation` of the next page, whether the crawl is `done`, and counters of `pages`, (new) `comments` and `duplicates`."""
+
+        self.seen = SeenSet()
+        """IDs of the comments that were already yielded."""
+
+        self._load()
+
+
+    @property
+    def seen_path(self) -> Path:
+        """
+            Path of the file with hashes of seen comment IDs.
+        """
+
+        return self.checkpoint.with_name(f"{self.checkpoint.name}.seen")
+
+
+    @property
+    def done(self) -> bool:
+        """
+            Whether all pages were crawled.
+        """
+
+        return self.state['done']
+
+
+    def _load(self) -> None:
+        if not self.checkpoint.exists():
+            return
+
+        with open(self.checkpoint, 'r', encoding='UTF-8') as file:
+            state = json.load(file)
+
+        if state.get('video_id') != self.video_id:
+            raise ValueError(f"The checkpoint {self.checkpoint} is for another video ({state.get('video_id')}).")
+
+        self.state.update(state)
+
+        # Hashes appended after the last saved checkpoint (if the process died in between) are ignored:
+        hashes = array('Q')
+
+        with open(self.seen_path, 'rb') as file:
+            hashes.frombytes(file.read(self.state['seen'] * hashes.itemsize))
+
+        self.seen = SeenSet(hashes)
+
+
+    def _save(self, new_hashes: t.List[int]) -> None:
+        self.checkpoint.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.seen_path, 'r+b' if self.seen_path.exists() else 'wb') as file:
+            file.seek(self.state['seen'] * 8)
+            array('Q', new_hashes).tofile(file)
+            file.truncate()
+
+        self.state['seen'] += len(new_hashes)
+
+        with tempfile.NamedTemporaryFile('w', encoding='UTF-8', dir=self.checkpoint.parent, suffix='.tmp', delete=False) as file:
+            json.dump(self.state, file)
+
+        os.replace(file.name, self.checkpoint)
+
+
+    def iter_pages(self) -> t.Iterator[t.List[Comments.Comment]]:
+        """
+            Yields lists of new (deduplicated) comments, page by page. The checkpoint is saved when you ask for the next page.
+        """
+
+        if self.done:
+            return
+
+        pages = self.client._iter_comment_pages(self.video_id, self.fields, self.state['continuation'])
+
+        for page in prefetch(pages, self.prefetch):
+            new_comments: t.List[Comments.Comment] = []
+            new_hashes: t.List[int] = []
+
+            for comment in page:
+                comment_hash = SeenSet.hash(comment.comment_id)
+
+                if self.seen.add_hash(comment_hash):
+                    new_comments.append(comment)
+                    new_hashes.append(comment_hash)
+
+                else:
+                    self.state['duplicates'] += 1
+
+            yield new_comments
+
+            self.state['pages'] += 1
+            self.state['comments'] += len(new_comments)
+            self.state['continuation'] = page.continuation
+            self.state['done'] = page.continuation is None
+
+            self._save(new_hashes)
+
+
+    def __iter__(self) -> t.Iterator[Comments.Comment]:
+        """
+            Yields the new (deduplicated) comments.
+        """
+
+        for comments in self.iter_pages():
+            yield from comments
@@ -0,0 +1,120 @@
+import typing as t
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from pathlib import Path
+
+from .models import RYDData
+from .batch import BatchResult
+from .registry import default_cache_dir
+
+
+
+RYD_URL = os.environ.get('INVIDIOUS_RYD_URL', 'https://returnyoutubedislikeapi.com')
+"""Base URL of the Return YouTube Dislike API (can be overridden with the `INVIDIOUS_RYD_URL` environment variable)."""
+
+
+
+class RYDCache:
+    """
+        Persistent (SQLite) cache of https://returnyoutubedislike.com/ data, by video ID.
+
+        ### Parameters:
+        - `path` - path to the database file. Defaults to `ryd.sqlite` in `default_cache_dir()`.
+    """
+
+    def __init__(self, path: t.Optional[t.Union[str, Path]]=None) -> None:
+        self.path = Path(path) if path is not None else default_cache_dir() / 'ryd.sqlite'
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS votes (video_id TEXT PRIMARY KEY, json TEXT, date_created REAL, fetched_at REAL)')
+
+
+    def get_many(self, video_ids: t.Iterable[str]) -> t.Dict[str, RYDData]:
+        """
+            Returns the cached data of the videos (videos that are not cached are left out).
+        """
+
+        video_ids = list(video_ids)
+        found: t.Dict[str, RYDData] = {}
+
+        # SQLite limits the number of query parameters:
+        for start in range(0, len(video_ids), 500):
+            chunk = video_ids[start:start + 500]
+
+            with self._lock:
+                rows = self._connection.execute(f"SELECT video_id, json FROM votes WHERE video_id IN ({', '.join('?' * len(chunk))})", chunk).fetchall()
+
+            for video_id, raw in rows:
+                found[video_id] = RYDData(json.loads(raw))
+
+        return found
+
+
+    def set(self, video_id: str, data: RYDData) -> None:
+        """
+            Caches the data of a video.
+        """
+
+        try:
+            date_created = data.date_created.timestamp()
+
+        except (TypeError, ValueError):
+            date_created = None
+
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO votes VALUES (?, ?, ?, ?)', (video_id, json.dumps(data.data), date_created, time.time()))
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM votes').fetchone()[0]
+
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+
+class DislikeBatch(BatchResult[str, RYDData]):
+    """
+        Results of `InvidiousClient.get_dislike_counts`.
+
+        `BatchResult.results` contains fresh data, and the cached (stale) data of `skipped` videos.
+    """
+
+    def __init__(self, keys: t.Iterable[str]) -> None:
+        super().__init__(keys)
+
+        self.skipped: t.List[str] = []
+        """IDs that were not fetched, because the rate limit (daily budget) ran out. They have stale cached data, or none."""
+
+        self.fetched: t.List[str] = []
+        """IDs that were fetched from the API (the rest was served from the cache)."""
+
+
+    def __repr__(self) -> str:
+        return f"<DislikeBatch {len(self.results)} ok, {len(self.fetched)} fetched, {len(self.skipped)} skipped, {len(self.errors)} failed>"
+
+
+
+def staleness(data: t.Optional[RYDData], now: t.Optional[float]=None) -> float:
+    """
+        How old (in seconds) the data is, by its `date_created`. Missing or invalid data is infinitely stale.
+    """
+
+    if data is None:
+        return float('inf')
+
+    try:
+        return (now or time.time()) - data.date_created.timestamp()
+
+    except (TypeError, ValueError):
+        return float('inf')
@@ -0,0 +1,34 @@
+import typing as t
+
+from urllib.parse import urlsplit
+
+
+
+_FIXED_SEGMENTS = {'trending', 'popular', 'search', 'stats', 'auth', 'mixes'}
+
+
+
+def endpoint_template(uri: str, append_to_api: bool=True) -> str:
+    """
+        Returns the endpoint template of a request, with IDs replaced by placeholders.
+
+        ### Examples:
+        - `endpoint_template('videos/dQw4w9WgXcQ')` -> `'videos/{id}'`
+        - `endpoint_template('comments/dQw4w9WgXcQ')` -> `'comments/{id}'`
+        - `endpoint_template('https://returnyoutubedislikeapi.com/Votes?videoId=dQw4w9WgXcQ', append_to_api=False)` -> `'returnyoutubedislikeapi.com/Votes'`
+    """
+
+    if not append_to_api:
+        parts = urlsplit(uri)
+        return f"{parts.hostname}{parts.path}"
+
+    segments: t.List[str] = [segment for segment in uri.split('?', 1)[0].split('/') if segment]
+
+    if not segments:
+        return ''
+
+    if segments[0] in _FIXED_SEGMENTS:
+        return '/'.join(segments)
+
+    # e. g. `channels/{id}/videos`:
+    return '/'.join([segments[0], '{id}', *segments[2:]][:len(segments)])
@@ -0,0 +1,50 @@
+class InvidiousClientError(Exception):
+    """
+        Base class for all errors raised by this package.
+    """
+
+
+
+class NoInstanceAvailableError(InvidiousClientError, LookupError):
+    """
+        Raised when no (accessible) Invidious instance could be chosen.
+    """
+
+
+
+class FieldNotProjectedError(InvidiousClientError, LookupError):
+    """
+        Raised when reading a field that was not requested with `fields=[...]` (so the server did not send it).
+    """
+
+
+
+class RateLimitExceededError(InvidiousClientError):
+    """
+        Raised when a request would have to wait longer than allowed for the rate limit of its host (see `RateLimiter`).
+    """
+
+    def __init__(self, host: str, wait: float) -> None:
+        super().__init__(f"Rate limit of {host} exceeded (the next request is allowed in {wait:.0f} s).")
+
+        self.host = host
+        """The rate limited host."""
+
+        self.wait = wait
+        """How long (in seconds) would the request have to wait."""
+
+
+
+class CassetteMissError(InvidiousClientError, LookupError):
+    """
+        Raised by `ReplayAdapter` when a request was not recorded in the cassette.
+    """
+
+    def __init__(self, method: str, url: str) -> None:
+        super().__init__(f"{method} {url} is not in the cassette.")
+
+        self.method = method
+        """The method of the request."""
+
+        self.url = url
+        """The URL of the request."""
@@ -0,0 +1,173 @@
+import typing as t
+
+import json
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .models.comments import Comments
+from .exceptions import FieldNotProjectedError
+
+
+
+COMMENT_COLUMNS: t.Tuple[str, ...] = (
+    'video_id',
+    'comment_id',
+    'author',
+    'author_id',
+    'author_url',
+    'author_is_channel_owner',
+    'content',
+    'published',
+    'published_text',
+    'is_edited',
+    'like_count',
+    'reply_count',
+    'reply_continuation',
+)
+"""Columns of exported comments (`Comment` properties, plus the `video_id`)."""
+
+
+_PARQUET_TYPES = {
+    'published': 'timestamp',
+    'author_is_channel_owner': 'bool',
+    'is_edited': 'bool',
+    'like_count': 'int64',
+    'reply_count': 'int64',
+}
+
+
+
+def comment_to_row(comment: Comments.Comment, video_id: t.Optional[str]=None) -> t.Dict[str, t.Any]:
+    """
+        Flattens a comment to a `dict` of `COMMENT_COLUMNS`. `published` is an aware datetime in UTC.
+    """
+
+    row: t.Dict[str, t.Any] = {'video_id': video_id}
+
+    for column in COMMENT_COLUMNS[1:]:
+        try:
+            if column == 'published':
+                # From the raw timestamp, `Comment.published` is in local time:
+                row[column] = datetime.fromtimestamp(comment.data.get('published'), tz=timezone.utc)
+
+            else:
+                row[column] = getattr(comment, column)
+
+        except (FieldNotProjectedError, TypeError):
+            # not requested, or missing timestamp
+            row[column] = None
+
+    return row
+
+
+
+def iter_comment_rows(pages: t.Iterable[t.Union[Comments, Comments.Comment]], video_id: t.Optional[str]=None) -> t.Iterator[t.Dict[str, t.Any]]:
+    """
+        Flattens comments to rows (see `comment_to_row`), as they arrive.
+
+        ### Parameters:
+        - `pages` - pages of comments (e. g. `InvidiousClient.yield_all_comments(video, low_memory=True)`), or single comments.
+        - `video_id` - the video ID for comments that are not in a page (pages have their own).
+    """
+
+    for item in pages:
+        if isinstance(item, Comments):
+            try:
+                page_video_id = item.video_id or video_id
+
+            except FieldNotProjectedError:
+                page_video_id = video_id
+
+            for comment in item:
+                yield comment_to_row(comment, page_video_id)
+
+        else:
+            yield comment_to_row(item, video_id)
+
+
+
+def export_comments_ndjson(pages: t.Iterable[t.Union[Comments, Comments.Comment]], file: t.Union[str, Path, t.TextIO], video_id: t.Optional[str]=None) -> int:
+    """
+        Writes comments as NDJSON (one JSON object per line), as the pages arrive. Returns the number of written comments.
+
+        `published` is written in ISO 8601 format (in UTC). Memory use does not depend on the number of comments.
+
+        ```python
+        export_comments_ndjson(CLIENT.yield_all_comments('9bZkp7q19f0', low_memory=True, prefetch=1), 'comments.ndjson')
+        ```
+
+        ### Parameters:
+        - `pages` - pages of comments, or single comments (see `iter_comment_rows`).
+        - `file` - path of the file (overwritten), or an open text file.
+        - `video_id` - the video ID for comments that are not in a page.
+    """
+
+    if isinstance(file, (str, Path)):
+        with open(file, 'w', encoding='UTF-8') as opened:
+            return export_comments_ndjson(pages, opened, video_id)
+
+    count = 0
+
+    for row in iter_comment_rows(pages, video_id):
+        if isinstance(row['published'], datetime):
+            row['published'] = row['published'].isoformat()
+
+        file.write(json.dumps(row, ensure_ascii=False))
+        file.write('\n')
+
+        count += 1
+
+    return count
+
+
+
+def export_comments_parquet(pages: t.Iterable[t.Union[Comments, Comments.Comment]], path: t.Union[str, Path], video_id: t.Optional[str]=None, row_group_size: int=10_000, compression: str='zstd') -> int:
+    """
+        Writes comments to a Parquet file, one row group per `row_group_size` comments, as the pages arrive.
+        Returns the number of written comments.
+
+        At most `row_group_size` comments are held in memory. Requires [pyarrow](https://arrow.apache.org/docs/python/):
+        `pip install invidious-api-client[parquet]`.
+
+        ### Parameters:
+        - `pages` - pages of comments, or single comments (see `iter_comment_rows`).
+        - `path` - path of the file (overwritten).
+        - `video_id` - the video ID for comments that are not in a page.
+        - `row_group_size` - the number of comments in a row group.
+        - `compression` - the Parquet compression codec.
+    """
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+    except ImportError as error: # pragma: no cover
+        raise ImportError("Exporting to Parquet requires pyarrow: pip install invidious-api-client[parquet]") from error
+
+    types = {'timestamp': pa.timestamp('s', tz='UTC'), 'bool': pa.bool_(), 'int64': pa.int64()}
+    schema = pa.schema([(column, types[_PARQUET_TYPES[column]] if column in _PARQUET_TYPES else pa.string()) for column in COMMENT_COLUMNS])
+
+    columns: t.Dict[str, t.List[t.Any]] = {column: [] for column in COMMENT_COLUMNS}
+    count = 0
+
+    with pq.ParquetWriter(str(path), schema, compression=compression) as writer:
+        def _flush() -> None:
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema), row_group_size=row_group_size)
+
+            for values in columns.values():
+                values.clear()
+
+        for row in iter_comment_rows(pages, video_id):
+            for column in COMMENT_COLUMNS:
+                columns[column].append(row[column])
+
+            count += 1
+
+            if count % row_group_size == 0:
+                _flush()
+
+        if columns['comment_id']:
+            _flush()
+
+    return count
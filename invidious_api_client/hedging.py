@@ -0,0 +1,124 @@
+import typing as t
+
+import threading
+
+from collections import deque
+from concurrent.futures import Future
+
+
+
+class HedgingPolicy:
+    """
+        Policy of hedged requests for `InvidiousClient` in `InstancePool` mode (pass it as `hedging`).
+
+        When a request runs longer than the `percentile` of recent latencies, a duplicate is sent to another instance.
+        The first response wins, and the other one is discarded. To keep the extra load bounded, at most `budget`
+        (e. g. `0.05` = 5 %) of requests are hedged.
+
+        ### Parameters:
+        - `percentile` - after which latency percentile (`0.0`-`1.0`) of recent requests is the hedge sent.
+        - `budget` - the maximum fraction of requests that are hedged.
+        - `min_samples` - no hedges are sent until this many latencies were observed.
+        - `min_delay` - the minimum delay (in seconds) before a hedge is sent.
+        - `window` - how many recent latencies are kept.
+    """
+
+    def __init__(self, percentile: float=0.95, budget: float=0.05, min_samples: int=20, min_delay: float=0.05, window: int=1000) -> None:
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+
+        self.requests = 0
+        """The number of requests that could have been hedged."""
+
+        self.fired = 0
+        """The number of sent hedges."""
+
+        self.won = 0
+        """The number of hedges that answered first."""
+
+        self._latencies: t.Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+
+    def delay(self) -> t.Optional[float]:
+        """
+            After how many seconds should a hedge be sent, or `None` if there are not enough samples yet.
+        """
+
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+
+            latencies = sorted(self._latencies)
+
+        return max(self.min_delay, latencies[min(len(latencies) - 1, int(len(latencies) * self.percentile))])
+
+
+    def record(self, latency: float) -> None:
+        """
+            Records the latency of a request.
+        """
+
+        with self._lock:
+            self.requests += 1
+            self._latencies.append(latency)
+
+
+    def try_fire(self) -> bool:
+        """
+            Counts a hedge, if the budget allows it (returns `False` otherwise).
+        """
+
+        with self._lock:
+            if self.fired + 1 > self.budget * max(self.requests, 1):
+                return False
+
+            self.fired += 1
+            return True
+
+
+    def record_win(self) -> None:
+        """
+            Counts a hedge that answered first.
+        """
+
+        with self._lock:
+            self.won += 1
+
+
+    @property
+    def stats(self) -> t.Dict[str, t.Union[int, float]]:
+        """
+            Counters: `requests`, `fired` and `won` hedges, and the fraction of requests that were hedged (`hedge_rate`).
+        """
+
+        return {'requests': self.requests, 'fired': self.fired, 'won': self.won, 'hedge_rate': self.fired / self.requests if self.requests else 0.0}
+
+
+    def __repr__(self) -> str:
+        return f"<HedgingPolicy p{self.percentile * 100:g} fired={self.fired} won={self.won}>"
+
+
+
+def start_thread(function: t.Callable[..., t.Any], *args: t.Any, **kwargs: t.Any) -> Future:
+    """
+        Calls `function(*args, **kwargs)` on a new daemon thread. Returns the `Future` of its result.
+
+        Unlike a thread pool, this never makes a request wait for a free worker.
+    """
+
+    future: Future = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(function(*args, **kwargs))
+
+        except BaseException as error:
+            future.set_exception(error)
+
+    future.set_running_or_notify_cancel()
+    threading.Thread(target=run, name='invidious-hedge', daemon=True).start()
+
+    return future
@@ -0,0 +1,64 @@
+import typing as t
+
+import json
+
+
+try:
+    import orjson
+
+except ImportError: # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+
+except ImportError: # pragma: no cover
+    msgspec = None
+
+
+
+JSONDecoder = t.Callable[[bytes], t.Any]
+"""A function that decodes JSON from the raw response body."""
+
+
+
+def decode_stdlib(content: bytes) -> t.Any:
+    """
+        Decodes JSON with the standard library (`json.loads` detects the encoding of the bytes by itself).
+    """
+
+    return json.loads(content)
+
+
+
+DECODERS: t.Dict[str, JSONDecoder] = {'json': decode_stdlib}
+"""Available JSON decoders, by name."""
+
+if orjson is not None:
+    DECODERS['orjson'] = orjson.loads
+
+if msgspec is not None:
+    DECODERS['msgspec'] = msgspec.json.Decoder().decode
+
+
+
+def get_decoder(decoder: t.Union[str, JSONDecoder]='auto') -> JSONDecoder:
+    """
+        Returns a JSON decoder.
+
+        ### Parameters:
+        - `decoder` - name of the decoder (`"orjson"`, `"msgspec"` or `"json"`), or a function that decodes `bytes`.
+          `"auto"` uses the fastest installed one ([orjson](https://github.com/ijl/orjson), then [msgspec](https://jcristharif.com/msgspec/),
+          then the standard library).
+    """
+
+    if callable(decoder):
+        return decoder
+
+    if decoder == 'auto':
+        return DECODERS.get('orjson') or DECODERS.get('msgspec') or decode_stdlib
+
+    if decoder not in DECODERS:
+        raise ValueError(f"Unknown or not installed JSON decoder: {decoder!r} (available: {', '.join(DECODERS)})")
+
+    return DECODERS[decoder]
@@ -0,0 +1,226 @@
+import typing as t
+
+import bisect
+import threading
+
+
+
+LATENCY_BUCKETS: t.Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Default histogram buckets (in seconds) of latencies and durations."""
+
+SIZE_BUCKETS: t.Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+"""Default histogram buckets (in bytes) of response sizes."""
+
+_Labels = t.Tuple[t.Tuple[str, str], ...]
+
+
+
+class MetricsHook:
+    """
+        Receives measurements from `InvidiousClient` (pass it, or a list of hooks, as `metrics`).
+
+        Subclass it and override the methods you are interested in, the default implementations do nothing.
+        Hooks are called from the threads that send the requests, so they have to be thread-safe and fast.
+
+        `endpoint` is the endpoint template of the request (see `endpoint_template`), e. g. `videos/{id}`.
+    """
+
+    def on_request(self, host: str, endpoint: str, status: t.Optional[int], latency: float, size: int) -> None:
+        """
+            Called after every HTTP request (including retries). `status` is `None` if the connection failed.
+        """
+
+
+    def on_retry(self, host: str, endpoint: str, reason: str) -> None:
+        """
+            Called when a request is sent again: `reason` is `rate_limited` (after `429`), `failover` (to another instance of the pool)
+            or `hedge` (a hedged request, see `HedgingPolicy`).
+        """
+
+
+    def on_decode(self, host: str, endpoint: str, duration: float) -> None:
+        """
+            Called after a response is decoded from JSON.
+        """
+
+
+    def on_model(self, endpoint: str, model: str, duration: float) -> None:
+        """
+            Called after a model (e. g. `YoutubeVideo`) is constructed from the decoded response.
+        """
+
+
+
+class Histogram:
+    """
+        A thread-unsafe cumulative histogram (guarded by `MetricsRegistry`).
+    """
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: t.Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+
+        if index < len(self.counts):
+            self.counts[index] += 1
+
+        self.sum += value
+        self.count += 1
+
+
+    def cumulative(self) -> t.Iterator[t.Tuple[str, int]]:
+        """
+            Yields `(le, cumulative count)` pairs, ending with `+Inf`.
+        """
+
+        total = 0
+
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield f"{bound:g}", total
+
+        yield '+Inf', self.count
+
+
+
+class MetricsRegistry(MetricsHook):
+    """
+        A built-in, in-process `MetricsHook` that aggregates the measurements into counters and histograms.
+
+        `to_prometheus()` exports them in the Prometheus text format, e. g. to serve them from a `/metrics` endpoint.
+
+        ### Parameters:
+        - `namespace` - the prefix of the metric names.
+        - `latency_buckets` - histogram buckets (in seconds) of request latencies and decode/model durations.
+        - `size_buckets` - histogram buckets (in bytes) of response sizes.
+    """
+
+    def __init__(self, namespace: str='invidious_client', latency_buckets: t.Sequence[float]=LATENCY_BUCKETS, size_buckets: t.Sequence[float]=SIZE_BUCKETS) -> None:
+        self.namespace = namespace
+        self.latency_buckets = latency_buckets
+        self.size_buckets = size_buckets
+
+        self._histograms: t.Dict[str, t.Dict[_Labels, Histogram]] = {}
+        self._counters: t.Dict[str, t.Dict[_Labels, float]] = {}
+        self._lock = threading.Lock()
+
+
+    def observe(self, name: str, labels: t.Dict[str, str], value: float, buckets: t.Optional[t.Sequence[float]]=None) -> None:
+        """
+            Observes a value of the histogram `name`.
+        """
+
+        key = tuple(labels.items())
+
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+
+            if histogram is None:
+                histogram = series[key] = Histogram(self.latency_buckets if buckets is None else buckets)
+
+            histogram.observe(value)
+
+
+    def increment(self, name: str, labels: t.Dict[str, str], amount: float=1) -> None:
+        """
+            Increments the counter `name`.
+        """
+
+        key = tuple(labels.items())
+
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+
+    def histogram(self, name: str, **labels: str) -> t.Optional[Histogram]:
+        """
+            Returns the histogram `name` with the given labels, or `None` if nothing was observed.
+        """
+
+        return self._histograms.get(name, {}).get(tuple(labels.items()))
+
+
+    def counter(self, name: str, **labels: str) -> float:
+        """
+            Returns the value of the counter `name` with the given labels.
+        """
+
+        return self._counters.get(name, {}).get(tuple(labels.items()), 0)
+
+
+    def on_request(self, host: str, endpoint: str, status: t.Optional[int], latency: float, size: int) -> None:
+        self.increment('requests_total', {'host': host, 'endpoint': endpoint, 'status': 'error' if status is None else str(status)})
+        self.observe('request_duration_seconds', {'host': host, 'endpoint': endpoint}, latency)
+
+        if status is not None:
+            self.observe('response_size_bytes', {'host': host, 'endpoint': endpoint}, size, self.size_buckets)
+
+
+    def on_retry(self, host: str, endpoint: str, reason: str) -> None:
+        self.increment('retries_total', {'host': host, 'endpoint': endpoint, 'reason': reason})
+
+
+    def on_decode(self, host: str, endpoint: str, duration: float) -> None:
+        self.observe('decode_duration_seconds', {'host': host, 'endpoint': endpoint}, duration)
+
+
+    def on_model(self, endpoint: str, model: str, duration: float) -> None:
+        self.observe('model_duration_seconds', {'endpoint': endpoint, 'model': model}, duration)
+
+
+    def to_prometheus(self) -> str:
+        """
+            Returns the metrics in the Prometheus text exposition format (version 0.0.4).
+        """
+
+        lines: t.List[str] = []
+
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {self.namespace}_{name} counter")
+
+                for labels, value in series.items():
+                    lines.append(f"{self.namespace}_{name}{_format_labels(labels)} {value:g}")
+
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {self.namespace}_{name} histogram")
+
+                for labels, histogram in series.items():
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{self.namespace}_{name}_bucket{_format_labels(labels + (('le', bound),))} {count}")
+
+                    lines.append(f"{self.namespace}_{name}_sum{_format_labels(labels)} {histogram.sum:g}")
+                    lines.append(f"{self.namespace}_{name}_count{_format_labels(labels)} {histogram.count}")
+
+        return '\n'.join(lines) + '\n'
+
+
+    def clear(self) -> None:
+        """
+            Removes all measurements.
+        """
+
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ''
+
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
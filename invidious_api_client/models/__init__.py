@@ -1,5 +1,7 @@
 import typing as t
 
+import re
+
 from datetime import datetime
 
 
@@ -9,10 +11,42 @@ class BaseInvidiousData:
         Base Invidious JSON data class.
     """
 
+    __slots__ = ('data', '_memo', '__weakref__')
+
     def __init__(self, data: t.Union[dict, list] = {}) -> None:
         self.data = data
         """The data of the object."""
 
+        self._memo: t.Optional[t.Dict[str, t.Any]] = None
+
+
+    @property
+    def projected_fields(self) -> t.Optional[t.List[str]]:
+        """
+            Names of the (JSON) fields that were requested with `fields=[...]`, or `None` if the model holds all fields.
+
+            Reading a property backed by another field raises `FieldNotProjectedError`.
+        """
+
+        projection = getattr(self.data, 'projection', None)
+        return list(projection) if projection is not None else None
+
+
+    def _memoized(self, name: str, factory: t.Callable[[], t.Any]) -> t.Any:
+        """
+            Returns the result of `factory()`, which is called only on the first access of `name`.
+
+            Used for nested collections, so they are materialized (wrapped in model objects) only once.
+        """
+
+        if self._memo is None:
+            self._memo = {}
+
+        if name not in self._memo:
+            self._memo[name] = factory()
+
+        return self._memo[name]
+
 
 
 class RYDData(BaseInvidiousData):
@@ -20,6 +54,8 @@ class RYDData(BaseInvidiousData):
             https://returnyoutubedislike.com/ data.
         """
 
+        __slots__ = ()
+
         @property
         def id(self) -> str:
             """
@@ -35,7 +71,17 @@ class RYDData(BaseInvidiousData):
                 When was the dislike data created/updated.
             """
 
-            return datetime.fromisoformat(self.data.get('dateCreated'))
+            raw: str = self.data.get('dateCreated')
+
+            # e. g. `2021-12-02T18:02:48.7011498Z` - older Pythons don't parse the `Z` suffix or more than 6 fractional digits:
+            match = re.match(r'^(.*?T[\d:]+)(\.\d+)?(Z|[+-][\d:]+)?$', raw)
+
+            if match is not None:
+                fraction = f".{match.group(2)[1:7]:0<6}" if match.group(2) else ''  # exactly 6 digits
+                zone = '+00:00' if match.group(3) in (None, 'Z') else match.group(3)
+                raw = f"{match.group(1)}{fraction}{zone}"
+
+            return datetime.fromisoformat(raw)
 
 
         @property
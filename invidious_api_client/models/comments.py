@@ -3,6 +3,7 @@ import typing as t
 from datetime import datetime
 
 from invidious_api_client.models import BaseInvidiousData
+from invidious_api_client.models.projection import ProjectedDict
 
 
 
@@ -11,6 +12,8 @@ class Comments(BaseInvidiousData):
         Data of comments for a video.
     """
 
+    __slots__ = ()
+
     @property
     def continuation(self) -> str:
         """
@@ -39,6 +42,8 @@ class Comments(BaseInvidiousData):
 
 
     class Comment(BaseInvidiousData):
+        __slots__ = ()
+
         @property
         def author(self) -> str:
             """
@@ -54,6 +59,8 @@ class Comments(BaseInvidiousData):
                 Data of the comment author's profile picture/thumbnail.
             """
 
+            __slots__ = ()
+
             @property
             def url(self) -> str:
                 """
@@ -88,7 +95,7 @@ class Comments(BaseInvidiousData):
                 The comment author's thumbnails.
             """
 
-            return [self.CommentAuthorThumbnail(data=thumbnail) for thumbnail in self.data.get('authorThumbnails')]
+            return self._memoized('author_thumbnails', lambda: [self.CommentAuthorThumbnail(data=thumbnail) for thumbnail in self.data.get('authorThumbnails')])
 
 
 
@@ -192,6 +199,8 @@ class Comments(BaseInvidiousData):
                 Data of the comment creator's heart (when someone hearts your comment).
             """
 
+            __slots__ = ()
+
             @property
             def creator_thumbnail(self) -> str:
                 """
@@ -243,7 +252,8 @@ class Comments(BaseInvidiousData):
             """
                 The unique continuation token for the replies.
                 
-                You can then pass this to `InvidiousClient.get_comments(continuation=...)` to get the replies.
+                You can then pass this to `InvidiousClient.get_comments(video, params={'continuation': ...})` to get the replies,
+                or use `InvidiousClient.get_replies`/`InvidiousClient.expand_replies`.
             """
 
             return self.replies_data.get('replyContinuation') if self.replies_data else None
@@ -254,9 +264,11 @@ class Comments(BaseInvidiousData):
     def comments(self) -> t.List[Comment]:
         """
             The comments.
+
+            The list is created on the first access and then reused.
         """
 
-        return [self.Comment(data=comment) for comment in self.data.get('comments')]
+        return self._memoized('comments', lambda: [self.Comment(data=comment) for comment in self.data.get('comments', [])])
 
 
     def __iter__(self) -> t.Iterator[Comment]:
@@ -264,5 +276,31 @@ class Comments(BaseInvidiousData):
             Iterates over all comments.
         """
 
-        for comment in self.comments:
-            yield comment
+        return iter(self.comments)
+
+
+    def __len__(self) -> int:
+        """
+            The number of comments on this page.
+        """
+
+        raw = self.data.get('comments') if self.data is not None else self.comments
+        return len(raw or [])
+
+
+    def release(self) -> None:
+        """
+            Releases the raw comments of this page (the `Comment` objects you kept are not affected).
+
+            After this, the page has no comments, but `continuation`, `comment_count` and `video_id` are still available.
+        """
+
+        if isinstance(self.data, ProjectedDict):
+            # Keeps the projection, so unrequested fields still raise `FieldNotProjectedError`:
+            self.data = self.data.without('comments')
+
+        elif self.data is not None:
+            # A new dict, so the (possibly cached/shared) response is not modified:
+            self.data = {key: value for key, value in self.data.items() if key != 'comments'}
+
+        self._memo = None
@@ -0,0 +1,109 @@
+import typing as t
+
+from invidious_api_client.models import BaseInvidiousData
+from invidious_api_client.exceptions import FieldNotProjectedError
+
+
+
+_M = t.TypeVar('_M', bound=BaseInvidiousData)
+
+_COMPACT_CLASSES: t.Dict[t.Type[BaseInvidiousData], t.Type[BaseInvidiousData]] = {}
+
+
+
+def model_fields(model_class: t.Type[BaseInvidiousData]) -> t.List[str]:
+    """
+        Returns the names of the declared fields (properties) of a model class.
+    """
+
+    fields: t.Dict[str, None] = {}
+
+    for klass in model_class.__mro__:
+        if klass in (BaseInvidiousData, object):
+            continue
+
+        for name, value in vars(klass).items():
+            if isinstance(value, property):
+                fields.setdefault(name)
+
+    return list(fields)
+
+
+
+def compact_class(model_class: t.Type[_M]) -> t.Type[_M]:
+    """
+        Returns the compact variant of a model class (created once, then cached).
+
+        It is a subclass of `model_class` (so `isinstance` checks and methods keep working),
+        where every field is a `__slots__` attribute instead of a property reading the raw `data`.
+    """
+
+    if getattr(model_class, '__compact__', False):
+        return model_class
+
+    compact = _COMPACT_CLASSES.get(model_class)
+
+    if compact is None:
+        compact = _COMPACT_CLASSES[model_class] = type(f"Compact{model_class.__name__}", (model_class,), {
+            '__slots__': tuple(model_fields(model_class)),
+            '__compact__': True,
+            '__module__': model_class.__module__,
+            '__qualname__': f"{model_class.__qualname__}.Compact",
+            '__doc__': model_class.__doc__,
+        })
+
+    return compact
+
+
+
+def _compact_value(value: t.Any) -> t.Any:
+    if isinstance(value, BaseInvidiousData):
+        return compact(value)
+
+    if isinstance(value, list) and value and isinstance(value[0], BaseInvidiousData):
+        return [compact(item) for item in value]
+
+    return value
+
+
+
+def compact(model: _M) -> _M:
+    """
+        Converts a model to its compact variant (see `compact_class`).
+
+        All fields are read once (nested models are converted too), and the raw `data` is released.
+        Compact models use much less memory, which matters when you hold millions of them (see `benchmarks/bench_model_memory.py`).
+
+        Fields whose raw value is missing or invalid (e. g. `published` of a comment without a timestamp) are `None`.
+        Fields that were not requested (with `fields=[...]`) are not set, so reading them raises `AttributeError`.
+
+        ```python
+        video = compact(CLIENT.get_video('dQw4w9WgXcQ'))
+        video.title # same as before
+        video.data # None
+        ```
+    """
+
+    compact_model_class = compact_class(type(model))
+
+    if type(model) is compact_model_class:
+        return model
+
+    compact_model = compact_model_class.__new__(compact_model_class)
+
+    for name in compact_model_class.__slots__:
+        try:
+            value = _compact_value(getattr(model, name))
+
+        except FieldNotProjectedError:
+            continue
+
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+            value = None
+
+        setattr(compact_model, name, value)
+
+    compact_model.data = None
+    compact_model._memo = None
+
+    return compact_model
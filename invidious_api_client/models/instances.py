@@ -1,11 +1,17 @@
 import typing as t
 
 import requests
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from datetime import datetime
-from functools import lru_cache
+from collections import OrderedDict
+from functools import wraps
 
 from invidious_api_client.models import BaseInvidiousData
+from invidious_api_client.exceptions import NoInstanceAvailableError
+from invidious_api_client.registry import RegistryCache, DEFAULT_REGISTRY_CACHE, INSTANCES_URL
 
 
 
@@ -14,12 +20,16 @@ class Instance(BaseInvidiousData):
         Invidious instance data.
     """
 
+    __slots__ = ()
+
 
     class InstanceStats(BaseInvidiousData):
         """
             Invidious instance stats.
         """
 
+        __slots__ = ()
+
 
         @property
         def version(self) -> str:
@@ -206,6 +216,8 @@ class Instance(BaseInvidiousData):
             Instance's UptimeRobot monitor data.
         """
 
+        __slots__ = ()
+
 
         @property
         def monitor_id(self) -> str:
@@ -267,6 +279,8 @@ class Instance(BaseInvidiousData):
                 Monitor's uptime ratio.
             """
 
+            __slots__ = ()
+
 
             @property
             def ratio(self) -> t.Optional[float]:
@@ -302,7 +316,7 @@ class Instance(BaseInvidiousData):
                 Returns the monitor's daily ratios.
             """
 
-            return [self._Ratio(data) for data in self.data.get('dailyRatios', [])]
+            return self._memoized('daily_ratios', lambda: [self._Ratio(data) for data in self.data.get('dailyRatios', [])])
 
 
         @property
@@ -344,6 +358,8 @@ class InstancesList(BaseInvidiousData):
         Invidious API Instances List class.
     """
 
+    __slots__ = ()
+
 
     def __iter__(self) -> t.Iterator[Instance]:
         """
@@ -359,28 +375,209 @@ class InstancesList(BaseInvidiousData):
             Get instances list.
         """
 
-        return [Instance(raw_instance) for raw_instance in self.data]
+        return self._memoized('instances', lambda: [Instance(raw_instance) for raw_instance in self.data])
 
 
 
-def get_instances(*args, **kwargs) -> InstancesList:
+def get_instances(*args, cache: t.Optional[RegistryCache]=DEFAULT_REGISTRY_CACHE, url: t.Optional[str]=None, **kwargs) -> InstancesList:
     """
         Obtains all instances as `InstancesList`.
 
         `*args` and `**kwargs` are passed to `requests.get`.
+
+        ### Parameters:
+        - `cache` - the `RegistryCache` to use. By default, the registry is cached on disk for an hour (see `RegistryCache`).
+          If `None`, the registry is always downloaded.
+        - `url` - URL of the registry. Defaults to the cache's URL (or `INSTANCES_URL`, without a cache).
     """
 
-    response = requests.get('https://api.invidious.io/instances.json', *args, **kwargs)
+    if cache is not None:
+        return InstancesList(cache.fetch(*args, url=url, **kwargs))
+
+    response = requests.get(INSTANCES_URL if url is None else url, *args, **kwargs)
     response.raise_for_status()
 
     return InstancesList(response.json())
 
 
 
-@lru_cache(maxsize=3)
-def choose_instance(prefer_country_codes: t.Optional[t.List[str]]=None, no_onions: bool=True, only_accessible: bool=True) -> Instance:
+PROBE_PATH = '/api/v1/videos/dQw4w9WgXcQ'
+"""The API path that is requested (`HEAD`) to check whether an instance's API is accessible."""
+
+
+
+class InstanceProbe(t.NamedTuple):
+    """
+        Result of probing an instance.
+    """
+
+    instance: Instance
+    """The probed instance."""
+
+    latency: float
+    """How long did the instance take to answer (in seconds)."""
+
+
+
+def probe_instance(instance: Instance, timeout: float=3.0) -> t.Optional[float]:
+    """
+        Checks whether the instance's API is accessible.
+
+        Returns the latency (in seconds), or `None` if the instance is not accessible (or did not answer in `timeout` seconds).
+    """
+
+    start = time.perf_counter()
+
+    try:
+        response = requests.head(f"{instance.uri.strip('/')}{PROBE_PATH}", timeout=timeout)
+
+    except requests.RequestException:
+        return None
+
+    if response.status_code != 200:
+        return None
+
+    return time.perf_counter() - start
+
+
+
+def probe_instances(instances: t.Iterable[Instance], best_n: t.Optional[int]=1, probe_timeout: float=3.0, deadline: float=10.0, max_workers: int=16) -> t.List[InstanceProbe]:
+    """
+        Probes many instances at once and returns the accessible ones, sorted by latency (fastest first).
+
+        ### Parameters:
+        - `instances` - the instances to probe.
+        - `best_n` - return as soon as this many instances answered. If `None`, waits for all instances (or the deadline).
+        - `probe_timeout` - timeout of a single probe (in seconds).
+        - `deadline` - the total time limit for probing (in seconds). Instances that did not answer by then are skipped.
+        - `max_workers` - how many instances are probed at once.
+    """
+
+    instances = [instance for instance in instances if instance.uri]
+    results: t.List[InstanceProbe] = []
+
+    if not instances:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(instances)), thread_name_prefix='invidious-probe')
+    futures = {executor.submit(probe_instance, instance, probe_timeout): instance for instance in instances}
+
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            latency = future.result()
+
+            if latency is not None:
+                results.append(InstanceProbe(futures[future], latency))
+
+                if best_n is not None and len(results) >= best_n:
+                    break
+
+    except FuturesTimeoutError:
+        pass
+
+    finally:
+        # Don't wait for the slow ones - they will finish (or time out) in the background:
+        for future in futures:
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+    return sorted(results, key=lambda probe: probe.latency)
+
+
+
+def choose_instances(count: int=1, prefer_country_codes: t.Optional[t.Iterable[str]]=None, no_onions: bool=True, only_accessible: bool=True, probe_timeout: float=3.0, deadline: float=10.0, registry_url: t.Optional[str]=None) -> t.List[Instance]:
+    """
+        Chooses up to `count` instances to use, fastest first.
+
+        See `choose_instance` for the description of parameters. `registry_url` is the URL of the instances registry (see `get_instances`).
     """
-        Chooses the first instance in the API to use.
+
+    deadline_at = time.monotonic() + deadline
+
+    # The registry download counts towards the deadline as well:
+    candidates = [instance for instance in get_instances(params={'sort_by': 'health'}, url=registry_url, timeout=deadline).instances if not (no_onions and instance.type == 'onion')]
+
+    preferred: t.List[Instance] = candidates
+    others: t.List[Instance] = []
+
+    if prefer_country_codes is not None:
+        codes = {code.lower() for code in prefer_country_codes}
+
+        preferred = [instance for instance in candidates if instance.region is not None and instance.region.lower() in codes]
+        others = [instance for instance in candidates if instance not in preferred]
+
+    if not only_accessible:
+        return (preferred + others)[:count]
+
+    # Instances in the preferred countries are probed first, the rest only if there are not enough of them:
+    chosen = [probe.instance for probe in probe_instances(preferred, best_n=count, probe_timeout=probe_timeout, deadline=max(deadline_at - time.monotonic(), 0.0))]
+
+    remaining = deadline_at - time.monotonic()
+
+    if len(chosen) < count and others and remaining > 0:
+        chosen += [probe.instance for probe in probe_instances(others, best_n=count - len(chosen), probe_timeout=probe_timeout, deadline=remaining)]
+
+    return chosen
+
+
+
+_Chooser = t.TypeVar('_Chooser', bound=t.Callable[..., t.Optional[Instance]])
+
+
+
+def _cache_chosen(maxsize: int) -> t.Callable[[_Chooser], _Chooser]:
+    """
+        Caches the instances chosen by the decorated `choose_instance` (up to `maxsize` of them, by arguments).
+
+        Unlike `functools.lru_cache`, a failed choice (`None`) is not cached, so the next call tries again.
+        The wrapper has a `cache_clear()` method.
+    """
+
+    def decorator(function: _Chooser) -> _Chooser:
+        cache: 'OrderedDict[t.Tuple[t.Any, ...], Instance]' = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(function)
+        def wrapper(prefer_country_codes: t.Optional[t.Iterable[str]]=None, no_onions: bool=True, only_accessible: bool=True, probe_timeout: float=3.0, deadline: float=10.0) -> t.Optional[Instance]:
+            if prefer_country_codes is not None:
+                prefer_country_codes = tuple(sorted({code.upper() for code in prefer_country_codes}))
+
+            key = (prefer_country_codes, no_onions, only_accessible, probe_timeout, deadline)
+
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+
+            instance = function(*key)
+
+            if instance is not None:
+                with lock:
+                    cache[key] = instance
+
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+
+            return instance
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return t.cast(_Chooser, wrapper)
+
+    return decorator
+
+
+
+@_cache_chosen(maxsize=3)
+def choose_instance(prefer_country_codes: t.Optional[t.Iterable[str]]=None, no_onions: bool=True, only_accessible: bool=True, probe_timeout: float=3.0, deadline: float=10.0) -> t.Optional[Instance]:
+    """
+        Chooses the fastest accessible instance in the API to use.
+
+        Instances are probed concurrently, and this returns as soon as the first accessible one answers.
 
         ### Warning:
 
@@ -388,18 +585,81 @@ def choose_instance(prefer_country_codes: t.Optional[t.List[str]]=None, no_onion
 
         ### Parameters:
         - `no_onions` - If `True`, Tor instances will be excluded.
-        - `prefer_country_codes` - A list of country codes to prefer (for lower ping). Common ones: `['NL', 'DE']`, `['US']`
+        - `prefer_country_codes` - A list of country codes to prefer (for lower ping). Common ones: `['NL', 'DE']`, `['US']`.
+          Instances from other countries are only used when none of the preferred ones is accessible.
         - `only_accessible` - If `True`, only instances with accessible API will be returned.
+        - `probe_timeout` - timeout of a single accessibility check (in seconds).
+        - `deadline` - the total time limit for checking the instances (in seconds).
+
+        Returns `None` if no instance is available.
+
+        The chosen instance is cached in memory (use `choose_instance.cache_clear()` to choose again).
+        `None` is not cached, so after a failure the next call checks the instances again.
     """
 
-    for instance in get_instances(params={'sort_by': 'health'}).instances:
-        if only_accessible and requests.head(f"{instance.uri.strip('/')}/api/v1/videos/dQw4w9WgXcQ").status_code != 200:
-            continue
+    chosen = choose_instances(1, prefer_country_codes=prefer_country_codes, no_onions=no_onions, only_accessible=only_accessible, probe_timeout=probe_timeout, deadline=deadline)
+    return chosen[0] if chosen else None
+
+
+
+class LazyInstance:
+    """
+        An instance that is chosen on first use, instead of when it is created.
+
+        Nothing is fetched until `LazyInstance.resolve()` is called (`InvidiousClient` does that on its first request).
+        The chosen instance is then cached, so a single `LazyInstance` can be shared between many clients.
+
+        ### Parameters:
+        - `**choose_kwargs` - keyword arguments to pass to `choose_instance`.
+    """
+
+    def __init__(self, **choose_kwargs) -> None:
+        self.choose_kwargs = choose_kwargs
+        """Keyword arguments passed to `choose_instance`."""
+
+        self._instance: t.Optional[Instance] = None
+        self._lock = threading.Lock()
+
+
+    @property
+    def resolved(self) -> bool:
+        """
+            Whether the instance was already chosen.
+        """
+
+        return self._instance is not None
+
+
+    def resolve(self) -> Instance:
+        """
+            Chooses the instance (only on the first call) and returns it.
+
+            ### Raises:
+            - `NoInstanceAvailableError` - if no instance could be chosen.
+        """
+
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    instance = choose_instance(**self.choose_kwargs)
+
+                    if instance is None:
+                        raise NoInstanceAvailableError("No accessible Invidious instance was found.")
+
+                    self._instance = instance
+
+        return self._instance
+
+
+    def reset(self) -> None:
+        """
+            Forgets the chosen instance, so the next `LazyInstance.resolve()` chooses again.
+        """
+
+        with self._lock:
+            self._instance = None
 
-        if no_onions and instance.type == 'onion':
-            continue
 
-        if (prefer_country_codes is not None) and (instance.region is not None) and (instance.region.lower() in prefer_country_codes):
-            return instance
 
-        return instance
+DEFAULT_INSTANCE = LazyInstance()
+"""The `LazyInstance` shared by all clients created without an explicit `instance`."""
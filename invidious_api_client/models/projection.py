@@ -0,0 +1,179 @@
+import typing as t
+
+from invidious_api_client.exceptions import FieldNotProjectedError
+
+
+
+Projection = t.Dict[str, t.Optional['Projection']]
+"""Parsed `fields`: requested field names, mapped to the projection of their sub-fields (or `None` for the whole value)."""
+
+
+
+def _merge(projection: Projection, name: str, children: t.Optional[Projection]) -> None:
+    if name in projection and (projection[name] is None or children is None):
+        projection[name] = None
+
+    elif name in projection:
+        for child_name, grandchildren in children.items():
+            _merge(projection[name], child_name, grandchildren)
+
+    else:
+        projection[name] = children
+
+
+
+def _parse_list(fields: str, index: int) -> t.Tuple[Projection, int]:
+    projection: Projection = {}
+
+    while index < len(fields) and fields[index] != ')':
+        name, children, index = _parse_item(fields, index)
+
+        if name:
+            _merge(projection, name, children)
+
+        if index < len(fields) and fields[index] == ',':
+            index += 1
+
+    return projection, index
+
+
+def _parse_item(fields: str, index: int) -> t.Tuple[str, t.Optional[Projection], int]:
+    start = index
+
+    while index < len(fields) and fields[index] not in ',()/':
+        index += 1
+
+    name = fields[start:index].strip()
+    children: t.Optional[Projection] = None
+
+    if index < len(fields) and fields[index] == '/':
+        child_name, grandchildren, index = _parse_item(fields, index + 1)
+        children = {child_name: grandchildren}
+
+    elif index < len(fields) and fields[index] == '(':
+        children, index = _parse_list(fields, index + 1)
+
+        if index >= len(fields) or fields[index] != ')':
+            raise ValueError(f"Unbalanced parentheses in fields: {fields!r}")
+
+        index += 1
+
+    return name, children, index
+
+
+
+def parse_fields(fields: t.Union[str, t.Iterable[str]]) -> Projection:
+    """
+        Parses the `fields` syntax of the API (e. g. `"title,videoId,videoThumbnails(url,width)"`, or `"a/b"` for `"a(b)"`).
+
+        `fields` can also be a list of such strings (e. g. `['title', 'videoThumbnails(url)']`).
+    """
+
+    raw = fields if isinstance(fields, str) else ','.join(fields)
+    projection, index = _parse_list(raw, 0)
+
+    if index != len(raw):
+        raise ValueError(f"Unbalanced parentheses in fields: {raw!r}")
+
+    return projection
+
+
+
+def format_fields(fields: t.Union[str, t.Iterable[str]]) -> str:
+    """
+        Formats `fields` for the `fields` query parameter.
+    """
+
+    return fields if isinstance(fields, str) else ','.join(fields)
+
+
+
+class ProjectedDict(dict):
+    """
+        Raw JSON data of a projected response (requested with `fields`).
+
+        Reading a field that was not requested raises `FieldNotProjectedError`, instead of silently returning `None`.
+        Nested objects are wrapped in `ProjectedDict`s (with the projection of their sub-fields) on their first access only.
+    """
+
+    __slots__ = ('projection', '_wrapped')
+
+    def __init__(self, data: t.Dict[str, t.Any], projection: Projection) -> None:
+        super().__init__(data)
+
+        self.projection = projection
+        """The requested fields."""
+
+        self._wrapped: t.Set[str] = set()
+
+
+    def _wrap(self, key: str, value: t.Any) -> t.Any:
+        children = self.projection[key]
+
+        if children is None or key in self._wrapped:
+            return value
+
+        if isinstance(value, dict):
+            value = ProjectedDict(value, children)
+
+        elif isinstance(value, list):
+            value = [ProjectedDict(item, children) if isinstance(item, dict) else item for item in value]
+
+        else:
+            return value
+
+        # This dict is a copy of the response, so the wrapped value can replace the raw one:
+        super().__setitem__(key, value)
+        self._wrapped.add(key)
+
+        return value
+
+
+    def _check(self, key: str) -> None:
+        if key not in self.projection:
+            raise FieldNotProjectedError(f"Field {key!r} was not requested (requested fields: {', '.join(self.projection)})")
+
+
+    def get(self, key: str, default: t.Any=None) -> t.Any:
+        self._check(key)
+        return self._wrap(key, super().__getitem__(key)) if super().__contains__(key) else default
+
+
+    def __getitem__(self, key: str) -> t.Any:
+        self._check(key)
+        return self._wrap(key, super().__getitem__(key))
+
+
+    def items(self) -> t.List[t.Tuple[str, t.Any]]:
+        """
+            The requested fields and their (wrapped) values. Fields the server sent without being asked for are left out.
+        """
+
+        return [(key, self[key]) for key in super().keys() if key in self.projection]
+
+
+    def values(self) -> t.List[t.Any]:
+        return [value for _, value in self.items()]
+
+
+    def without(self, *keys: str) -> 'ProjectedDict':
+        """
+            Returns a copy without the given fields (that keeps the projection, so they are still known to be requested).
+        """
+
+        copy = ProjectedDict({key: value for key, value in super().items() if key not in keys}, self.projection)
+        copy._wrapped = self._wrapped - set(keys)
+
+        return copy
+
+
+
+def project(data: t.Any, fields: t.Union[str, t.Iterable[str], Projection]) -> t.Any:
+    """
+        Wraps the raw JSON `data` of a response that was requested with `fields` in a `ProjectedDict`.
+    """
+
+    if not isinstance(data, dict):
+        return data
+
+    return ProjectedDict(data, fields if isinstance(fields, dict) else parse_fields(fields))
@@ -0,0 +1,233 @@
+import typing as t
+
+from invidious_api_client.models import BaseInvidiousData
+from invidious_api_client.models.videos import YoutubeVideo
+
+
+
+class SearchVideo(YoutubeVideo):
+    """
+        A video in search results.
+    """
+
+    __slots__ = ()
+
+    @property
+    def result_id(self) -> str:
+        """
+            The ID that identifies the result (the video ID).
+        """
+
+        return self.video_id
+
+
+    @property
+    def author(self) -> str:
+        """
+            The name of the channel that uploaded the video.
+        """
+
+        return self.data.get('author')
+
+
+    @property
+    def author_id(self) -> str:
+        """
+            The ID of the channel that uploaded the video.
+        """
+
+        return self.data.get('authorId')
+
+
+    @property
+    def view_count(self) -> int:
+        """
+            The number of views.
+        """
+
+        return self.data.get('viewCount')
+
+
+    @property
+    def length_seconds(self) -> int:
+        """
+            The length of the video (in seconds).
+        """
+
+        return self.data.get('lengthSeconds')
+
+
+    @property
+    def live_now(self) -> bool:
+        """
+            Whether the video is a live stream that is running now.
+        """
+
+        return self.data.get('liveNow')
+
+
+
+class SearchChannel(BaseInvidiousData):
+    """
+        A channel in search results.
+    """
+
+    __slots__ = ()
+
+    @property
+    def type(self) -> str:
+        """
+            The type of the data. This should be always `"channel"`.
+        """
+
+        return self.data.get('type')
+
+
+    @property
+    def result_id(self) -> str:
+        """
+            The ID that identifies the result (the channel ID).
+        """
+
+        return self.author_id
+
+
+    @property
+    def author(self) -> str:
+        """
+            The name of the channel.
+        """
+
+        return self.data.get('author')
+
+
+    @property
+    def author_id(self) -> str:
+        """
+            The ID of the channel.
+        """
+
+        return self.data.get('authorId')
+
+
+    @property
+    def subscriber_count(self) -> int:
+        """
+            The number of subscribers.
+        """
+
+        return self.data.get('subCount')
+
+
+    @property
+    def video_count(self) -> int:
+        """
+            The number of videos.
+        """
+
+        return self.data.get('videoCount')
+
+
+    @property
+    def description(self) -> t.Text:
+        """
+            The description of the channel.
+        """
+
+        return self.data.get('description')
+
+
+
+class SearchPlaylist(BaseInvidiousData):
+    """
+        A playlist in search results.
+    """
+
+    __slots__ = ()
+
+    @property
+    def type(self) -> str:
+        """
+            The type of the data. This should be always `"playlist"`.
+        """
+
+        return self.data.get('type')
+
+
+    @property
+    def result_id(self) -> str:
+        """
+            The ID that identifies the result (the playlist ID).
+        """
+
+        return self.playlist_id
+
+
+    @property
+    def title(self) -> str:
+        """
+            The title of the playlist.
+        """
+
+        return self.data.get('title')
+
+
+    @property
+    def playlist_id(self) -> str:
+        """
+            The ID of the playlist.
+        """
+
+        return self.data.get('playlistId')
+
+
+    @property
+    def author(self) -> str:
+        """
+            The name of the channel that created the playlist.
+        """
+
+        return self.data.get('author')
+
+
+    @property
+    def author_id(self) -> str:
+        """
+            The ID of the channel that created the playlist.
+        """
+
+        return self.data.get('authorId')
+
+
+    @property
+    def video_count(self) -> int:
+        """
+            The number of videos in the playlist.
+        """
+
+        return self.data.get('videoCount')
+
+
+    @property
+    def video_ids(self) -> t.List[str]:
+        """
+            IDs of the first few videos of the playlist (the search results include only a preview).
+        """
+
+        return [video.get('videoId') for video in self.data.get('videos', [])]
+
+
+
+SearchResult = t.Union[SearchVideo, SearchChannel, SearchPlaylist, BaseInvidiousData]
+
+SEARCH_RESULT_CLASSES: t.Dict[str, t.Type[BaseInvidiousData]] = {'video': SearchVideo, 'channel': SearchChannel, 'playlist': SearchPlaylist}
+"""Models of search results, by their `type`. Results of other types (e. g. `"hashtag"`) are returned as `BaseInvidiousData`."""
+
+
+
+def search_result(data: t.Dict[str, t.Any]) -> SearchResult:
+    """
+        Returns the model of a search result, based on its `type`.
+    """
+
+    return SEARCH_RESULT_CLASSES.get(data.get('type'), BaseInvidiousData)(data)
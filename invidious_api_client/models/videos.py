@@ -9,6 +9,8 @@ class YoutubeVideo(BaseInvidiousData):
         A YouTube video.
     """
 
+    __slots__ = ()
+
     @property
     def type(self) -> str:
         """
@@ -51,6 +53,8 @@ class YoutubeVideo(BaseInvidiousData):
             Thumbnail data.
         """
 
+        __slots__ = ()
+
         @property
         def quality(self) -> str:
             """
@@ -105,7 +109,7 @@ class YoutubeVideo(BaseInvidiousData):
             A list of thumbnails for the video.
         """
 
-        return [self.Thumbnail(thumbnail) for thumbnail in self.data.get('videoThumbnails')]
+        return self._memoized('video_thumbnails', lambda: [self.Thumbnail(thumbnail) for thumbnail in self.data.get('videoThumbnails')])
 
 
 
@@ -117,6 +121,8 @@ class YoutubeVideo(BaseInvidiousData):
             timeline when you hover on the video at certain timestamp (YouTube only).
         """
 
+        __slots__ = ()
+
         @property
         def url(self) -> str:
             """
@@ -171,7 +177,7 @@ class YoutubeVideo(BaseInvidiousData):
             timeline when you hover on the video at certain timestamp (YouTube only).
         """
 
-        return [self.Storyboard(storyboard) for storyboard in self.data.get('storyboards')]
+        return self._memoized('storyboards', lambda: [self.Storyboard(storyboard) for storyboard in self.data.get('storyboards')])
 
 
 
@@ -0,0 +1,72 @@
+import typing as t
+
+import queue
+import threading
+
+
+
+_T = t.TypeVar('_T')
+
+_ITEM, _ERROR, _DONE = range(3)
+
+
+
+def prefetch(iterable: t.Iterable[_T], depth: int=1) -> t.Iterator[_T]:
+    """
+        Iterates over `iterable` in a background thread, staying up to `depth` items ahead of the consumer.
+
+        For pages, this means page N+1 is fetched while page N is being processed.
+        Exceptions are re-raised in the consumer. When the returned iterator is closed (or garbage collected),
+        the background thread stops after its current item.
+
+        If `depth` is `0`, `iterable` is iterated directly (in the current thread).
+    """
+
+    if depth <= 0:
+        yield from iterable
+        return
+
+
+    buffer: 'queue.Queue[t.Tuple[int, t.Any]]' = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(kind: int, value: t.Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put((kind, value), timeout=0.1)
+                return True
+
+            except queue.Full:
+                continue
+
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put(_ITEM, item):
+                    return
+
+        except BaseException as error:
+            _put(_ERROR, error)
+
+        else:
+            _put(_DONE, None)
+
+    thread = threading.Thread(target=_produce, name='invidious-prefetch', daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            kind, value = buffer.get()
+
+            if kind == _DONE:
+                return
+
+            if kind == _ERROR:
+                raise value
+
+            yield value
+
+    finally:
+        stop.set()
@@ -0,0 +1,267 @@
+import typing as t
+
+import random
+import threading
+import time
+
+import requests
+
+from .models.instances import Instance, PROBE_PATH, choose_instances
+from .exceptions import NoInstanceAvailableError
+
+
+
+FAILURE_STATUS_CODES = frozenset({403, 429, 500, 502, 503, 504})
+"""Status codes that count as a failure of the instance (not of the request itself)."""
+
+
+
+class InstanceState:
+    """
+        Health of a single instance in an `InstancePool`.
+    """
+
+    CLOSED = 'closed'
+    """The instance is healthy and receives requests."""
+
+    OPEN = 'open'
+    """The circuit breaker tripped - the instance receives no requests."""
+
+    HALF_OPEN = 'half-open'
+    """The breaker was open long enough - the instance receives a trial request."""
+
+
+    def __init__(self, url: str, initial_latency: float=1.0) -> None:
+        self.url = url
+        """The instance URL (without a trailing slash)."""
+
+        self.latency = initial_latency
+        """Exponentially weighted moving average of the latency (in seconds)."""
+
+        self.consecutive_failures = 0
+        """The number of failures since the last success."""
+
+        self.opened_at: t.Optional[float] = None
+        """When did the circuit breaker trip (`time.monotonic()`), or `None` if it is closed."""
+
+        self.requests = 0
+        """Total number of requests sent to the instance."""
+
+        self.failures = 0
+        """Total number of failed requests."""
+
+
+    def status(self, reset_timeout: float) -> str:
+        """
+            The circuit breaker status (`InstanceState.CLOSED`, `OPEN` or `HALF_OPEN`).
+        """
+
+        if self.opened_at is None:
+            return self.CLOSED
+
+        if time.monotonic() - self.opened_at >= reset_timeout:
+            return self.HALF_OPEN
+
+        return self.OPEN
+
+
+    def __repr__(self) -> str:
+        return f"<InstanceState {self.url} latency={self.latency:.3f}s failures={self.consecutive_failures}>"
+
+
+
+class InstancePool:
+    """
+        A pool of instances for `InvidiousClient` (pass it as `instance`).
+
+        Requests are spread across healthy instances, weighted by their observed latency (faster instances get more requests).
+        When an instance fails `failure_threshold` times in a row (connection errors, or `FAILURE_STATUS_CODES`),
+        its circuit breaker trips and it receives no requests. Failed requests are retried on another instance,
+        after a jittered exponential backoff.
+
+        Tripped instances are probed in a background thread every `probe_interval` seconds, and come back once they answer.
+        After `reset_timeout` seconds, a tripped instance also gets a single trial request.
+
+        ### Parameters:
+        - `instances` - the instances (objects or URLs) to use.
+        - `failure_threshold` - how many consecutive failures trip the circuit breaker.
+        - `reset_timeout` - after how many seconds does a tripped instance get a trial request.
+        - `probe_interval` - how often (in seconds) are tripped instances probed. If `None`, they are not probed.
+        - `max_attempts` - how many instances are tried for a single request.
+        - `backoff_base`, `backoff_max` - the backoff before the `n`-th retry is random, up to `min(backoff_max, backoff_base * 2 ** n)` seconds.
+        - `probe_timeout` - timeout of a single probe (in seconds).
+    """
+
+    def __init__(self, instances: t.Iterable[t.Union[Instance, str]], failure_threshold: int=3, reset_timeout: float=30.0, probe_interval: t.Optional[float]=15.0, max_attempts: int=3, backoff_base: float=0.2, backoff_max: float=2.0, probe_timeout: float=3.0) -> None:
+        self.states: t.Dict[str, InstanceState] = {}
+        """Health of the instances, by their URL."""
+
+        for instance in instances:
+            url = (instance.uri if hasattr(instance, 'uri') else instance).strip('/')
+            self.states[url] = InstanceState(url)
+
+        if not self.states:
+            raise ValueError("InstancePool needs at least one instance.")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe_interval = probe_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.probe_timeout = probe_timeout
+
+        self._lock = threading.Lock()
+        self._prober: t.Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+
+    @classmethod
+    def from_registry(cls, count: int=5, prefer_country_codes: t.Optional[t.Iterable[str]]=None, **pool_kwargs) -> 'InstancePool':
+        """
+            Creates a pool of the `count` fastest accessible instances (see `choose_instances`).
+        """
+
+        instances = choose_instances(count, prefer_country_codes=prefer_country_codes)
+
+        if not instances:
+            raise NoInstanceAvailableError("No accessible Invidious instance was found.")
+
+        return cls(instances, **pool_kwargs)
+
+
+    @property
+    def urls(self) -> t.List[str]:
+        """
+            URLs of all instances in the pool.
+        """
+
+        return list(self.states)
+
+
+    @property
+    def healthy_urls(self) -> t.List[str]:
+        """
+            URLs of instances whose circuit breaker is closed.
+        """
+
+        return [state.url for state in self.states.values() if state.status(self.reset_timeout) == InstanceState.CLOSED]
+
+
+    def pick(self, exclude: t.Container[str]=()) -> str:
+        """
+            Picks an instance URL for the next request.
+
+            Healthy instances are picked randomly, weighted by `1 / latency`. Instances in `exclude` (e. g. the ones that already
+            failed for this request) are avoided if possible. If every breaker is open, the instance that tripped first is used.
+        """
+
+        with self._lock:
+            states = [state for state in self.states.values() if state.url not in exclude] or list(self.states.values())
+            available = [state for state in states if state.status(self.reset_timeout) != InstanceState.OPEN]
+
+            if not available:
+                return min(states, key=lambda state: state.opened_at).url
+
+            # Half-open instances get a trial request as soon as possible:
+            for state in available:
+                if state.status(self.reset_timeout) == InstanceState.HALF_OPEN:
+                    state.opened_at = time.monotonic()
+                    return state.url
+
+            return random.choices(available, weights=[1 / max(state.latency, 0.001) for state in available])[0].url
+
+
+    def report_success(self, url: str, latency: float) -> None:
+        """
+            Records a successful request to the instance (closes its circuit breaker).
+        """
+
+        with self._lock:
+            state = self.states[url]
+
+            state.requests += 1
+            state.latency = 0.8 * state.latency + 0.2 * latency if state.requests > 1 else latency
+            state.consecutive_failures = 0
+            state.opened_at = None
+
+
+    def report_failure(self, url: str) -> None:
+        """
+            Records a failed request to the instance (and trips its circuit breaker, if it failed too many times in a row).
+        """
+
+        with self._lock:
+            state = self.states[url]
+
+            state.requests += 1
+            state.failures += 1
+            state.consecutive_failures += 1
+
+            if state.consecutive_failures >= self.failure_threshold:
+                state.opened_at = time.monotonic()
+
+        if state.opened_at is not None:
+            self._start_probing()
+
+
+    def is_failure(self, status_code: int) -> bool:
+        """
+            Whether the response status code means the instance failed (and the request should be retried on another one).
+        """
+
+        return status_code in FAILURE_STATUS_CODES
+
+
+    def backoff(self, attempt: int) -> float:
+        """
+            Returns the (jittered) delay before the `attempt`-th retry, in seconds.
+        """
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+    def _start_probing(self) -> None:
+        if self.probe_interval is None:
+            return
+
+        with self._lock:
+            if self._prober is not None and self._prober.is_alive():
+                return
+
+            self._stop.clear()
+            self._prober = threading.Thread(target=self._probe_loop, name='invidious-pool-prober', daemon=True)
+            self._prober.start()
+
+
+    def _probe_loop(self) -> None:
+        while not self._stop.wait(self.probe_interval):
+            tripped = [state.url for state in self.states.values() if state.opened_at is not None]
+
+            if not tripped:
+                # Everything recovered - the thread is started again on the next trip.
+                return
+
+            for url in tripped:
+                start = time.perf_counter()
+
+                try:
+                    ok = requests.head(f"{url}{PROBE_PATH}", timeout=self.probe_timeout).status_code == 200
+
+                except requests.RequestException:
+                    ok = False
+
+                if ok:
+                    self.report_success(url, time.perf_counter() - start)
+
+
+    def close(self) -> None:
+        """
+            Stops the background probing.
+        """
+
+        self._stop.set()
+
+
+    def __repr__(self) -> str:
+        return f"<InstancePool {len(self.healthy_urls)}/{len(self.states)} healthy>"
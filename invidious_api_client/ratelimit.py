@@ -0,0 +1,217 @@
+import typing as t
+
+import threading
+import time
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+
+class Quota(t.NamedTuple):
+    """
+        A fixed quota: `requests` per `period` seconds, all available again only when the period is over
+        (unlike a plain `(requests, period)` limit, which is refilled continuously).
+    """
+
+    requests: int
+    period: float
+
+
+Limit = t.Union[t.Tuple[int, float], Quota]
+"""A rate limit: `(requests, period in seconds)`, or a `Quota`."""
+
+
+DEFAULT_LIMITS: t.Dict[str, t.List[Limit]] = {
+    # https://github.com/Anarios/return-youtube-dislike#api-documentation
+    'returnyoutubedislikeapi.com': [(100, 60), Quota(10_000, 24 * 60 * 60)],
+}
+"""Rate limits of known hosts."""
+
+
+
+class TokenBucket:
+    """
+        A token bucket: allows bursts of up to `capacity` requests, refilled at `capacity / period` requests per second.
+    """
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self.capacity = capacity
+        self.period = period
+
+        self.tokens = float(capacity)
+        """The number of requests allowed right now."""
+
+        self._updated = time.monotonic()
+
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.capacity / self.period)
+        self._updated = now
+
+
+    def wait_time(self) -> float:
+        """
+            How long (in seconds) until a token is available.
+        """
+
+        self._refill()
+        return max(0.0, (1 - self.tokens) * self.period / self.capacity)
+
+
+    def consume(self) -> None:
+        self._refill()
+        self.tokens -= 1
+
+
+
+class FixedWindow(TokenBucket):
+    """
+        A fixed window: allows `capacity` requests, all of them available again `period` seconds after the window started.
+    """
+
+    def __init__(self, capacity: int, period: float) -> None:
+        super().__init__(capacity, period)
+        self._started = self._updated
+
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+
+        if now - self._started >= self.period:
+            self.tokens = float(self.capacity)
+            self._started = now
+
+        self._updated = now
+
+
+    def wait_time(self) -> float:
+        self._refill()
+        return 0.0 if self.tokens >= 1 else self._started + self.period - self._updated
+
+
+
+class RateLimiter:
+    """
+        Thread-safe rate limiter with token buckets per host, shared by all clients that use it.
+
+        `InvidiousClient` consults it before each request, and pauses the host when it responds with
+        `429 Too Many Requests` (for as long as its `Retry-After` header says).
+
+        ### Parameters:
+        - `limits` - rate limits by host, each host can have many (e. g. per minute and a daily `Quota`). Hosts without limits
+          are not limited (but they are still paused on `429`). Defaults to `DEFAULT_LIMITS`.
+        - `max_wait` - the longest time (in seconds) a request waits for its turn. If it would have to wait longer,
+          `RateLimitExceededError` is raised instead. If `None`, requests wait as long as needed.
+    """
+
+    def __init__(self, limits: t.Optional[t.Dict[str, t.Iterable[Limit]]]=None, max_wait: t.Optional[float]=5 * 60) -> None:
+        self.limits = {host: list(host_limits) for host, host_limits in (DEFAULT_LIMITS if limits is None else limits).items()}
+        self.max_wait = max_wait
+
+        self._buckets: t.Dict[str, t.List[TokenBucket]] = {}
+        self._paused_until: t.Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+
+    def _get_buckets(self, host: str) -> t.List[TokenBucket]:
+        buckets = self._buckets.get(host)
+
+        if buckets is None:
+            buckets = self._buckets[host] = [
+                FixedWindow(*limit) if isinstance(limit, Quota) else TokenBucket(*limit) for limit in self.limits.get(host, [])
+            ]
+
+        return buckets
+
+
+    def wait_time(self, host: str) -> float:
+        """
+            How long (in seconds) until a request to `host` is allowed.
+        """
+
+        with self._lock:
+            return self._wait_time(host)
+
+
+    def _wait_time(self, host: str) -> float:
+        paused = self._paused_until.get(host, 0.0) - time.monotonic()
+        return max([paused, 0.0, *(bucket.wait_time() for bucket in self._get_buckets(host))])
+
+
+    def acquire(self, host: str, max_wait: t.Optional[float]=None) -> bool:
+        """
+            Waits until a request to `host` is allowed, and counts it.
+
+            Returns `False` (without waiting) if the request would have to wait longer than `max_wait` seconds
+            (defaults to `RateLimiter.max_wait`).
+        """
+
+        max_wait = self.max_wait if max_wait is None else max_wait
+        deadline = time.monotonic() + max_wait if max_wait is not None else None
+
+        while True:
+            with self._lock:
+                wait = self._wait_time(host)
+
+                if wait <= 0:
+                    for bucket in self._get_buckets(host):
+                        bucket.consume()
+
+                    return True
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+
+            time.sleep(wait)
+
+
+    def pause(self, host: str, seconds: float) -> None:
+        """
+            Pauses requests to `host` for `seconds` (e. g. because of a `Retry-After` header).
+        """
+
+        with self._lock:
+            self._paused_until[host] = max(self._paused_until.get(host, 0.0), time.monotonic() + seconds)
+
+
+    def remaining(self, host: str) -> t.Optional[int]:
+        """
+            How many requests to `host` are allowed right now, by its strictest limit (`None` if it is not limited).
+        """
+
+        with self._lock:
+            buckets = self._get_buckets(host)
+
+            for bucket in buckets:
+                bucket._refill()
+
+            return int(min(bucket.tokens for bucket in buckets)) if buckets else None
+
+
+
+def parse_retry_after(value: t.Optional[str]) -> t.Optional[float]:
+    """
+        Parses the `Retry-After` header (seconds, or an HTTP date) to seconds.
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+
+    except (TypeError, ValueError):
+        return None
+
+
+
+DEFAULT_RATE_LIMITER = RateLimiter()
+"""The `RateLimiter` shared by all clients by default."""
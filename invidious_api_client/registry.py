@@ -0,0 +1,182 @@
+import typing as t
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+from pathlib import Path
+
+
+
+INSTANCES_URL = os.environ.get('INVIDIOUS_INSTANCES_URL', 'https://api.invidious.io/instances.json')
+"""URL of the Invidious instances registry (can be overridden with the `INVIDIOUS_INSTANCES_URL` environment variable)."""
+
+
+
+def default_cache_dir() -> Path:
+    """
+        The directory where this package caches data on disk.
+
+        `$XDG_CACHE_HOME/invidious_api_client` (or `~/.cache/invidious_api_client`).
+    """
+
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'invidious_api_client'
+
+
+
+class RegistryCache:
+    """
+        Disk-backed cache of the instances registry (`instances.json`).
+
+        The cached copy is used for `ttl` seconds. After that, it is revalidated with a conditional
+        request (`If-None-Match`/`If-Modified-Since`), so an unchanged registry is not downloaded again.
+        The cache file is shared by all processes that use the same `directory`.
+
+        If the registry can't be reached, the stale copy is used (if there is one).
+
+        ### Parameters:
+        - `directory` - where to store the cache files. Defaults to `default_cache_dir()`.
+        - `ttl` - for how long (in seconds) is the cached copy used without revalidation.
+        - `url` - URL of the registry.
+        - `timeout` - the default timeout (in seconds) of requests for the registry.
+    """
+
+    def __init__(self, directory: t.Optional[t.Union[str, Path]]=None, ttl: float=3600.0, url: str=INSTANCES_URL, timeout: float=10.0) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.ttl = ttl
+        self.timeout = timeout
+        self.url = url
+
+        self._memory: t.Dict[str, t.Dict[str, t.Any]] = {}
+        self._lock = threading.Lock()
+
+
+    def _key(self, url: str, params: t.Optional[t.Dict[str, t.Any]]) -> str:
+        raw = json.dumps([url, params or {}], sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"instances-{key}.json"
+
+
+    def _load(self, key: str) -> t.Optional[t.Dict[str, t.Any]]:
+        entry = self._memory.get(key)
+
+        try:
+            mtime = self._path(key).stat().st_mtime
+
+        except OSError:
+            return entry
+
+        # Another process may have refreshed the file since we've read it:
+        if entry is None or entry['mtime'] < mtime:
+            try:
+                with open(self._path(key), 'r', encoding='UTF-8') as file:
+                    entry = json.load(file)
+
+            except (OSError, ValueError):
+                return self._memory.get(key)
+
+            entry['mtime'] = mtime
+            self._memory[key] = entry
+
+        return entry
+
+
+    def _store(self, key: str, entry: t.Dict[str, t.Any]) -> None:
+        self._memory[key] = entry
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first, so other processes never read a partially written file:
+            with tempfile.NamedTemporaryFile('w', encoding='UTF-8', dir=self.directory, suffix='.tmp', delete=False) as file:
+                json.dump({key: value for key, value in entry.items() if key != 'mtime'}, file)
+
+            os.replace(file.name, self._path(key))
+            entry['mtime'] = self._path(key).stat().st_mtime
+
+        except OSError:
+            # Read-only/missing cache directory - keep the in-memory copy only.
+            entry['mtime'] = time.time()
+
+
+    def fetch(self, params: t.Optional[t.Dict[str, t.Any]]=None, url: t.Optional[str]=None, **requests_kwargs) -> t.Any:
+        """
+            Returns the registry JSON, from the cache if it is fresh, otherwise from `url` (by default, the cache's `url`).
+
+            `**requests_kwargs` are passed to `requests.get` (`timeout` defaults to the cache's `timeout`).
+        """
+
+        requests_kwargs.setdefault('timeout', self.timeout)
+        url = self.url if url is None else url
+        key = self._key(url, params)
+
+        with self._lock:
+            entry = self._load(key)
+
+            if entry is not None and time.time() - entry['fetched_at'] < self.ttl:
+                return entry['body']
+
+            headers = dict(requests_kwargs.pop('headers', None) or {})
+
+            if entry is not None:
+                if entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+
+                if entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+
+            try:
+                response = requests.get(url, params=params, headers=headers, **requests_kwargs)
+
+                if response.status_code == 304 and entry is not None:
+                    entry['fetched_at'] = time.time()
+                    self._store(key, entry)
+
+                    return entry['body']
+
+                response.raise_for_status()
+
+            except requests.RequestException:
+                if entry is not None:
+                    return entry['body']
+
+                raise
+
+            entry = {
+                'fetched_at': time.time(),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'body': response.json(),
+            }
+
+            self._store(key, entry)
+            return entry['body']
+
+
+    def clear(self) -> None:
+        """
+            Removes all cached copies (from memory and from disk).
+        """
+
+        with self._lock:
+            self._memory.clear()
+
+            for path in self.directory.glob('instances-*.json'):
+                try:
+                    path.unlink()
+
+                except OSError:
+                    pass
+
+
+
+DEFAULT_REGISTRY_CACHE = RegistryCache()
+"""The `RegistryCache` used by `get_instances` by default."""
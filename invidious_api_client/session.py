@@ -0,0 +1,55 @@
+import typing as t
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+
+DEFAULT_TIMEOUT: t.Tuple[float, float] = (3.05, 30.0)
+"""Default `(connect, read)` timeout (in seconds) of requests sent by `InvidiousClient`."""
+
+
+
+def accept_encoding() -> str:
+    """
+        The `Accept-Encoding` header for compressions that can be decoded here: `gzip` and `deflate` always,
+        `br` if `brotli` (or `brotlicffi`) is installed and `zstd` if `zstandard` is installed (with `urllib3` 2).
+        Install them with `pip install invidious-api-client[compression]`.
+    """
+
+    return ', '.join(encoding.strip() for encoding in ACCEPT_ENCODING.split(','))
+
+
+
+def make_session(pool_connections: int=10, pool_maxsize: int=64, max_retries: int=2, keep_alive: bool=True) -> Session:
+    """
+        Creates a `requests.Session` with connection pools sized for concurrent use.
+
+        `requests` keeps a pool of connections per host: `pool_connections` is how many hosts have a pool,
+        `pool_maxsize` is how many connections to one host are kept open (use at least as many as you have threads,
+        otherwise connections are opened and thrown away, and `urllib3` warns that "Connection pool is full").
+
+        ### Parameters:
+        - `pool_connections` - the number of hosts to keep connection pools for.
+        - `pool_maxsize` - the maximum number of connections kept open to a single host.
+        - `max_retries` - how many times are failed connections (and idempotent reads) retried. HTTP errors are not retried here,
+          `429 Too Many Requests` is handled by the client (see `RateLimiter`).
+        - `keep_alive` - whether to reuse connections (sends `Connection: close` otherwise).
+
+        Responses are requested compressed with every supported compression (see `accept_encoding`).
+    """
+
+    retry = Retry(total=max_retries, connect=max_retries, read=max_retries, status=0, backoff_factor=0.1, raise_on_status=False, respect_retry_after_header=False)
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    session = Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept-Encoding'] = accept_encoding()
+
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+
+    return session
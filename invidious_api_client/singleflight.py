@@ -0,0 +1,68 @@
+import typing as t
+
+import threading
+
+
+
+_T = t.TypeVar('_T')
+
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: t.Any = None
+        self.error: t.Optional[BaseException] = None
+
+
+
+class SingleFlight:
+    """
+        Coalesces identical concurrent calls: while a call with some key is running,
+        other calls with the same key wait for it and share its result (or exception), instead of running again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: t.Dict[t.Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+        self.coalesced = 0
+        """The number of calls that were served by another call's result."""
+
+
+    def do(self, key: t.Hashable, function: t.Callable[[], _T]) -> _T:
+        """
+            Calls `function`, unless a call with the same `key` is already running - then waits for its result.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+
+        except BaseException as error:
+            call.error = error
+            raise
+
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            call.done.set()
@@ -0,0 +1,224 @@
+import typing as t
+
+import codecs
+import json
+
+from requests import Response
+
+from .models.comments import Comments
+
+
+
+_WHITESPACE = ' \t\n\r'
+_DECODER = json.JSONDecoder()
+
+
+
+class _Scanner:
+    """
+        Decodes JSON values one by one from a stream of byte chunks.
+    """
+
+    def __init__(self, chunks: t.Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder('UTF-8')()
+
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+
+    def _fill(self) -> None:
+        if self.eof:
+            raise ValueError("Unexpected end of the JSON stream.")
+
+        # Drop what was already decoded, so the buffer holds about one value:
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+
+        try:
+            self.buffer += self._text.decode(next(self._chunks))
+
+        except StopIteration:
+            self.eof = True
+            self.buffer += self._text.decode(b'', final=True)
+
+
+    def peek(self) -> str:
+        """
+            Skips whitespace and returns the next character (without consuming it).
+        """
+
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            self._fill()
+
+
+    def expect(self, char: str) -> None:
+        """
+            Consumes `char` (after whitespace), or raises `ValueError`.
+        """
+
+        found = self.peek()
+
+        if found != char:
+            raise ValueError(f"Expected {char!r} in the JSON stream, found {found!r}.")
+
+        self.pos += 1
+
+
+    def value(self) -> t.Any:
+        """
+            Decodes the next JSON value, reading more chunks until it is complete.
+        """
+
+        self.peek()
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+
+            else:
+                # A number (or a literal) at the end of the buffer may continue in the next chunk:
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+
+            self._fill()
+
+
+
+def iter_members(chunks: t.Iterable[bytes], array_key: str) -> t.Iterator[t.Tuple[str, t.Any]]:
+    """
+        Incrementally parses a JSON object from a stream of byte chunks (e. g. `response.iter_content()`).
+
+        Yields `(key, value)` for its members, as soon as each of them is complete. The array under `array_key`
+        is not yielded as a whole: `(array_key, item)` is yielded for each of its items instead.
+
+        Raises `ValueError` if the stream is not valid JSON.
+    """
+
+    scanner = _Scanner(chunks)
+    scanner.expect('{')
+
+    if scanner.peek() == '}':
+        return
+
+    while True:
+        key = scanner.value()
+        scanner.expect(':')
+
+        if key == array_key and scanner.peek() == '[':
+            scanner.pos += 1
+
+            if scanner.peek() != ']':
+                while True:
+                    yield key, scanner.value()
+
+                    if scanner.peek() == ']':
+                        break
+
+                    scanner.expect(',')
+
+            scanner.pos += 1
+
+        else:
+            yield key, scanner.value()
+
+        if scanner.peek() == '}':
+            return
+
+        scanner.expect(',')
+
+
+
+class CommentStream:
+    """
+        A page of comments that is parsed while it is downloaded (see `InvidiousClient.stream_comments`).
+
+        Iterating over it yields `Comments.Comment` objects as soon as they arrive. It can be iterated only once,
+        and the response is closed at the end (or by `close()`, or when used as a context manager).
+
+        The other fields of the page (`continuation`, `comment_count`, `video_id`) are available once they are seen -
+        Invidious sends `continuation` after the comments, so it is certainly available after the last comment.
+    """
+
+    def __init__(self, response: Response, chunk_size: int=16384) -> None:
+        self.response = response
+        """The streamed response."""
+
+        self.data: t.Dict[str, t.Any] = {}
+        """The fields of the page seen so far (without the comments)."""
+
+        self.done = False
+        """Whether the whole page was parsed."""
+
+        self._members = iter_members(response.iter_content(chunk_size), 'comments')
+
+
+    def __iter__(self) -> t.Iterator[Comments.Comment]:
+        try:
+            for key, value in self._members:
+                if key == 'comments':
+                    yield Comments.Comment(value)
+
+                else:
+                    self.data[key] = value
+
+            self.done = True
+
+        finally:
+            self.close()
+
+
+    @property
+    def continuation(self) -> t.Optional[str]:
+        """
+            The continuation token of the next page, or `None` if it was not seen (yet, or there is no next page).
+        """
+
+        return self.data.get('continuation')
+
+
+    @property
+    def comment_count(self) -> t.Optional[int]:
+        """
+            The number of comments (if it was seen already).
+        """
+
+        return self.data.get('commentCount')
+
+
+    @property
+    def video_id(self) -> t.Optional[str]:
+        """
+            The video ID where are the comments from (if it was seen already).
+        """
+
+        return self.data.get('videoId')
+
+
+    def close(self) -> None:
+        """
+            Closes the response (the rest of the page is not downloaded).
+        """
+
+        self.response.close()
+
+
+    def __enter__(self) -> "CommentStream":
+        return self
+
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.close()
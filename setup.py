@@ -32,7 +32,7 @@ __doc__ = __readme__
 
 setuptools.setup(
     name = 'invidious-api-client',
-    packages = setuptools.find_packages(exclude=('tests',)),
+    packages = setuptools.find_packages(exclude=('tests', 'tests.*', 'benchmarks', 'benchmarks.*')),
 
     long_description=__readme__,
     long_description_content_type='text/markdown',
@@ -51,6 +51,12 @@ setuptools.setup(
         "requests"
     ],
 
+    extras_require={
+        "async": ["aiohttp"],
+        "parquet": ["pyarrow"],
+        "compression": ["brotli", "zstandard"],
+    },
+
     classifiers=[
         f'Development Status :: {__status__}',
         'Intended Audience :: Developers',
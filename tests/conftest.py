@@ -0,0 +1,75 @@
+import typing as t
+
+import io
+import threading
+import time
+
+import pytest
+
+from requests import Response
+
+
+
+_Reply = t.Union[t.Tuple[int, t.Union[str, bytes]], t.Tuple[int, t.Union[str, bytes], t.Dict[str, str]]]
+
+
+
+def echo_video(url: str, params: t.Dict[str, t.Any]) -> _Reply:
+    """
+        Answers `/videos/{id}` with `{"videoId": id}`, or with `404` for the ID `missing`.
+    """
+
+    id = url.rsplit('/', 1)[1]
+    return (404 if id == 'missing' else 200), f'{{"videoId": "{id}"}}'
+
+
+
+class FakeSession:
+    """
+        A stand-in for `requests.Session` (only `get`), answering with `respond(url, params)`,
+        which returns `(status, body)` or `(status, body, headers)`.
+
+        The requested URLs are recorded in `requested`, the other keyword arguments in `kwargs`, and the responses in `responses`.
+    """
+
+    def __init__(self, respond: t.Callable[[str, t.Dict[str, t.Any]], _Reply]=echo_video, delay: float=0.0) -> None:
+        self.respond = respond
+        self.delay = delay
+
+        self.requested: t.List[str] = []
+        self.kwargs: t.List[t.Dict[str, t.Any]] = []
+        self.responses: t.List[Response] = []
+        self._lock = threading.Lock()
+
+
+    def get(self, url: str, params: t.Optional[t.Dict[str, t.Any]]=None, **kwargs: t.Any) -> Response:
+        with self._lock:
+            self.requested.append(url)
+            self.kwargs.append(kwargs)
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        status, body, *headers = self.respond(url, params or {})
+
+        response = Response()
+        response.url = url
+        response.status_code = status
+        response.headers.update(headers[0] if headers else {})
+        response._content = body.encode() if isinstance(body, str) else body
+        response.raw = io.BytesIO(response._content)
+
+        with self._lock:
+            self.responses.append(response)
+
+        return response
+
+
+
+@pytest.fixture
+def fake_session() -> t.Type[FakeSession]:
+    """
+        The `FakeSession` class, to create sessions with: `fake_session(respond, delay=0.1)`.
+    """
+
+    return FakeSession
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from invidious_api_client import AsyncInvidiousClient
+
+
+
+async def _video(request: web.Request) -> web.Response:
+    await asyncio.sleep(0.05)
+    return web.json_response({'type': 'video', 'videoId': request.match_info['id']})
+
+
+async def _comments(request: web.Request) -> web.Response:
+    page = int(request.query.get('continuation', 0))
+    return web.json_response({'videoId': request.match_info['id'], 'comments': [{'commentId': str(page)}], 'continuation': str(page + 1) if page < 2 else None})
+
+
+
+def test_async_client():
+    async def run():
+        app = web.Application()
+        app.router.add_get('/api/v1/videos/{id}', _video)
+        app.router.add_get('/api/v1/comments/{id}', _comments)
+
+        async with TestServer(app) as server:
+            async with AsyncInvidiousClient(instance=str(server.make_url('/')), max_in_flight=50) as client:
+                ids = [f"video{index:06}" for index in range(200)]
+                videos = await asyncio.gather(*(client.get_video(id) for id in ids))
+                assert [video.video_id for video in videos] == ids
+
+                pages = [page async for page in client.yield_all_comments('video')]
+                assert [comment.comment_id for page in pages for comment in page] == ['0', '1', '2']
+
+    asyncio.run(run())
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
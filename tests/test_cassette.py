@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from invidious_api_client import InvidiousClient, CassetteMissError, recording_session, replay_session
+
+from benchmarks.server import StandInServer
+
+
+
+def test_record_and_replay(tmp_path):
+    cassette = tmp_path / 'traffic.cassette'
+
+    with StandInServer(latency=0.05, comment_pages=2, per_page=3) as server:
+        with recording_session(cassette) as session:
+            client = InvidiousClient(instance=server.url, session_object=session, rate_limiter=None)
+
+            recorded_title = client.get_video('dQw4w9WgXcQ').title
+            recorded_comments = [comment.comment_id for page in client.yield_all_comments('dQw4w9WgXcQ') for comment in page.comments]
+
+        url = server.url
+
+    # The server is gone, everything comes from the cassette:
+    client = InvidiousClient(instance=url, session_object=replay_session(cassette, time_scale=0.0), rate_limiter=None)
+
+    start = time.perf_counter()
+    assert client.get_video('dQw4w9WgXcQ').title == recorded_title
+    assert [comment.comment_id for page in client.yield_all_comments('dQw4w9WgXcQ') for comment in page.comments] == recorded_comments
+    assert time.perf_counter() - start < 0.05
+
+    with pytest.raises(CassetteMissError):
+        client.get_video('9bZkp7q19f0')
+
+    # The original timing:
+    client = InvidiousClient(instance='https://other.tld', session_object=replay_session(cassette, ignore_host=True), rate_limiter=None)
+
+    start = time.perf_counter()
+    assert client.get_video('dQw4w9WgXcQ').title == recorded_title
+    assert time.perf_counter() - start >= 0.05
+
+
+
+def test_replay_streamed(tmp_path):
+    cassette = tmp_path / 'traffic.cassette'
+
+    with StandInServer(latency=0.0, comment_pages=2, per_page=3) as server:
+        with recording_session(cassette) as session:
+            client = InvidiousClient(instance=server.url, session_object=session, rate_limiter=None)
+            recorded_comments = [comment.comment_id for comment in client.stream_all_comments('dQw4w9WgXcQ')]
+
+        url = server.url
+
+    client = InvidiousClient(instance=url, session_object=replay_session(cassette, time_scale=0.0), rate_limiter=None)
+
+    with client.stream_comments('dQw4w9WgXcQ', chunk_size=64) as page:
+        first_page = [comment.comment_id for comment in page]
+
+    assert len(recorded_comments) == 6 and first_page == recorded_comments[:3]
+    assert [comment.comment_id for comment in client.stream_all_comments('dQw4w9WgXcQ')] == recorded_comments
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
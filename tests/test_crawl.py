@@ -0,0 +1,56 @@
+import pytest
+
+from invidious_api_client import InvidiousClient, CommentCrawl
+from invidious_api_client.crawl import SeenSet
+
+
+
+def _flaky_pages(fail_on: int):
+    """Serves 5 pages of 3 comments (consecutive pages overlap by one comment), failing once on page `fail_on`."""
+
+    failed = []
+
+    def respond(url, params):
+        page = int(params.get('continuation', 0))
+
+        if page == fail_on and not failed:
+            failed.append(page)
+            return 503, b''
+
+        comments = ', '.join(f'{{"commentId": "c{index}"}}' for index in range(page * 2, page * 2 + 3))
+        return 200, f'{{"videoId": "abc", "comments": [{comments}]' + (f', "continuation": "{page + 1}"}}' if page < 4 else '}')
+
+    return respond
+
+
+
+def test_resume_after_failure(tmp_path, fake_session):
+    client = InvidiousClient(instance='https://example.tld', session_object=fake_session(_flaky_pages(fail_on=3)))
+    received = []
+
+    with pytest.raises(Exception):
+        for comment in CommentCrawl(client, 'abc', tmp_path / 'crawl.json', prefetch=0):
+            received.append(comment.comment_id)
+
+    crawl = CommentCrawl(client, 'abc', tmp_path / 'crawl.json', prefetch=0)
+    assert crawl.state['pages'] == 3 and not crawl.done
+
+    received += [comment.comment_id for comment in crawl]
+
+    assert received == [f"c{index}" for index in range(11)]
+    assert crawl.done and crawl.state['duplicates'] == 4
+    assert list(CommentCrawl(client, 'abc', tmp_path / 'crawl.json')) == []
+
+
+def test_seen_set():
+    seen = SeenSet()
+
+    assert all(seen.add(f"comment{index}") for index in range(5000))
+    assert not seen.add('comment1234')
+    assert 'comment4999' in seen and 'comment5000' not in seen
+    assert len(seen) == 5000
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,56 @@
+import time
+
+from invidious_api_client import InvidiousClient, RateLimiter, RYDCache
+from invidious_api_client.models import RYDData
+
+
+
+def _votes(url, params):
+    return 200, f'{{"id": "{url.split("videoId=")[1]}", "dateCreated": "2099-01-01T00:00:00.0000000Z", "dislikes": 1}}'
+
+
+
+def test_get_dislike_counts(tmp_path, fake_session):
+    cache = RYDCache(tmp_path / 'ryd.sqlite')
+    cache.set('fresh', RYDData({'id': 'fresh', 'dateCreated': '2099-01-01T00:00:00Z', 'dislikes': 5}))
+    cache.set('stale', RYDData({'id': 'stale', 'dateCreated': '2020-01-01T00:00:00Z', 'dislikes': 5}))
+    cache.set('staler', RYDData({'id': 'staler', 'dateCreated': '2019-01-01T00:00:00Z', 'dislikes': 5}))
+
+    session = fake_session(_votes)
+    client = InvidiousClient(instance='https://example.tld', session_object=session, rate_limiter=RateLimiter({'returnyoutubedislikeapi.com': [(3, 24 * 60 * 60)]}))
+
+    batch = client.get_dislike_counts(['fresh', 'stale', 'new1', 'staler', 'new2', 'fresh'], cache=cache, max_in_flight=1)
+
+    # Not cached first, then the stalest - until the budget of 3 requests runs out:
+    assert [url.split('videoId=')[1] for url in session.requested] == ['new1', 'new2', 'staler']
+    assert batch.skipped == ['stale']
+    assert batch.results['stale'].dislikes == 5 and batch.results['staler'].dislikes == 1
+    assert list(batch.results) != [] and batch.keys == ['fresh', 'stale', 'new1', 'staler', 'new2']
+    assert len(cache) == 5
+
+
+
+def test_daily_limit(fake_session):
+    limiter = RateLimiter()
+    host = 'returnyoutubedislikeapi.com'
+
+    # Use up the daily limit (all but 2 requests):
+    for _ in range(10_000 - 2):
+        limiter._get_buckets(host)[1].consume()
+
+    session = fake_session(_votes)
+    client = InvidiousClient(instance='https://example.tld', session_object=session, rate_limiter=limiter)
+
+    start = time.monotonic()
+    batch = client.get_dislike_counts(['a', 'b', 'c', 'd'], max_in_flight=2)
+
+    # The rest is skipped right away, instead of waiting for the limit to refill:
+    assert time.monotonic() - start < 1.0
+    assert len(batch.fetched) == 2 and sorted(batch.fetched + batch.skipped) == ['a', 'b', 'c', 'd']
+    assert limiter.remaining(host) == 0
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,75 @@
+import json
+import time
+
+from datetime import datetime, timezone
+
+import pytest
+
+from invidious_api_client.export import export_comments_ndjson, export_comments_parquet, COMMENT_COLUMNS
+from invidious_api_client.models.comments import Comments
+
+
+
+def _pages(count: int, per_page: int=3):
+    for page in range(count):
+        yield Comments({'videoId': 'abc', 'comments': [{'commentId': f"{page}-{index}", 'author': 'someone', 'likeCount': index, 'published': 1600000000, 'replies': {'replyCount': 2, 'replyContinuation': 'x'}} for index in range(per_page)]})
+
+
+
+@pytest.fixture
+def new_york_time(monkeypatch):
+    """
+        Switches the local time zone to UTC-4/-5, so that local times differ from UTC.
+    """
+
+    if not hasattr(time, 'tzset'):
+        pytest.skip("time zones can't be switched on this platform")
+
+    monkeypatch.setenv('TZ', 'America/New_York')
+    time.tzset()
+
+    yield
+
+    monkeypatch.undo()
+    time.tzset()
+
+
+
+def test_export_ndjson(tmp_path):
+    assert export_comments_ndjson(_pages(4), tmp_path / 'comments.ndjson') == 12
+
+    rows = [json.loads(line) for line in (tmp_path / 'comments.ndjson').read_text(encoding='UTF-8').splitlines()]
+    assert len(rows) == 12
+    assert set(rows[0]) == set(COMMENT_COLUMNS)
+    assert rows[5]['comment_id'] == '1-2' and rows[5]['video_id'] == 'abc' and rows[5]['reply_count'] == 2
+
+
+def test_export_parquet(tmp_path):
+    parquet = pytest.importorskip('pyarrow.parquet')
+
+    assert export_comments_parquet(_pages(4), tmp_path / 'comments.parquet', row_group_size=5) == 12
+
+    file = parquet.ParquetFile(tmp_path / 'comments.parquet')
+    assert file.metadata.num_rows == 12
+    assert file.metadata.num_row_groups == 3
+    assert file.read().column('like_count').to_pylist()[:3] == [0, 1, 2]
+
+
+def test_export_published_in_utc(tmp_path, new_york_time):
+    export_comments_ndjson(_pages(1), tmp_path / 'comments.ndjson')
+    row = json.loads((tmp_path / 'comments.ndjson').read_text(encoding='UTF-8').splitlines()[0])
+
+    assert datetime.fromisoformat(row['published']).timestamp() == 1600000000
+    assert row['published'] == '2020-09-13T12:26:40+00:00'
+
+    parquet = pytest.importorskip('pyarrow.parquet')
+    export_comments_parquet(_pages(1), tmp_path / 'comments.parquet')
+
+    published = parquet.read_table(tmp_path / 'comments.parquet').column('published')
+    assert published.to_pylist()[0] == datetime.fromtimestamp(1600000000, tz=timezone.utc)
+    assert published.type.tz == 'UTC'
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,23 @@
+import time
+
+from invidious_api_client import InvidiousClient
+
+
+
+def test_get_videos(fake_session):
+    client = InvidiousClient(instance='https://example.tld', session_object=fake_session(delay=0.1))
+    ids = [f"video{index}" for index in range(16)]
+
+    start = time.perf_counter()
+    batch = client.get_videos(ids + ['missing'] + ids, max_in_flight=17)
+    assert time.perf_counter() - start < 1.0
+
+    assert [video.video_id for video in batch] == ids
+    assert list(batch.errors) == ['missing']
+    assert not batch.ok
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,110 @@
+import threading
+import time
+
+from invidious_api_client import InvidiousClient, InstancePool, HedgingPolicy
+
+
+
+def _stall_on(slow_host: str, stall: float, status: int=200):
+    def respond(url, params):
+        if url.startswith(slow_host):
+            time.sleep(stall)
+            return status, '{"videoId": "dQw4w9WgXcQ"}'
+
+        return 200, '{"videoId": "dQw4w9WgXcQ"}'
+
+    return respond
+
+
+
+def _hedging_client(session):
+    pool = InstancePool(['https://slow.tld', 'https://fast.tld'], probe_interval=None, backoff_base=0)
+    policy = HedgingPolicy(percentile=0.5, budget=1.0, min_samples=5, min_delay=0.01)
+
+    for _ in range(5):
+        policy.record(0.01)
+
+    # Make sure the stalling instance is picked first:
+    pool.states['https://fast.tld'].latency = 1000.0
+
+    return InvidiousClient(instance=pool, session_object=session, hedging=policy), pool, policy
+
+
+
+def test_hedging_policy_budget():
+    policy = HedgingPolicy(percentile=0.5, budget=0.1, min_samples=10, min_delay=0.0)
+    assert policy.delay() is None
+
+    for latency in range(10):
+        policy.record(latency / 10)
+
+    assert policy.delay() == 0.5
+
+    # 10 % of 10 requests:
+    assert policy.try_fire()
+    assert not policy.try_fire()
+
+
+
+def test_hedged_request_wins(fake_session):
+    session = fake_session(_stall_on('https://slow.tld', 1.0))
+    client, pool, policy = _hedging_client(session)
+
+    start = time.perf_counter()
+    assert client.get_video('dQw4w9WgXcQ').video_id == 'dQw4w9WgXcQ'
+
+    # The hedge answered, without waiting for the stalled request:
+    assert time.perf_counter() - start < 0.5
+    assert policy.fired == policy.won == 1
+
+    # The stalled response lost, it is reported to the pool and closed when it completes:
+    while pool.states['https://slow.tld'].requests == 0 and time.perf_counter() - start < 3.0:
+        time.sleep(0.05)
+
+    slow = next(response for response in session.responses if response.url.startswith('https://slow.tld'))
+    assert slow.raw.closed
+    assert pool.states['https://slow.tld'].requests == pool.states['https://fast.tld'].requests == 1
+
+
+
+def test_hedge_fails(fake_session):
+    def respond(url, params):
+        if url.startswith('https://slow.tld'):
+            time.sleep(0.3)
+            return 200, '{"videoId": "dQw4w9WgXcQ"}'
+
+        return 503, '{}'
+
+    session = fake_session(respond)
+    client, pool, policy = _hedging_client(session)
+
+    # The failed hedge answered first, but the original request still has a chance:
+    assert client.get_video('dQw4w9WgXcQ').video_id == 'dQw4w9WgXcQ'
+    assert len(session.requested) == 2
+    assert policy.fired == 1 and policy.won == 0
+    assert pool.states['https://fast.tld'].failures == 1
+
+
+
+def test_hedging_does_not_cap_concurrency(fake_session):
+    session = fake_session(delay=0.2)
+    client, pool, policy = _hedging_client(session)
+    policy.budget = 0.0
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client.get_video, args=(f'video{i}',)) for i in range(100)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert time.perf_counter() - start < 1.0
+    assert len(session.requested) == 100 and policy.fired == 0
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+from invidious_api_client import InvidiousClient, LazyInstance
+
+from benchmarks.import_time import measure_import
+
+
+
+def test_import_makes_no_network_calls():
+    assert measure_import(runs=1)['network_calls'] == 0
+
+
+def test_aiohttp_is_imported_lazily():
+    pytest.importorskip('aiohttp')
+
+    code = "import sys, invidious_api_client; assert 'aiohttp' not in sys.modules; invidious_api_client.AsyncInvidiousClient; print('aiohttp' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip() == 'True'
+
+
+def test_client_is_lazy():
+    instance = LazyInstance()
+    client = InvidiousClient(instance=instance)
+
+    assert not instance.resolved
+    assert client.instance is instance
+
+
+
+if __name__ == "__main__":
+    test_import_makes_no_network_calls()
+    test_aiohttp_is_imported_lazily()
+    test_client_is_lazy()
@@ -0,0 +1,36 @@
+import pytest
+
+from invidious_api_client import json_decoders
+from invidious_api_client.json_decoders import get_decoder, decode_stdlib
+
+
+
+def test_unknown_decoder():
+    with pytest.raises(ValueError, match='simdjson'):
+        get_decoder('simdjson')
+
+
+def test_custom_decoder():
+    decoder = lambda content: {'decoded': content}
+    assert get_decoder(decoder) is decoder
+
+
+def test_auto_decoder(monkeypatch):
+    orjson = pytest.importorskip('orjson')
+    assert get_decoder('auto') is orjson.loads
+    assert get_decoder('auto')(b'{"videoId": "dQw4w9WgXcQ"}') == {'videoId': 'dQw4w9WgXcQ'}
+
+    # Without orjson (and msgspec), the standard library is used:
+    monkeypatch.delitem(json_decoders.DECODERS, 'orjson')
+    monkeypatch.delitem(json_decoders.DECODERS, 'msgspec', raising=False)
+
+    assert get_decoder('auto') is decode_stdlib
+    assert get_decoder('json')(b'{"videoId": "dQw4w9WgXcQ"}') == {'videoId': 'dQw4w9WgXcQ'}
+
+    with pytest.raises(ValueError):
+        get_decoder('orjson')
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
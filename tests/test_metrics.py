@@ -0,0 +1,37 @@
+from invidious_api_client import InvidiousClient, MetricsRegistry, RateLimiter
+
+
+
+def test_metrics_registry(fake_session):
+    def respond(url, params):
+        # The first request is rate limited:
+        if len(session.requested) == 1:
+            return 429, '{"videoId": "dQw4w9WgXcQ"}', {'Retry-After': '0'}
+
+        return 200, '{"videoId": "dQw4w9WgXcQ"}'
+
+    session = fake_session(respond)
+    metrics = MetricsRegistry()
+    client = InvidiousClient(instance='https://example.tld', session_object=session, rate_limiter=RateLimiter({}), metrics=metrics)
+
+    assert client.get_video('dQw4w9WgXcQ').video_id == 'dQw4w9WgXcQ'
+
+    assert metrics.counter('requests_total', host='example.tld', endpoint='videos/{id}', status='429') == 1
+    assert metrics.counter('requests_total', host='example.tld', endpoint='videos/{id}', status='200') == 1
+    assert metrics.counter('retries_total', host='example.tld', endpoint='videos/{id}', reason='rate_limited') == 1
+
+    assert metrics.histogram('request_duration_seconds', host='example.tld', endpoint='videos/{id}').count == 2
+    assert metrics.histogram('response_size_bytes', host='example.tld', endpoint='videos/{id}').sum == 2 * len(b'{"videoId": "dQw4w9WgXcQ"}')
+    assert metrics.histogram('decode_duration_seconds', host='example.tld', endpoint='videos/{id}').count == 1
+    assert metrics.histogram('model_duration_seconds', endpoint='videos/{id}', model='YoutubeVideo').count == 1
+
+    text = metrics.to_prometheus()
+    assert '# TYPE invidious_client_request_duration_seconds histogram' in text
+    assert 'invidious_client_requests_total{host="example.tld",endpoint="videos/{id}",status="200"} 1' in text
+    assert 'invidious_client_request_duration_seconds_bucket{host="example.tld",endpoint="videos/{id}",le="+Inf"} 2' in text
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
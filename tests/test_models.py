@@ -0,0 +1,81 @@
+import pytest
+
+from invidious_api_client import compact, FieldNotProjectedError
+from invidious_api_client.models.comments import Comments
+from invidious_api_client.models.projection import project
+
+
+
+def test_compact_comments():
+    comments = compact(Comments({'videoId': 'dQw4w9WgXcQ', 'continuation': 'abc', 'comments': [
+        {'author': 'someone', 'commentId': '1', 'published': 1600000000, 'authorThumbnails': [{'url': 'https://yt3.ggpht.com/a', 'width': 32, 'height': 32}]},
+        {'author': 'someone else', 'commentId': '2'},
+    ]}))
+
+    assert isinstance(comments, Comments)
+    assert comments.data is None
+    assert not hasattr(comments, '__dict__')
+
+    assert comments.continuation == 'abc'
+    assert [comment.author for comment in comments] == ['someone', 'someone else']
+    assert comments.comments[0].author_thumbnails[0].width == 32
+    assert comments.comments[0].published.year == 2020
+
+    # Missing values are `None` instead of raising:
+    assert comments.comments[1].published is None
+
+
+
+def test_comments_are_materialized_once():
+    comments = Comments({'comments': [{'author': 'someone'}, {'author': 'someone else'}], 'continuation': 'abc'})
+
+    assert comments.comments is comments.comments
+    assert len(comments) == 2
+    assert list(comments) == comments.comments
+
+    kept = comments.comments[0]
+    comments.release()
+
+    assert len(comments) == 0
+    assert comments.continuation == 'abc'
+    assert kept.author == 'someone'
+
+
+
+def test_projected_comments():
+    comments = Comments(project({'continuation': 'abc', 'comments': [{'author': 'someone', 'content': 'hello'}]}, ['continuation', 'comments(author)']))
+
+    assert comments.projected_fields == ['continuation', 'comments']
+    assert comments.comments[0].author == 'someone'
+
+    with pytest.raises(FieldNotProjectedError):
+        comments.video_id
+
+    with pytest.raises(FieldNotProjectedError):
+        comments.comments[0].content
+
+def test_projection_wraps_nested_values_once():
+    data = project({'videoId': 'abc', 'videoThumbnails': [{'url': 'a', 'width': 1}], 'unrequested': 1}, ['videoId', 'videoThumbnails(url)'])
+
+    assert data['videoThumbnails'] is data.get('videoThumbnails')
+    assert dict(data.items()).keys() == {'videoId', 'videoThumbnails'}
+    assert [thumbnail for _, thumbnails in data.items() if isinstance(thumbnails, list) for thumbnail in thumbnails][0].get('url') == 'a'
+
+    with pytest.raises(FieldNotProjectedError):
+        data['videoThumbnails'][0]['width']
+
+
+def test_release_keeps_projection():
+    comments = Comments(project({'continuation': 'abc', 'comments': [{'author': 'someone'}]}, ['continuation', 'comments(author)']))
+    comments.release()
+
+    assert len(comments) == 0
+    assert comments.continuation == 'abc'
+
+    with pytest.raises(FieldNotProjectedError):
+        comments.video_id
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,37 @@
+import pytest
+
+from requests import HTTPError
+
+from invidious_api_client import InvidiousClient, get_instances
+
+from benchmarks.server import StandInServer
+from benchmarks.bench_offline import run_benchmarks
+
+
+
+def test_stand_in_server():
+    with StandInServer(comment_pages=3, per_page=5) as server:
+        client = InvidiousClient(instance=server.url, ryd_url=server.url, rate_limiter=None)
+
+        assert client.get_video('dQw4w9WgXcQ').video_id == 'dQw4w9WgXcQ'
+        assert sum(len(page.comments) for page in client.yield_all_comments('dQw4w9WgXcQ')) == 15
+        assert client.get_dislike_count('dQw4w9WgXcQ').id == 'dQw4w9WgXcQ'
+        assert get_instances(cache=None, url=server.instances_url).instances[0].uri == server.url
+
+    with StandInServer(error_rate=1.0) as server:
+        with pytest.raises(HTTPError):
+            InvidiousClient(instance=server.url, rate_limiter=None).get_video('dQw4w9WgXcQ')
+
+
+
+def test_run_benchmarks():
+    results = run_benchmarks(requests=5, threads=2, comment_videos=1, comment_pages=2, parse_runs=2)
+
+    assert set(results) == {'get_video', 'comments', 'dislikes', 'search', 'instance_selection', 'parse'}
+    assert results['get_video']['errors'] == 0
+    assert all(metrics['ops_per_second'] > 0 for metrics in results.values())
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
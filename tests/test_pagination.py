@@ -0,0 +1,64 @@
+import time
+
+from invidious_api_client import InvidiousClient
+
+
+
+def _comment_pages(pages: int):
+    def respond(url, params):
+        page = int(params.get('continuation', 0))
+        return 200, f'{{"videoId": "abc", "comments": [{{"commentId": "{page}"}}]' + (f', "continuation": "{page + 1}"}}' if page + 1 < pages else '}')
+
+    return respond
+
+
+
+def _reply_threads(url, params):
+    continuation = params.get('continuation', '')
+
+    if continuation:
+        # Two pages of replies per thread: `<parent>` -> `<parent>-2`
+        parent = continuation.split('-')[0]
+        return 200, f'{{"comments": [{{"commentId": "{continuation}-reply"}}]' + (f', "continuation": "{parent}-2"}}' if '-' not in continuation else '}')
+
+    return 200, '{"videoId": "abc", "comments": [' + ', '.join(f'{{"commentId": "c{index}", "replies": {{"replyCount": 2, "replyContinuation": "c{index}"}}}}' for index in range(8)) + ', {"commentId": "no-replies"}]}'
+
+
+
+def test_all_pages_are_yielded(fake_session):
+    client = InvidiousClient(instance='https://example.tld', session_object=fake_session(_comment_pages(3), delay=0.1))
+    assert [comment.comment_id for comments in client.yield_all_comments('abc') for comment in comments] == ['0', '1', '2']
+
+
+def test_prefetch_overlaps_processing(fake_session):
+    client = InvidiousClient(instance='https://example.tld', session_object=fake_session(_comment_pages(5), delay=0.1))
+
+    start = time.perf_counter()
+    ids = []
+
+    for comment in client.iter_all_comments('abc', prefetch=1):
+        time.sleep(0.1) # processing takes as long as fetching
+        ids.append(comment.comment_id)
+
+    assert ids == ['0', '1', '2', '3', '4']
+    assert time.perf_counter() - start < 0.8 # serial would take ~1 s
+
+
+
+def test_expand_replies(fake_session):
+    client = InvidiousClient(instance='https://example.tld', session_object=fake_session(_reply_threads, delay=0.1))
+    page = client.get_comments('abc')
+
+    start = time.perf_counter()
+    replies = client.expand_replies(page, max_in_flight=8)
+    assert time.perf_counter() - start < 0.5 # 8 threads x 2 pages, serial would take ~1.6 s
+
+    assert replies.ok
+    assert list(replies.results) != [] and 'no-replies' not in replies.keys
+    assert [reply.comment_id for reply in replies['c3']] == ['c3-reply', 'c3-2-reply']
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,51 @@
+import time
+
+from invidious_api_client import InvidiousClient, InstancePool, RateLimiter
+
+
+
+def test_pool_failover(fake_session):
+    pool = InstancePool(['https://broken.tld/', 'https://working.tld'], failure_threshold=1, probe_interval=None, backoff_base=0)
+    session = fake_session(lambda url, params: (503 if url.startswith('https://broken.tld') else 200, '{"videoId": "dQw4w9WgXcQ"}'))
+    client = InvidiousClient(instance=pool, session_object=session)
+
+    # Make sure the broken instance is picked first:
+    pool.states['https://working.tld'].latency = 1000.0
+
+    for _ in range(10):
+        assert client.get_video('dQw4w9WgXcQ').video_id == 'dQw4w9WgXcQ'
+
+    # After the first failure, the breaker trips and the broken instance receives no more requests:
+    assert sum(url.startswith('https://broken.tld') for url in session.requested) == 1
+    assert pool.healthy_urls == ['https://working.tld']
+
+
+
+def test_pool_skips_paused_instance(fake_session):
+    pool = InstancePool(['https://limited.tld', 'https://working.tld'], failure_threshold=100, probe_interval=None, backoff_base=0)
+
+    def respond(url, params):
+        if url.startswith('https://limited.tld'):
+            return 429, '{}', {'Retry-After': '3'}
+
+        return 200, '{"videoId": "dQw4w9WgXcQ"}'
+
+    session = fake_session(respond)
+    client = InvidiousClient(instance=pool, session_object=session, rate_limiter=RateLimiter({}))
+
+    start = time.monotonic()
+
+    for _ in range(5):
+        # Make sure the rate limited instance is picked first:
+        pool.states['https://working.tld'].latency = 1000.0
+        assert client.get_video('dQw4w9WgXcQ').video_id == 'dQw4w9WgXcQ'
+
+    # The paused instance is skipped instead of waited for:
+    assert time.monotonic() - start < 1.0
+    assert sum(url.startswith('https://limited.tld') for url in session.requested) == 1
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
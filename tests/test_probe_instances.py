@@ -0,0 +1,63 @@
+import time
+
+from invidious_api_client.models import instances as instances_module
+from invidious_api_client.models.instances import Instance, probe_instances, choose_instance
+
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+
+def _instance(host: str) -> Instance:
+    return Instance([host, {'uri': f"https://{host}", 'type': 'https', 'region': 'DE'}])
+
+
+
+def test_probe_instances(monkeypatch):
+    delays = {'https://slow.tld': 5.0, 'https://fast.tld': 0.05, 'https://blocked.tld': 0.0, 'https://medium.tld': 0.2}
+
+    def fake_head(url, timeout):
+        host = url.split('/api/')[0]
+        time.sleep(min(delays[host], timeout))
+
+        if delays[host] > timeout:
+            raise instances_module.requests.Timeout()
+
+        return _FakeResponse(403 if 'blocked' in host else 200)
+
+    monkeypatch.setattr(instances_module.requests, 'head', fake_head)
+    candidates = [_instance(host.split('//')[1]) for host in delays]
+
+    start = time.perf_counter()
+    first = probe_instances(candidates, best_n=1, probe_timeout=1.0, deadline=2.0)
+    assert time.perf_counter() - start < 1.0
+    assert [probe.instance.uri for probe in first] == ['https://fast.tld']
+
+    ranked = probe_instances(candidates, best_n=None, probe_timeout=0.5, deadline=2.0)
+    assert [probe.instance.uri for probe in ranked] == ['https://fast.tld', 'https://medium.tld']
+
+def test_choose_instance_does_not_cache_failures(monkeypatch):
+    available = []
+    monkeypatch.setattr(instances_module, 'choose_instances', lambda *args, **kwargs: list(available))
+    choose_instance.cache_clear()
+
+    assert choose_instance(prefer_country_codes=['de']) is None
+
+    available.append(_instance('example.tld'))
+    assert choose_instance(prefer_country_codes=['DE']).uri == 'https://example.tld'
+
+    # Now it is cached:
+    available.clear()
+    assert choose_instance(prefer_country_codes=['DE']).uri == 'https://example.tld'
+
+    choose_instance.cache_clear()
+    assert choose_instance(prefer_country_codes=['DE']) is None
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,57 @@
+import time
+
+from invidious_api_client import InvidiousClient, RateLimiter, Quota
+from invidious_api_client.ratelimit import parse_retry_after
+
+
+
+def test_token_buckets():
+    limiter = RateLimiter({'example.tld': [(5, 1.0), (6, 60.0)]})
+
+    start = time.monotonic()
+
+    for _ in range(6):
+        assert limiter.acquire('example.tld')
+
+    # The 6th request waited for the per-second bucket, and the daily-like bucket is empty now:
+    assert 0.1 < time.monotonic() - start < 0.5
+    assert not limiter.acquire('example.tld', max_wait=1.0)
+    assert limiter.acquire('unlimited.tld', max_wait=0)
+
+
+def test_quota():
+    limiter = RateLimiter({'example.tld': [(100, 1.0), Quota(3, 0.5)]})
+
+    for _ in range(3):
+        assert limiter.acquire('example.tld', max_wait=0)
+
+    # Unlike a token bucket, the quota is not refilled before the window is over:
+    assert 0.4 < limiter.wait_time('example.tld') <= 0.5
+    assert not limiter.acquire('example.tld', max_wait=0.1)
+    assert limiter.acquire('example.tld', max_wait=1.0)
+    assert limiter.remaining('example.tld') == 2
+
+
+def test_retry_after(fake_session):
+    sent_at = []
+
+    def respond(url, params):
+        sent_at.append(time.monotonic())
+        return (429 if len(sent_at) == 1 else 200), '{"videoId": "abc"}', {'Retry-After': '0.2'}
+
+    session = fake_session(respond)
+    client = InvidiousClient(instance='https://example.tld', session_object=session, rate_limiter=RateLimiter({}))
+
+    assert client.get_video('abc').video_id == 'abc'
+    assert len(session.requested) == 2
+    assert sent_at[1] - sent_at[0] >= 0.2
+    assert session.responses[0].raw.closed
+
+    assert parse_retry_after('120') == 120
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
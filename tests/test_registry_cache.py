@@ -0,0 +1,49 @@
+from invidious_api_client import registry
+from invidious_api_client.registry import RegistryCache
+
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, body=None, headers=None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise registry.requests.HTTPError(str(self.status_code))
+
+
+
+def test_registry_cache(monkeypatch, tmp_path):
+    requests_sent = []
+
+    def fake_get(url, params=None, headers=None, timeout=None, **kwargs):
+        assert timeout == 10.0
+        requests_sent.append(headers)
+
+        if headers.get('If-None-Match') == '"v1"':
+            return _FakeResponse(304)
+
+        return _FakeResponse(200, [['example.tld', {'uri': 'https://example.tld'}]], {'ETag': '"v1"'})
+
+    monkeypatch.setattr(registry.requests, 'get', fake_get)
+
+    cache = RegistryCache(tmp_path, ttl=3600)
+    assert cache.fetch({'sort_by': 'health'})[0][0] == 'example.tld'
+    assert cache.fetch({'sort_by': 'health'})[0][0] == 'example.tld'
+    assert len(requests_sent) == 1
+
+    # Another process (a new cache object) reads the file, and revalidates it once it's expired:
+    other_process = RegistryCache(tmp_path, ttl=0)
+    assert other_process.fetch({'sort_by': 'health'})[0][0] == 'example.tld'
+    assert requests_sent[-1] == {'If-None-Match': '"v1"'}
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,32 @@
+import pytest
+
+from requests import HTTPError
+
+from invidious_api_client import InvidiousClient, ResponseCache
+
+
+
+def test_response_cache(tmp_path, fake_session):
+    session = fake_session()
+    client = InvidiousClient(instance='https://example.tld', session_object=session, cache=ResponseCache(maxsize=2, path=tmp_path / 'cache.sqlite'))
+
+    for _ in range(3):
+        assert client.get_video('a').video_id == 'a'
+
+        with pytest.raises(HTTPError) as error:
+            client.get_video('missing')
+
+        assert error.value.response.url == 'https://example.tld/api/v1/videos/missing'
+
+    assert session.requested == ['https://example.tld/api/v1/videos/a', 'https://example.tld/api/v1/videos/missing']
+
+    # Evicted from memory (maxsize=2), but still on disk:
+    client.get_video('b')
+    client.get_video('c')
+    assert client.get_video('a').video_id == 'a'
+    assert len(session.requested) == 4
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
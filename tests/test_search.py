@@ -0,0 +1,26 @@
+from invidious_api_client import InvidiousClient, SearchVideo, SearchChannel, SearchPlaylist
+
+from benchmarks.server import StandInServer
+
+
+
+def test_search():
+    with StandInServer(per_page=20, search_pages=3) as server:
+        client = InvidiousClient(instance=server.url, rate_limiter=None)
+        results = client.search('never gonna give you up', pages=10, max_in_flight=2)
+
+        # 3 pages of 20 results, 2 of them repeated on the next page:
+        assert len(results) == 56
+        assert len({(result.type, result.result_id) for result in results}) == 56
+        assert {type(result) for result in results} == {SearchVideo, SearchChannel, SearchPlaylist}
+
+        # Pages after the first empty one are not requested:
+        assert server.requests <= 5
+
+        assert [result.result_id for result in client.search('never gonna give you up', pages=range(2, 3))] == [result.result_id for result in results[18:38]]
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,30 @@
+from invidious_api_client import InvidiousClient, make_session, DEFAULT_TIMEOUT
+
+
+
+def test_clients_own_sessions():
+    first, second = InvidiousClient(instance='https://example.tld'), InvidiousClient(instance='https://example.tld', pool_maxsize=128)
+    assert first.session is not second.session
+
+    adapter = second.session.get_adapter('https://example.tld')
+    assert adapter._pool_maxsize == 128
+
+    with make_session(keep_alive=False) as session:
+        assert session.headers['Connection'] == 'close'
+
+
+
+def test_default_timeout(fake_session):
+    session = fake_session()
+    client = InvidiousClient(instance='https://example.tld', session_object=session, coalesce_requests=False)
+
+    client.get_video('dQw4w9WgXcQ')
+    client.get_video('dQw4w9WgXcQ', timeout=1)
+
+    assert [kwargs['timeout'] for kwargs in session.kwargs] == [DEFAULT_TIMEOUT, 1]
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,50 @@
+import threading
+import time
+
+from invidious_api_client import InvidiousClient
+from invidious_api_client.singleflight import SingleFlight
+
+
+
+def test_single_flight():
+    flight = SingleFlight()
+    calls = []
+    results = []
+
+    def slow_call():
+        calls.append(1)
+        time.sleep(0.2)
+        return {'videoId': 'dQw4w9WgXcQ'}
+
+    threads = [threading.Thread(target=lambda: results.append(flight.do('videos/dQw4w9WgXcQ', slow_call))) for _ in range(10)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert flight.coalesced == 9
+    assert all(result is results[0] for result in results)
+
+def test_different_arguments_are_not_coalesced(fake_session):
+    session = fake_session(lambda url, params: (200, '{"videoId": "dQw4w9WgXcQ"}'), delay=0.2)
+    client = InvidiousClient(instance='https://example.tld', session_object=session)
+
+    headers = [{'Accept-Language': 'en'}, {'Accept-Language': 'de'}, {'Accept-Language': 'en'}]
+    threads = [threading.Thread(target=client.get_video, args=('dQw4w9WgXcQ',), kwargs={'headers': header}) for header in headers]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert sorted(kwargs['headers']['Accept-Language'] for kwargs in session.kwargs) == ['de', 'en']
+
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__])
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from invidious_api_client import InvidiousClient
+from invidious_api_client.streaming import iter_members
+
+from benchmarks.server import StandInServer
+
+
+
+def test_iter_members_byte_by_byte():
+    document = {'commentCount': 12345, 'videoId': 'dQw4w9WgXcQ', 'comments': [{'content': 'žluťoučký kůň 🐴', 'likeCount': 10}, {'content': '', 'likeCount': 0.5}], 'continuation': 'abc', 'done': True}
+    raw = json.dumps(document, ensure_ascii=False, indent=1).encode()
+
+    # One byte at a time splits numbers and multi-byte characters:
+    members = list(iter_members((raw[index:index + 1] for index in range(len(raw))), 'comments'))
+
+    assert members == [('commentCount', 12345), ('videoId', 'dQw4w9WgXcQ'), ('comments', document['comments'][0]), ('comments', document['comments'][1]), ('continuation', 'abc'), ('done', True)]
+    assert list(iter_members([b'{"comments": []}'], 'comments')) == []
+
+    with pytest.raises(ValueError):
+        list(iter_members([b'{"comments": [{"content": '], 'comments'))
+
+
+
+def test_stream_comments():
+    with StandInServer(comment_pages=3, per_page=7, compress=True) as server:
+        client = InvidiousClient(instance=server.url, rate_limiter=None)
+        expected = [comment.comment_id for page in client.yield_all_comments('dQw4w9WgXcQ') for comment in page.comments]
+
+        with client.stream_comments('dQw4w9WgXcQ') as page:
+            first = [comment.comment_id for comment in page]
+
+        assert page.done and page.continuation == 'page1' and page.video_id == 'dQw4w9WgXcQ'
+        assert first == expected[:7]
+        assert [comment.comment_id for comment in client.stream_all_comments('dQw4w9WgXcQ')] == expected
+
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])